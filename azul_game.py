@@ -13,7 +13,7 @@ def print_game_state(game: AzulGame):
     print(f"Current Player: {game.current_player + 1}")
     print(f"{'='*50}")
 
-    if game.current_state.name == "factory_offer":
+    if game.current_state.id == "factory_offer":
         print("\nFACTORIES:")
         for i, factory in enumerate(game.factories):
             if len(factory) > 0:
@@ -58,7 +58,7 @@ def print_game_state(game: AzulGame):
 
 def simulate_turn(game: AzulGame):
     """Simulate a player turn with random decisions"""
-    if game.current_state.name != "Factory offer":
+    if game.current_state.id != "factory_offer":
         return
 
     player_num = game.current_player + 1
@@ -134,15 +134,15 @@ def run_game_simulation():
     turn_count = 0
     max_turns = 1000  # Safety limit
 
-    while not game.current_state.name == "game_ended" and turn_count < max_turns:
+    while not game.current_state.id == "game_ended" and turn_count < max_turns:
         print_game_state(game)
 
-        if game.current_state.name == "Factory offer":
+        if game.current_state.id == "factory_offer":
             simulate_turn(game)
-        elif game.current_state.name == "Wall tiling":
+        elif game.current_state.id == "wall_tiling":
             print("\nExecuting wall tiling phase...")
             game.complete_wall_tiling()
-        elif game.current_state.name == "Preparing next round":
+        elif game.current_state.id == "preparing_next_round":
             print("\nPreparing next round...")
             game.start_next_round()
 
@@ -161,10 +161,10 @@ def interactive_game():
     game = AzulGame(num_players=num_players)
     game.start_game()
 
-    while not game.current_state.name == "game_ended":
+    while not game.current_state.id == "game_ended":
         print_game_state(game)
 
-        if game.current_state.name == "factory_offer":
+        if game.current_state.id == "factory_offer":
             player_num = game.current_player + 1
             print(f"\nPlayer {player_num}'s Turn")
 
@@ -234,11 +234,11 @@ def interactive_game():
                 print(f"Invalid input: {e}")
                 continue
 
-        elif game.current_state.name == "wall_tiling":
+        elif game.current_state.id == "wall_tiling":
             input("\nPress Enter to continue to wall tiling phase...")
             game.complete_wall_tiling()
 
-        elif game.current_state.name == "preparing_next_round":
+        elif game.current_state.id == "preparing_next_round":
             input("\nPress Enter to prepare next round...")
             game.start_next_round()
 
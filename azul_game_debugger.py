@@ -2,127 +2,22 @@
 Azul Game Debugger - Enhanced version with detailed logging
 """
 
+from azul.game.debug import format_game_state
 from azul.game.state_machine import AzulGame
 import random
 
 
 def debug_game_state(game: AzulGame):
     """Print detailed game state for debugging"""
-    print(f"\n{'='*60}")
-    print(f"DEBUG: ROUND {game.round_number} - {game.current_state.name.upper()}")
-    print(f"Current Player: {game.current_player + 1}")
-    print(f"Starting Player: {game.starting_player + 1}")
-    print(f"First Player Token Taken: {game.first_player_token_taken}")
-    print(f"{'='*60}")
-
-    # Debug bag state
-    print(f"\nBAG STATE:")
-    print(f"  Tiles in bag: {len(game.bag) if game.bag else 0}")
-    print(f"  Tiles in discard: {len(game.discard_pile)}")
-
-    if game.current_state.name == "factory_offer":
-        print(f"\nFACTORIES STATE:")
-        total_factory_tiles = 0
-        for i, factory in enumerate(game.factories):
-            factory_tiles = (
-                len(factory._tiles) if hasattr(factory, "_tiles") else len(factory)
-            )
-            total_factory_tiles += factory_tiles
-            if factory_tiles > 0:
-                if hasattr(factory, "_tiles"):
-                    tiles_str = ", ".join(
-                        [f"{tile.type.name}" for tile in factory._tiles]
-                    )
-                else:
-                    # Handle different factory implementation
-                    tiles_str = ", ".join([f"{tile.type.name}" for tile in factory])
-                print(f"  Factory {i}: [{tiles_str}] ({factory_tiles} tiles)")
-            else:
-                print(f"  Factory {i}: [Empty]")
-
-        print(f"  Total tiles in factories: {total_factory_tiles}")
-
-        print(f"\nCENTER STATE:")
-        center_tiles = []
-        special_tiles = []
-        if hasattr(game.board_center, "_tiles"):
-            for tile in game.board_center._tiles:
-                if tile.type.name == "TILE_1":
-                    special_tiles.append(tile)
-                else:
-                    center_tiles.append(tile)
-
-        print(f"  Regular tiles: {len(center_tiles)}")
-        print(f"  Special tiles: {len(special_tiles)}")
-
-        if center_tiles:
-            tiles_str = ", ".join([f"{tile.type.name}" for tile in center_tiles])
-            print(f"  Center regular: [{tiles_str}]")
-        if special_tiles:
-            print(f"  Center special: [TILE_1 x{len(special_tiles)}]")
-
-        # Check if tiles are available
-        tiles_available = game.check_tiles_available()
-        print(f"  Tiles available for selection: {tiles_available}")
-
-    print(f"\nPLAYER BOARDS:")
-    for i, player in enumerate(game.players):
-        print(f"  Player {i+1} (Score: {player.score}):")
-
-        # Pattern lines
-        print("    Pattern Lines:")
-        for j, line in enumerate(player.pattern_lines):
-            line_length = len(line._tiles) if hasattr(line, "_tiles") else len(line)
-            if line_length > 0:
-                if hasattr(line, "_tiles"):
-                    tiles_str = ", ".join([f"{tile.type.name}" for tile in line._tiles])
-                else:
-                    tiles_str = ", ".join([f"{tile.type.name}" for tile in line])
-
-                # Check if complete
-                is_complete = line_length == (j + 1)
-                complete_str = " [COMPLETE]" if is_complete else ""
-                print(
-                    f"      Line {j+1} ({line_length}/{j+1}): [{tiles_str}]{complete_str}"
-                )
-            else:
-                print(f"      Line {j+1} ({line_length}/{j+1}): [Empty]")
-
-        # Wall state
-        print("    Wall:")
-        wall_tiles = 0
-        for row_idx, row in enumerate(player.wall.grid):
-            row_tiles = [tile.type.name if tile else "Empty" for tile in row]
-            wall_tiles += sum(1 for tile in row if tile is not None)
-            print(f"      Row {row_idx+1}: [{', '.join(row_tiles)}]")
-        print(f"    Total wall tiles: {wall_tiles}")
-
-        # Floor line
-        floor_length = (
-            len(player.floor_line._tiles)
-            if hasattr(player.floor_line, "_tiles")
-            else len(player.floor_line)
-        )
-        if floor_length > 0:
-            if hasattr(player.floor_line, "_tiles"):
-                floor_tiles = ", ".join(
-                    [f"{tile.type.name}" for tile in player.floor_line._tiles]
-                )
-            else:
-                floor_tiles = ", ".join(
-                    [f"{tile.type.name}" for tile in player.floor_line]
-                )
-            penalty = player.floor_line.calculate_penalty()
-            print(f"    Floor Line: [{floor_tiles}] (Penalty: {penalty})")
-        else:
-            print("    Floor Line: [Empty]")
+    print()
+    print(format_game_state(game))
 
 
 def debug_simulate_turn(game: AzulGame):
     """Simulate a player turn with detailed debugging"""
-    if game.current_state.name != "factory_offer":
+    if game.current_state.id != "factory_offer":
         print(
-            f"DEBUG: Not in factory_offer state, current state: {game.current_state.name}"
+            f"DEBUG: Not in factory_offer state, current state: {game.current_state.id}"
         )
         return
 
@@ -223,14 +118,17 @@ def debug_simulate_turn(game: AzulGame):
         print("DEBUG: Move executed successfully")
 
     except Exception as e:
+        # Re-raised so the flight recorder guard can dump the recent moves
         print(f"DEBUG: Error executing move: {e}")
-        import traceback
+        raise
 
-        traceback.print_exc()
 
+def run_debug_simulation(trace: bool = False):
+    """Run a game simulation with detailed debugging.
 
-def run_debug_simulation():
-    """Run a game simulation with detailed debugging"""
+    The full state is only printed every turn with ``trace``; otherwise the
+    game's flight recorder is dumped if anything fails.
+    """
     print("Starting Azul Game DEBUG Simulation")
     print("=" * 80)
 
@@ -240,37 +138,44 @@ def run_debug_simulation():
     # Start the game
     print("DEBUG: Starting game...")
     game.start_game()
-    print(f"DEBUG: Game started, initial state: {game.current_state.name}")
+    print(f"DEBUG: Game started, initial state: {game.current_state.id}")
 
-    turn_count = 0
     max_turns = 50  # Reduced for debugging
 
-    while not game.current_state.name == "game_ended" and turn_count < max_turns:
-        debug_game_state(game)
+    with game.recorder.guard():
+        turn_count = run_debug_turns(game, max_turns, trace)
+
+    debug_game_state(game)
+    print(f"\nDEBUG: Simulation ended after {turn_count} turns!")
+    print(f"DEBUG: Final state: {game.current_state.id}")
+
+    if turn_count >= max_turns:
+        print("DEBUG: Simulation stopped due to max turns limit")
+
+
+def run_debug_turns(game: AzulGame, max_turns: int, trace: bool) -> int:
+    turn_count = 0
+    while not game.current_state.id == "game_ended" and turn_count < max_turns:
+        if trace:
+            debug_game_state(game)
 
-        if game.current_state.name == "factory_offer":
+        if game.current_state.id == "factory_offer":
             debug_simulate_turn(game)
-        elif game.current_state.name == "wall_tiling":
+        elif game.current_state.id == "wall_tiling":
             print("\nDEBUG: Executing wall tiling phase...")
             game.complete_wall_tiling()
-            print(f"DEBUG: After wall tiling, state: {game.current_state.name}")
-        elif game.current_state.name == "preparing_next_round":
+            print(f"DEBUG: After wall tiling, state: {game.current_state.id}")
+        elif game.current_state.id == "preparing_next_round":
             print("\nDEBUG: Preparing next round...")
             game.start_next_round()
-            print(
-                f"DEBUG: After preparing next round, state: {game.current_state.name}"
-            )
+            print(f"DEBUG: After preparing next round, state: {game.current_state.id}")
 
         turn_count += 1
         print(f"\nDEBUG: Completed turn {turn_count}")
-
-    debug_game_state(game)
-    print(f"\nDEBUG: Simulation ended after {turn_count} turns!")
-    print(f"DEBUG: Final state: {game.current_state.name}")
-
-    if turn_count >= max_turns:
-        print("DEBUG: Simulation stopped due to max turns limit")
+    return turn_count
 
 
 if __name__ == "__main__":
-    run_debug_simulation()
+    import sys
+
+    run_debug_simulation(trace="--trace" in sys.argv)
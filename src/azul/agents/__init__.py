@@ -0,0 +1,10 @@
+from .base import BatchedAgent, PositionAgent, RandomAgent
+from .coordinator import BatchedCoordinator, GameResult
+from .heuristic import GreedyAgent, HeuristicEvaluator, OnePlyAgent
+from .registry import (
+    AGENT_FACTORIES,
+    EXTERNAL_PREFIX,
+    agent_name,
+    is_agent_name,
+    make_agent,
+)
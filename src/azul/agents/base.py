@@ -0,0 +1,33 @@
+from typing import Protocol
+import numpy as np
+from azul.game.state_machine import AzulGame
+
+
+class BatchedAgent(Protocol):
+    """An agent that decides for many positions in a single call"""
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """Return one action index per row of ``obs`` (batch, obs_size).
+
+        ``mask`` (batch, n_actions) flags the legal actions of each row.
+        """
+        ...
+
+
+class PositionAgent(Protocol):
+    """An agent that needs the full game rather than its observation"""
+
+    def act_positions(self, games: list[AzulGame]) -> list[int]:
+        """Return one action index per game, for its current player"""
+        ...
+
+
+class RandomAgent:
+    """Uniformly random legal moves, drawn for the whole batch at once"""
+
+    def __init__(self, seed: int | None = None):
+        self.rng = np.random.default_rng(seed)
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        noise = self.rng.random(mask.shape)
+        return np.argmax(np.where(mask, noise, -1.0), axis=1)
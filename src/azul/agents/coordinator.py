@@ -0,0 +1,135 @@
+from typing import Iterator, NamedTuple, Sequence
+import numpy as np
+from azul.encoding import IncrementalEncoder
+from azul.game.actions import advance, apply_action, index_to_action, is_game_over
+from azul.game.state_machine import AzulGame
+from .base import BatchedAgent, PositionAgent
+
+
+class GameResult(NamedTuple):
+    seed: int
+    scores: list[int]
+    rounds: int
+    n_moves: int
+    actions: list[int] | None = None  # action indices, when recorded
+
+
+class BatchedCoordinator:
+    """Play many games side by side, batching decisions per agent.
+
+    Each step collects every game waiting on a decision, groups them by the
+    agent in the seat to move, and hands each agent one observation/mask
+    batch. The chosen actions are scattered back to their games; finished
+    games are replaced by fresh ones until ``n_games`` have been played.
+    Agents with an ``act_positions`` method get the games themselves.
+    With ``record_actions`` each result carries the game's action indices,
+    which replay it from its seed.
+    """
+
+    def __init__(
+        self,
+        agents: Sequence[BatchedAgent | PositionAgent],
+        num_players: int = 2,
+        n_concurrent: int = 256,
+        seed: int = 0,
+        check_rate: float | None = None,
+        record_actions: bool = False,
+    ):
+        if len(agents) != num_players:
+            raise ValueError(
+                f"Need one agent per seat, got {len(agents)} for {num_players} players"
+            )
+        self.agents = list(agents)
+        self.num_players = num_players
+        self.n_concurrent = n_concurrent
+        self.seed = seed
+        self.check_rate = check_rate
+        self.record_actions = record_actions
+        self.encoder = IncrementalEncoder(num_players)
+
+        # Seats sharing an agent instance are served by one call
+        self._groups = {}
+        for seat, agent in enumerate(self.agents):
+            first = next(i for i, a in enumerate(self.agents) if a is agent)
+            self._groups.setdefault(first, []).append(seat)
+
+        self._obs = np.zeros((n_concurrent, self.encoder.size), dtype=np.float32)
+        self._mask = np.zeros((n_concurrent, self.encoder.n_actions), dtype=np.bool_)
+
+    def new_game(self, seed: int) -> AzulGame:
+        game = AzulGame(
+            num_players=self.num_players,
+            seed=seed,
+            verbose=False,
+            check_rate=self.check_rate,
+        )
+        advance(game)
+        return game
+
+    def play(self, n_games: int) -> list[GameResult]:
+        """Play ``n_games`` games with seeds ``seed, seed + 1, ...``"""
+        return [result for _, result in self.iter_games(n_games)]
+
+    def iter_games(self, n_games: int) -> Iterator[tuple[AzulGame, GameResult]]:
+        """Like ``play``, but yield each finished game without keeping it"""
+        n_finished = 0
+        next_seed = self.seed
+        games: list[AzulGame | None] = []
+        seeds: list[int] = []
+        moves: list[int] = []
+        histories: list[list[int]] = []
+        while len(games) < min(self.n_concurrent, n_games):
+            games.append(self.new_game(next_seed))
+            seeds.append(next_seed)
+            moves.append(0)
+            histories.append([])
+            next_seed += 1
+
+        while n_finished < n_games:
+            for first, seats in self._groups.items():
+                slots = [
+                    i
+                    for i, game in enumerate(games)
+                    if game is not None and game.current_player in seats
+                ]
+                if not slots:
+                    continue
+                obs, mask = self._obs[: len(slots)], self._mask[: len(slots)]
+                agent = self.agents[first]
+                for row, slot in enumerate(slots):
+                    self.encoder.action_mask(games[slot], mask[row])
+                if hasattr(agent, "act_positions"):
+                    actions = agent.act_positions([games[slot] for slot in slots])
+                else:
+                    for row, slot in enumerate(slots):
+                        self.encoder.encode(games[slot], obs[row])
+                    actions = agent.act(obs, mask)
+
+                for row, slot in enumerate(slots):
+                    index = int(actions[row])
+                    if not mask[row, index]:
+                        raise ValueError(f"Agent chose illegal action index {index}")
+                    game = games[slot]
+                    apply_action(game, index_to_action(index))
+                    advance(game)
+                    moves[slot] += 1
+                    if self.record_actions:
+                        histories[slot].append(index)
+                    if not is_game_over(game):
+                        continue
+
+                    n_finished += 1
+                    yield game, GameResult(
+                        seeds[slot],
+                        [p.score for p in game.players],
+                        game.round_number,
+                        moves[slot],
+                        histories[slot] if self.record_actions else None,
+                    )
+                    if next_seed - self.seed < n_games:
+                        games[slot] = self.new_game(next_seed)
+                        seeds[slot], moves[slot] = next_seed, 0
+                        histories[slot] = []
+                        next_seed += 1
+                    else:
+                        games[slot] = None
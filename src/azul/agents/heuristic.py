@@ -0,0 +1,175 @@
+import numpy as np
+from azul.encoding.observation import (
+    CENTER_SIZE,
+    FACTORY_SIZE,
+    LINE_SIZE,
+    N_COLORS,
+    PLAYER_SIZE,
+)
+from azul.game.actions import MAX_FACTORIES, N_LINES
+from azul.scoring import FLOOR_PENALTY, WALL_COLUMN, placement_points
+
+N_SOURCES = MAX_FACTORIES + 1
+LINE_CAPACITY = np.arange(1, 6)
+
+
+class MoveFeatures:
+    """Per-action quantities for a batch of observations.
+
+    Every array is shaped (batch, source, color, line) and follows the action
+    index layout, so ``array.reshape(batch, -1)`` lines up with the mask.
+    """
+
+    def __init__(self, obs: np.ndarray):
+        batch = len(obs)
+        factories = obs[:, :FACTORY_SIZE].reshape(batch, MAX_FACTORIES, N_COLORS)
+        center = obs[:, FACTORY_SIZE : FACTORY_SIZE + N_COLORS]
+        token = obs[:, FACTORY_SIZE + N_COLORS]
+
+        offset = FACTORY_SIZE + CENTER_SIZE
+        lines = obs[:, offset : offset + 5 * LINE_SIZE].reshape(batch, 5, LINE_SIZE)
+        line_counts = lines[..., N_COLORS].astype(np.int64)
+        offset += 5 * LINE_SIZE
+        walls = obs[:, offset : offset + 25].reshape(batch, 5, 5) > 0
+        floor = obs[:, offset + 25].astype(np.int64)
+
+        taken = np.concatenate([center[:, None], factories], axis=1).astype(np.int64)
+        taken = taken[..., None]
+
+        # The floor line is the last line slot and holds no pattern tiles
+        space = np.zeros((batch, 1, 1, N_LINES), dtype=np.int64)
+        space[..., :5] = (LINE_CAPACITY - line_counts)[:, None, None, :]
+        self.placed = np.minimum(taken, space)
+        self.overflow = taken - self.placed
+
+        floor_tiles = np.zeros((batch, N_SOURCES, 1, 1), dtype=np.int64)
+        floor_tiles[:, 0] = token[:, None, None]
+        floor_tiles = floor[:, None, None, None] + floor_tiles + self.overflow
+        self.floor_cost = (
+            np.take(FLOOR_PENALTY, np.minimum(floor_tiles, 7))
+            - np.take(FLOOR_PENALTY, np.minimum(floor, 7))[:, None, None, None]
+        )
+
+        capacity = np.zeros(N_LINES, dtype=np.int64)
+        capacity[:5] = LINE_CAPACITY
+        self.filled = np.zeros_like(self.placed)
+        self.filled[..., :5] = line_counts[:, None, None, :] + self.placed[..., :5]
+        self.fill_fraction = self.filled / np.maximum(capacity, 1)
+        self.complete = (self.filled == capacity) & (capacity > 0)
+
+        # points[b, row, color] of the wall cell a completed row would fill
+        cell_points = placement_points(walls)
+        points = cell_points[:, np.arange(5)[:, None], WALL_COLUMN]
+        self.points = np.zeros_like(self.placed)
+        self.points[..., :5] = points.transpose(0, 2, 1)[:, None]
+
+
+def _choose(scores: np.ndarray, mask: np.ndarray, rng: np.random.Generator):
+    scores = scores.reshape(len(mask), -1).astype(np.float64)
+    # Random tie-breaking so equal moves do not always favor low indices
+    scores = scores + rng.random(scores.shape) * 1e-3
+    return np.argmax(np.where(mask, scores, -np.inf), axis=1)
+
+
+class GreedyAgent:
+    """Place as many tiles on pattern lines as possible, minus floor penalty"""
+
+    def __init__(self, seed: int | None = None):
+        self.rng = np.random.default_rng(seed)
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        features = MoveFeatures(obs)
+        return _choose(features.placed + features.floor_cost, mask, self.rng)
+
+
+class OnePlyAgent:
+    """Score the position right after each move.
+
+    Completed pattern lines are worth the wall points they will score,
+    partial lines that share in proportion to how full they are, and tiles
+    falling to the floor cost their ``Floorline`` penalty.
+    """
+
+    def __init__(self, partial_weight: float = 0.5, seed: int | None = None):
+        self.partial_weight = partial_weight
+        self.rng = np.random.default_rng(seed)
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        features = MoveFeatures(obs)
+        expected = np.where(
+            features.complete,
+            features.points,
+            self.partial_weight * features.points * features.fill_fraction,
+        )
+        return _choose(expected + features.floor_cost, mask, self.rng)
+
+
+class HeuristicEvaluator:
+    """Value and policy estimates for a batch of observations, for search.
+
+    Values are per seat (mover first, like the observation) and squash each
+    seat's projected score minus the best opponent's through ``tanh``.
+    The policy is a softmax over ``OnePlyAgent``'s move scores.
+    """
+
+    def __init__(
+        self,
+        num_players: int = 2,
+        partial_weight: float = 0.5,
+        value_scale: float = 10.0,
+        temperature: float = 2.0,
+    ):
+        self.num_players = num_players
+        self.partial_weight = partial_weight
+        self.value_scale = value_scale
+        self.temperature = temperature
+
+    def projected_scores(self, obs: np.ndarray) -> np.ndarray:
+        """(batch, seat) score after the coming wall tiling, partial lines
+        counted in part"""
+        batch = len(obs)
+        offset = FACTORY_SIZE + CENTER_SIZE
+        size = self.num_players * PLAYER_SIZE
+        seats = obs[:, offset : offset + size].reshape(batch, self.num_players, -1)
+        lines = seats[..., : 5 * LINE_SIZE].reshape(batch, self.num_players, 5, -1)
+        colors = lines[..., :N_COLORS].argmax(axis=-1)
+        counts = lines[..., N_COLORS]
+        walls = seats[..., 5 * LINE_SIZE : 5 * LINE_SIZE + 25] > 0
+        floor = seats[..., 5 * LINE_SIZE + 25].astype(np.int64)
+        score = seats[..., 5 * LINE_SIZE + 27]
+
+        points = placement_points(walls.reshape(batch, self.num_players, 5, 5))
+        columns = WALL_COLUMN[np.arange(5), colors]
+        line_points = np.take_along_axis(points, columns[..., None], axis=-1)[..., 0]
+        fill = counts / LINE_CAPACITY
+        expected = np.where(
+            fill == 1, line_points, self.partial_weight * line_points * fill
+        )
+        penalty = np.take(FLOOR_PENALTY, np.minimum(floor, 7))
+        return score + penalty + expected.sum(axis=-1)
+
+    def __call__(
+        self, obs: np.ndarray, mask: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        projected = self.projected_scores(obs)
+        others = np.stack(
+            [
+                np.delete(projected, seat, axis=1).max(axis=1)
+                for seat in range(self.num_players)
+            ],
+            axis=1,
+        )
+        values = np.tanh((projected - others) / self.value_scale)
+
+        features = MoveFeatures(obs)
+        scores = np.where(
+            features.complete,
+            features.points,
+            self.partial_weight * features.points * features.fill_fraction,
+        )
+        logits = (scores + features.floor_cost).reshape(len(obs), -1)
+        logits = np.where(mask, logits / self.temperature, -np.inf)
+        logits -= logits.max(axis=1, keepdims=True)
+        priors = np.exp(logits)
+        priors /= priors.sum(axis=1, keepdims=True)
+        return values, priors
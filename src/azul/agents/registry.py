@@ -0,0 +1,52 @@
+import argparse
+import shlex
+from typing import Callable
+from azul.engine import ExternalAgent
+from .base import BatchedAgent, PositionAgent, RandomAgent
+from .heuristic import GreedyAgent, OnePlyAgent
+
+
+# Search agents build on the heuristics in this package, so they are
+# imported when first requested rather than at import time
+def _expectimax(seed: int | None) -> PositionAgent:
+    from azul.search import ExpectimaxAgent
+
+    return ExpectimaxAgent(time_budget=0.05, seed=seed or 0)
+
+
+def _mcts(seed: int | None) -> PositionAgent:
+    from azul.search import MCTSAgent
+
+    return MCTSAgent(n_simulations=64, batch_size=16, seed=seed)
+
+
+AGENT_FACTORIES: dict[str, Callable[[int | None], BatchedAgent | PositionAgent]] = {
+    "random": lambda seed: RandomAgent(seed),
+    "greedy": lambda seed: GreedyAgent(seed=seed),
+    "oneply": lambda seed: OnePlyAgent(seed=seed),
+    "expectimax": _expectimax,
+    "mcts": _mcts,
+}
+EXTERNAL_PREFIX = "cmd:"  # "cmd:<command line>" runs an engine process
+
+
+def is_agent_name(name: str) -> bool:
+    return name in AGENT_FACTORIES or name.startswith(EXTERNAL_PREFIX)
+
+
+def agent_name(name: str) -> str:
+    """``argparse`` type for options naming an agent"""
+    if is_agent_name(name):
+        return name
+    raise argparse.ArgumentTypeError(f"unknown agent {name!r}")
+
+
+def make_agent(name: str, seed: int | None = None) -> BatchedAgent | PositionAgent:
+    """Build a built-in agent by name, or an external engine from its command"""
+    if name.startswith(EXTERNAL_PREFIX):
+        return ExternalAgent(shlex.split(name[len(EXTERNAL_PREFIX) :]))
+    if name not in AGENT_FACTORIES:
+        raise ValueError(
+            f"Unknown agent {name!r}, choose from {', '.join(AGENT_FACTORIES)}"
+        )
+    return AGENT_FACTORIES[name](seed)
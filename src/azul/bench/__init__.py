@@ -0,0 +1,2 @@
+from .allocations import AllocationReport, profile_allocations
+from .memory import game_footprints, measure_footprint
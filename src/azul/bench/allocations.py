@@ -0,0 +1,151 @@
+import random
+import tracemalloc
+from contextlib import contextmanager
+from typing import NamedTuple
+from azul.board_components import Bag, Floorline, StagingLine
+from azul.game.actions import advance, apply_action, is_game_over, legal_actions
+from azul.game.state_machine import AzulGame
+
+# (owner, method) pairs charged separately in the report
+HOT_FUNCTIONS = [
+    (AzulGame, "take_tiles_from_factory"),
+    (AzulGame, "take_tiles_from_center"),
+    (Floorline, "add_tiles"),
+    (StagingLine, "add_partially"),
+    (Bag, "pop_random"),
+]
+
+
+class FunctionAllocations(NamedTuple):
+    calls: int
+    peak_per_call: float  # traced bytes above the level at entry, high-water
+    retained_per_call: float  # traced bytes still allocated on return
+
+
+class AllocationReport(NamedTuple):
+    games: int
+    moves: int
+    peak_per_move: float
+    retained_per_move: float
+    peak_per_game: float
+    max_peak_per_game: int
+    functions: dict[str, FunctionAllocations]
+
+
+class _Watermarks:
+    """Nested high-water marks over ``tracemalloc``, which keeps only one
+    peak: every push folds the current peak into the open frames first"""
+
+    def __init__(self):
+        self.frames: list[list[int]] = []
+        self.overhead = 0
+        # A frame around nothing still allocates its own bookkeeping
+        samples = []
+        for _ in range(16):
+            self.push()
+            samples.append(self.pop()[0])
+        self.overhead = min(samples)
+
+    def _fold(self) -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.frames:
+            if frame[1] < peak:
+                frame[1] = peak
+
+    def push(self) -> None:
+        self._fold()
+        frame = [0, 0]
+        self.frames.append(frame)
+        frame[0] = frame[1] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def pop(self) -> tuple[int, int]:
+        """(peak, retained) bytes of the innermost frame"""
+        self._fold()
+        start, peak = self.frames.pop()
+        current = tracemalloc.get_traced_memory()[0]
+        return max(peak - start - self.overhead, 0), current - start
+
+
+@contextmanager
+def _instrumented(marks: _Watermarks, totals: dict[str, list[int]]):
+    """Charge every call of the hot functions to ``totals`` while active"""
+    originals = []
+
+    def wrap(name, function):
+        total = totals.setdefault(name, [0, 0, 0])
+
+        def wrapper(*args, **kwargs):
+            marks.push()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                peak, retained = marks.pop()
+                total[0] += 1
+                total[1] += peak
+                total[2] += retained
+
+        return wrapper
+
+    for owner, name in HOT_FUNCTIONS:
+        function = owner.__dict__[name]
+        originals.append((owner, name, function))
+        setattr(owner, name, wrap(f"{owner.__name__}.{name}", function))
+    try:
+        yield
+    finally:
+        for owner, name, function in originals:
+            setattr(owner, name, function)
+
+
+def profile_allocations(
+    n_games: int = 20, num_players: int = 2, seed: int = 0
+) -> AllocationReport:
+    """Play random games under ``tracemalloc`` and attribute the traced
+    memory to moves, games and the hot functions.
+
+    ``tracemalloc`` sees live blocks, not allocation events, so churn is
+    measured as each call's high-water mark above its entry level.
+    """
+    rng = random.Random(seed)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    totals: dict[str, list[int]] = {}
+    n_moves = move_peaks = move_retained = 0
+    game_peaks = []
+    try:
+        marks = _Watermarks()
+        with _instrumented(marks, totals):
+            for i in range(n_games):
+                marks.push()
+                game = AzulGame(num_players=num_players, seed=seed + i, verbose=False)
+                advance(game)
+                while not is_game_over(game):
+                    action = rng.choice(legal_actions(game))
+                    marks.push()
+                    apply_action(game, action)
+                    advance(game)
+                    peak, retained = marks.pop()
+                    n_moves += 1
+                    move_peaks += peak
+                    move_retained += retained
+                del game
+                game_peaks.append(marks.pop()[0])
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    functions = {
+        name: FunctionAllocations(calls, peak / max(calls, 1), retained / max(calls, 1))
+        for name, (calls, peak, retained) in totals.items()
+    }
+    return AllocationReport(
+        n_games,
+        n_moves,
+        move_peaks / max(n_moves, 1),
+        move_retained / max(n_moves, 1),
+        sum(game_peaks) / max(n_games, 1),
+        max(game_peaks, default=0),
+        functions,
+    )
@@ -0,0 +1,72 @@
+import argparse
+from .allocations import profile_allocations
+from .memory import game_footprints
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-bench",
+        description="Measure the memory footprint of live games, or with "
+        "--allocations the memory churn of playing them",
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument(
+        "--live",
+        type=int,
+        default=100_000,
+        help="game count to extrapolate the total footprint for",
+    )
+    parser.add_argument(
+        "--allocations",
+        action="store_true",
+        help="trace allocations over --games full random games instead",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def print_allocations(args: argparse.Namespace) -> None:
+    report = profile_allocations(args.games, args.players, args.seed)
+    print(
+        f"{args.players} players, {report.games} games, {report.moves} moves "
+        f"under tracemalloc"
+    )
+    print(
+        f"per move: {report.peak_per_move:.0f} B peak, "
+        f"{report.retained_per_move:.0f} B retained"
+    )
+    print(
+        f"per game: {report.peak_per_game:.0f} B peak on average, "
+        f"{report.max_peak_per_game} B at most"
+    )
+    width = max(map(len, report.functions))
+    print(
+        f"{'function':<{width}}  {'calls':>8}  {'peak B/call':>12}  {'kept B/call':>12}"
+    )
+    for name, stats in report.functions.items():
+        print(
+            f"{name:<{width}}  {stats.calls:>8}  {stats.peak_per_call:>12.0f}"
+            f"  {stats.retained_per_call:>12.0f}"
+        )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.allocations:
+        print_allocations(args)
+        return
+    footprints = game_footprints(args.players, args.games)
+
+    print(f"{args.players} players, measured over {args.games} games")
+    width = max(map(len, footprints))
+    for name, per_game in footprints.items():
+        total = per_game * args.live / 2**20
+        print(
+            f"{name:<{width}}  {per_game:>10.0f} B/game"
+            f"  {total:>10.1f} MiB for {args.live} games"
+        )
+
+
+if __name__ == "__main__":
+    main()
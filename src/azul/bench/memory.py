@@ -0,0 +1,46 @@
+import gc
+import tracemalloc
+from typing import Any, Callable
+from azul.compact import CompactPlayerBoard, GameArrays
+from azul.perft import opening
+
+
+def measure_footprint(make: Callable[[int], Any], n: int) -> float:
+    """Traced bytes per object kept alive after calling ``make(i)`` n times.
+
+    One object is built before tracing starts so that lazily created shared
+    state (imports, caches, interned objects) is not charged to the batch.
+    """
+    make(0)
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [make(i) for i in range(n)]
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+def game_footprints(num_players: int = 2, n: int = 1000) -> dict[str, float]:
+    """Bytes per live game for each representation of an opening position"""
+    games = [opening(num_players, seed) for seed in range(n)]
+    arrays = GameArrays(n, num_players)
+    for i, game in enumerate(games):
+        arrays.store(i, game)
+
+    def compact_boards(i):
+        return [CompactPlayerBoard.from_player_board(p) for p in games[i].players]
+
+    return {
+        "AzulGame": measure_footprint(lambda i: opening(num_players, i), n),
+        "AzulGame.to_bytes": measure_footprint(lambda i: games[i].to_bytes(), n),
+        "CompactPlayerBoard (players only)": measure_footprint(compact_boards, n),
+        "GameArrays": arrays.nbytes / n,
+    }
@@ -2,6 +2,7 @@ from .tileholder import Tileholder
 from .bag import Bag
 from .boardcenter import BoardCenter
 from .factory import Factory
+from .features import BoardFeatures, TilesNeeded
 from .floorline import Floorline
 from .playerboard import PlayerBoard
 from .stagingline import StagingLine
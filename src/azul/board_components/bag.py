@@ -5,8 +5,9 @@ from .tileholder import Tileholder
 
 
 class Bag(Tileholder):
-    def __init__(self, tiles: MutableSequence[Tile]):
+    def __init__(self, tiles: MutableSequence[Tile], rng: random.Random | None = None):
         super().__init__(tiles)
+        self._rng = rng or random.Random()
 
     def pop_random(self, n) -> MutableSequence[Tile]:
         if len(self) < n:
@@ -17,4 +18,4 @@ class Bag(Tileholder):
         return [self._tiles.pop() for _ in range(n)]
 
     def _shuffle(self) -> None:
-        random.shuffle(self._tiles)
+        self._rng.shuffle(self._tiles)
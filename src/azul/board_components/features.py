@@ -0,0 +1,131 @@
+import itertools
+from typing import Callable, NamedTuple
+from azul.tile import TileType
+from .floorline import Floorline
+from .wall import Wall
+
+# FLOOR_PENALTY[k] is Floorline.calculate_penalty() with k tiles on the floor
+FLOOR_PENALTY = list(itertools.accumulate(Floorline.PENALTIES, initial=0))
+
+
+class TilesNeeded(NamedTuple):
+    rows: list[int]
+    columns: list[int]
+    colors: dict[TileType, int]
+
+
+class BoardFeatures:
+    """Derived quantities of a player board, computed on first use.
+
+    Wall features are cached until ``Wall.revision`` changes, so they survive
+    a whole round of moves. Pattern line and floor features are keyed by
+    each line's fill and color, which every tile added or cleared changes.
+    Code that edits ``Wall.grid`` directly must bump ``Wall.revision``.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._revision = -1
+        self._wall_cache: dict[str, object] = {}
+        self._round_key: tuple | None = None
+        self._round_points = 0
+
+    def _wall_feature(self, name: str, compute: Callable[[Wall], object]):
+        wall = self.board.wall
+        if self._revision != wall.revision:
+            self._wall_cache.clear()
+            self._revision = wall.revision
+        value = self._wall_cache.get(name)
+        if value is None:
+            value = self._wall_cache[name] = compute(wall)
+        return value
+
+    def row_colors(self) -> list[frozenset[TileType]]:
+        """Colors already on each wall row"""
+        return self._wall_feature(
+            "row_colors",
+            lambda wall: [
+                frozenset(tile.type for tile in row if tile) for row in wall.grid
+            ],
+        )
+
+    def cell_points(self) -> list[list[int]]:
+        """``Wall.calculate_points`` for every cell, 0 where a tile lies"""
+        return self._wall_feature(
+            "cell_points",
+            lambda wall: [
+                [
+                    0 if wall.grid[r][c] else wall.calculate_points(r, c)
+                    for c in range(5)
+                ]
+                for r in range(5)
+            ],
+        )
+
+    def tiles_needed(self) -> TilesNeeded:
+        """Tiles missing from each wall row, column and color"""
+        return self._wall_feature("tiles_needed", _tiles_needed)
+
+    def accepts(self, line_index: int, tile_type: TileType) -> bool:
+        """Whether pattern line ``line_index`` can take tiles of ``tile_type``"""
+        if tile_type in self.row_colors()[line_index]:
+            return False
+        tiles = self.board.pattern_lines[line_index]._tiles
+        return not tiles or tiles[0].type == tile_type
+
+    def line_points(self, line_index: int) -> int:
+        """Points the pattern line's color would score on the wall now, 0 if
+        the line is empty"""
+        tiles = self.board.pattern_lines[line_index]._tiles
+        if not tiles:
+            return 0
+        col = Wall.WALL_PATTERN[line_index].index(tiles[0].type)
+        return self.cell_points()[line_index][col]
+
+    def floor_penalty(self) -> int:
+        return FLOOR_PENALTY[min(len(self.board.floor_line), len(FLOOR_PENALTY) - 1)]
+
+    def round_points(self) -> int:
+        """Points the wall tiling would score if the round ended now, floor
+        penalty included and before the score is clamped at zero"""
+        board = self.board
+        lines = tuple(
+            (len(line), line._tiles[0].type) if line._tiles else None
+            for line in board.pattern_lines
+        )
+        key = (board.wall.revision, lines, len(board.floor_line))
+        if key != self._round_key:
+            self._round_key = key
+            self._round_points = self._score_round()
+        return self._round_points
+
+    def _score_round(self) -> int:
+        wall = self.board.wall
+        grid = [row[:] for row in wall.grid]
+        complete = [
+            (row, line._tiles[0].type)
+            for row, line in enumerate(self.board.pattern_lines)
+            if line.is_complete()
+        ]
+        if not complete:
+            return self.floor_penalty()
+        # Rows are tiled top first, so later rows see the earlier placements
+        scratch = Wall()
+        scratch.grid = grid
+        points = 0
+        for row, tile_type in complete:
+            col = Wall.WALL_PATTERN[row].index(tile_type)
+            grid[row][col] = True
+            points += scratch.calculate_points(row, col)
+        return points + self.floor_penalty()
+
+
+def _tiles_needed(wall: Wall) -> TilesNeeded:
+    rows = [sum(tile is None for tile in row) for row in wall.grid]
+    columns = [sum(wall.grid[r][c] is None for r in range(5)) for c in range(5)]
+    colors = {tile_type: 5 for tile_type in TileType}
+    for row in wall.grid:
+        for tile in row:
+            if tile is not None:
+                colors[tile.type] -= 1
+    return TilesNeeded(rows, columns, colors)
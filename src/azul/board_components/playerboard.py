@@ -1,3 +1,4 @@
+from .features import BoardFeatures
 from .wall import Wall
 from .stagingline import StagingLine
 from .floorline import Floorline
@@ -13,6 +14,8 @@ class PlayerBoard:
         self.wall = Wall()
         self.floor_line = Floorline()
         self.score = 0
+        self.floor_penalty_total = 0  # sum of floor penalties over all rounds
+        self.features = BoardFeatures(self)
 
     def has_completed_horizontal_line(self) -> bool:
         """Check if any horizontal line on the wall is complete"""
@@ -25,8 +28,6 @@ class PlayerBoard:
         if line_index < 0 or line_index >= 5:
             return False
 
-        # Check if wall already has this color in corresponding row
-        if self.wall.has_tile_type_in_row(line_index, tile_type):
-            return False
-
-        return self.pattern_lines[line_index].can_add_tile_type(tile_type)
+        # Wall row must not have the color yet, the line must be empty or
+        # of the same color
+        return self.features.accepts(line_index, tile_type)
@@ -12,22 +12,64 @@ class Wall(Tileholder):
         [TileType.YELLOW, TileType.RED, TileType.BLACK, TileType.WHITE, TileType.BLUE],
     ]
 
+    ROW_BONUS = 2
+    COLUMN_BONUS = 7
+    COLOR_BONUS = 10
+
     def __init__(self):
         super().__init__()
         self.grid = [[None for _ in range(5)] for _ in range(5)]
+        self.revision = 0  # bumped on every change to the grid
 
     def has_tile_type_in_row(self, row: int, tile_type: TileType) -> bool:
         """Check if tile type exists in given row"""
         return any(tile and tile.type == tile_type for tile in self.grid[row])
 
+    def mask(self) -> int:
+        """Filled cells as a 25 bit mask, bit ``5 * row + col``"""
+        mask = 0
+        for r, row in enumerate(self.grid):
+            for c, tile in enumerate(row):
+                if tile is not None:
+                    mask |= 1 << (5 * r + c)
+        return mask
+
     def has_complete_horizontal_line(self) -> bool:
         """Check if any horizontal line is complete"""
         return any(all(tile is not None for tile in row) for row in self.grid)
 
+    def complete_rows(self) -> int:
+        """Number of complete horizontal lines"""
+        return sum(all(tile is not None for tile in row) for row in self.grid)
+
+    def complete_columns(self) -> int:
+        """Number of complete vertical lines"""
+        return sum(
+            all(self.grid[row][col] is not None for row in range(5)) for col in range(5)
+        )
+
+    def complete_colors(self) -> int:
+        """Number of colors placed in all five rows"""
+        counts = {tile_type: 0 for tile_type in TileType}
+        for row in self.grid:
+            for tile in row:
+                if tile is not None:
+                    counts[tile.type] += 1
+        return sum(n == 5 for n in counts.values())
+
+    def end_game_bonus(self) -> int:
+        """Bonus points for complete rows, columns and colors"""
+        return (
+            self.ROW_BONUS * self.complete_rows()
+            + self.COLUMN_BONUS * self.complete_columns()
+            + self.COLOR_BONUS * self.complete_colors()
+        )
+
     def place_tile(self, row: int, tile: Tile) -> int:
         """Place tile on wall and return points scored"""
         col = self.WALL_PATTERN[row].index(tile.type)
         self.grid[row][col] = tile
+        self.revision += 1
         return self.calculate_points(row, col)
 
     def calculate_points(self, row: int, col: int) -> int:
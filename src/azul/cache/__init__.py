@@ -0,0 +1 @@
+from .evaluation_cache import CachedEvaluation, EvaluationCache, position_hash
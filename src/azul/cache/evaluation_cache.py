@@ -0,0 +1,172 @@
+import hashlib
+import sqlite3
+import time
+from typing import NamedTuple
+from azul.game.actions import Action, action_to_index, index_to_action
+from azul.game.state_machine import AzulGame
+from azul.game.symmetry import CanonicalForm, canonicalize
+
+
+def position_hash(form: CanonicalForm) -> bytes:
+    """Stable 16-byte digest of a canonical position, equal across processes"""
+    return hashlib.blake2b(repr(form.key).encode(), digest_size=16).digest()
+
+
+class CachedEvaluation(NamedTuple):
+    value: float
+    best_action: Action | None
+    depth: int
+
+
+class EvaluationCache:
+    """Evaluations of positions persisted in a local sqlite file.
+
+    Positions are keyed by their canonical form, so factory permutations and
+    seat rotations share an entry; best moves are stored in canonical
+    coordinates and mapped back on lookup. Entries from a deeper search
+    replace shallower ones. Once more than ``max_entries`` are stored the
+    least recently used ``evict_fraction`` of them is dropped.
+
+    Puts and lookup times are buffered and written every ``commit_every``
+    operations in one short transaction, so other processes sharing the file
+    are never locked out for longer than that write.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_entries: int = 1_000_000,
+        evict_fraction: float = 0.1,
+        commit_every: int = 256,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.evict_fraction = evict_fraction
+        self.commit_every = commit_every
+        self._pending = 0
+        # Rows to upsert and lookup times of hits, written by ``flush``
+        self._puts: dict[bytes, tuple[float, int | None, int, float]] = {}
+        self._touched: dict[bytes, float] = {}
+        self._conn = sqlite3.connect(path, timeout=30)
+        if path != ":memory:":
+            # Readers in other processes do not block on a writer
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluations (
+                hash BLOB PRIMARY KEY,
+                value REAL NOT NULL,
+                action INTEGER,
+                depth INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS evaluations_last_used ON evaluations(last_used)"
+        )
+        self._conn.commit()
+        # Rows this instance knows of, plus its writes since; it is recounted,
+        # picking up other writers' rows, only once it passes the cap
+        self._size_bound = self._count()
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+    def __len__(self):
+        """Entries stored, after writing the buffered ones"""
+        self.flush()
+        return self._count()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, game: AzulGame) -> CachedEvaluation | None:
+        form = canonicalize(game)
+        key = position_hash(form)
+        row = self._conn.execute(
+            "SELECT value, action, depth FROM evaluations WHERE hash = ?", (key,)
+        ).fetchone()
+        buffered = self._puts.get(key)
+        if buffered is not None and (row is None or buffered[2] >= row[2]):
+            row = buffered[:3]
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        self._written()
+        value, action, depth = row
+        best_action = None
+        if action is not None:
+            best_action = form.from_canonical(index_to_action(action))
+        return CachedEvaluation(value, best_action, depth)
+
+    def put(
+        self,
+        game: AzulGame,
+        value: float,
+        best_action: Action | None = None,
+        depth: int = 0,
+    ) -> None:
+        form = canonicalize(game)
+        action = None
+        if best_action is not None:
+            action = action_to_index(form.to_canonical(best_action))
+        key = position_hash(form)
+        buffered = self._puts.get(key)
+        if buffered is None or depth >= buffered[2]:
+            self._puts[key] = (value, action, depth, time.time())
+        self._written()
+
+    def _written(self) -> None:
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit pending writes and evict entries over the size cap"""
+        if self._puts:
+            self._conn.executemany(
+                """
+                INSERT INTO evaluations (hash, value, action, depth, last_used)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(hash) DO UPDATE SET
+                    value = excluded.value,
+                    action = excluded.action,
+                    depth = excluded.depth,
+                    last_used = excluded.last_used
+                WHERE excluded.depth >= evaluations.depth
+                """,
+                [(key, *row) for key, row in self._puts.items()],
+            )
+            self._size_bound += len(self._puts)
+            self._puts.clear()
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE evaluations SET last_used = ? WHERE hash = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+        excess = 0
+        if self._size_bound > self.max_entries:
+            self._size_bound = self._count()
+            excess = self._size_bound - self.max_entries
+        if excess > 0:
+            n_evict = max(excess, int(self.max_entries * self.evict_fraction))
+            self._conn.execute(
+                """
+                DELETE FROM evaluations WHERE hash IN (
+                    SELECT hash FROM evaluations ORDER BY last_used LIMIT ?
+                )
+                """,
+                (n_evict,),
+            )
+            self._size_bound -= min(n_evict, self._size_bound)
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
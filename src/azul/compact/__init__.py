@@ -0,0 +1,2 @@
+from .arrays import GameArrays
+from .playerboard import CompactPlayerBoard
@@ -0,0 +1,119 @@
+import numpy as np
+from azul.game.serialization import (
+    FLOOR_TOKEN,
+    HEADER,
+    MAX_FACTORIES,
+    N_COLORS,
+    PLAYER,
+    game_from_bytes,
+    game_to_bytes,
+)
+from azul.game.state_machine import AzulGame
+
+
+class GameArrays:
+    """Many games of one player count stored column-wise in NumPy arrays.
+
+    Slot ``i`` of every array belongs to game ``i``, so a batch of positions
+    costs a few dozen bytes each and fields such as ``score[:, seat]`` can be
+    read for all games at once. Games go in and out through the
+    ``game_to_bytes`` encoding, with the same loss of tile identity.
+    """
+
+    def __init__(self, capacity: int, num_players: int = 2):
+        self.capacity = capacity
+        self.num_players = num_players
+        n, p = capacity, num_players
+        # per game
+        self.state = np.zeros(n, dtype=np.uint8)
+        self.round_number = np.zeros(n, dtype=np.uint8)
+        self.current_player = np.zeros(n, dtype=np.uint8)
+        self.starting_player = np.zeros(n, dtype=np.uint8)
+        self.flags = np.zeros(n, dtype=np.uint8)
+        self.factories = np.zeros((n, MAX_FACTORIES), dtype=np.uint16)
+        self.center = np.zeros((n, N_COLORS), dtype=np.uint8)
+        self.bag = np.zeros((n, N_COLORS), dtype=np.uint8)
+        self.discard = np.zeros((n, N_COLORS), dtype=np.uint8)
+        # per game and seat
+        self.line_colors = np.zeros((n, p, 5), dtype=np.uint8)
+        self.line_counts = np.zeros((n, p, 5), dtype=np.uint8)
+        self.wall = np.zeros((n, p), dtype=np.uint32)
+        self.floor = np.zeros((n, p), dtype=np.uint8)
+        self.has_token = np.zeros((n, p), dtype=bool)
+        self.score = np.zeros((n, p), dtype=np.uint16)
+        self.floor_penalty_total = np.zeros((n, p), dtype=np.int16)
+
+    def __len__(self) -> int:
+        return self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in vars(self).values() if isinstance(a, np.ndarray))
+
+    def store(self, i: int, game: AzulGame) -> None:
+        if game.num_players != self.num_players:
+            raise ValueError(
+                f"Expected a {self.num_players} player game, got {game.num_players}"
+            )
+        data = game_to_bytes(game)
+        header = HEADER.unpack_from(data)
+        (
+            _,
+            self.state[i],
+            self.round_number[i],
+            self.current_player[i],
+            self.starting_player[i],
+            self.flags[i],
+        ) = header[:6]
+        self.factories[i] = header[6 : 6 + MAX_FACTORIES]
+        counts = header[6 + MAX_FACTORIES :]
+        self.center[i] = counts[:N_COLORS]
+        self.bag[i] = counts[N_COLORS : 2 * N_COLORS]
+        self.discard[i] = counts[2 * N_COLORS :]
+
+        for seat in range(self.num_players):
+            *lines, wall, floor, score, penalty_total = PLAYER.unpack_from(
+                data, HEADER.size + seat * PLAYER.size
+            )
+            lines = np.array(lines, dtype=np.uint8)
+            self.line_colors[i, seat] = lines >> 3
+            self.line_counts[i, seat] = lines & 7
+            self.wall[i, seat] = wall
+            self.floor[i, seat] = floor & (FLOOR_TOKEN - 1)
+            self.has_token[i, seat] = bool(floor & FLOOR_TOKEN)
+            self.score[i, seat] = score
+            self.floor_penalty_total[i, seat] = penalty_total
+
+    def to_bytes(self, i: int) -> bytes:
+        """``game_to_bytes`` of the game in slot ``i``"""
+        parts = [
+            HEADER.pack(
+                self.num_players,
+                self.state[i],
+                self.round_number[i],
+                self.current_player[i],
+                self.starting_player[i],
+                self.flags[i],
+                *self.factories[i].tolist(),
+                *self.center[i].tolist(),
+                *self.bag[i].tolist(),
+                *self.discard[i].tolist(),
+            )
+        ]
+        lines = (self.line_colors[i] << 3 | self.line_counts[i]).tolist()
+        for seat in range(self.num_players):
+            parts.append(
+                PLAYER.pack(
+                    *lines[seat],
+                    int(self.wall[i, seat]),
+                    int(self.floor[i, seat])
+                    | FLOOR_TOKEN * bool(self.has_token[i, seat]),
+                    int(self.score[i, seat]),
+                    int(self.floor_penalty_total[i, seat]),
+                )
+            )
+        return b"".join(parts)
+
+    def load(self, i: int, seed: int | None = None) -> AzulGame:
+        """Rebuild the game in slot ``i`` as an ``AzulGame``"""
+        return game_from_bytes(AzulGame, self.to_bytes(i), seed)
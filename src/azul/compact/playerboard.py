@@ -0,0 +1,108 @@
+from azul.board_components import PlayerBoard, Wall
+from azul.game.serialization import FLOOR_TOKEN, PLAYER
+from azul.tile import SpecialTileType, TileType
+
+# WALL_BIT[row][color] is the wall mask bit of a color (TileType.value - 1)
+WALL_BIT = [
+    [1 << (5 * row + Wall.WALL_PATTERN[row].index(t)) for t in TileType]
+    for row in range(5)
+]
+ROW_MASKS = [0b11111 << (5 * row) for row in range(5)]
+
+
+class CompactPlayerBoard:
+    """A player board as plain numbers instead of tile objects.
+
+    Pattern lines are (color, count) pairs with color 0 for an empty line,
+    the wall is a 25 bit mask (bit ``5 * row + col``) and the floor line is
+    a count of colored tiles plus the first player token flag.
+
+    It is a storage format with the placement queries of ``PlayerBoard``,
+    not a playable board: there are no moves or wall tiling, so play on a
+    ``PlayerBoard`` and convert the result.
+    """
+
+    __slots__ = (
+        "line_colors",
+        "line_counts",
+        "wall",
+        "floor",
+        "has_token",
+        "score",
+        "floor_penalty_total",
+    )
+
+    def __init__(self):
+        self.line_colors = bytearray(5)
+        self.line_counts = bytearray(5)
+        self.wall = 0
+        self.floor = 0
+        self.has_token = False
+        self.score = 0
+        self.floor_penalty_total = 0
+
+    @classmethod
+    def from_player_board(cls, player: PlayerBoard) -> "CompactPlayerBoard":
+        board = cls()
+        for i, line in enumerate(player.pattern_lines):
+            if line._tiles:
+                board.line_colors[i] = line._tiles[0].type.value
+                board.line_counts[i] = len(line)
+        board.wall = player.wall.mask()
+        floor = player.floor_line._tiles
+        board.floor = sum(tile.type != SpecialTileType.TILE_1 for tile in floor)
+        board.has_token = board.floor < len(floor)
+        board.score = player.score
+        board.floor_penalty_total = player.floor_penalty_total
+        return board
+
+    @classmethod
+    def unpack(cls, data: bytes, offset: int = 0) -> "CompactPlayerBoard":
+        """Read a board from the per-player record of ``game_to_bytes``"""
+        board = cls()
+        *lines, board.wall, floor, board.score, board.floor_penalty_total = (
+            PLAYER.unpack_from(data, offset)
+        )
+        for i, packed in enumerate(lines):
+            board.line_colors[i] = packed >> 3
+            board.line_counts[i] = packed & 7
+        board.floor = floor & (FLOOR_TOKEN - 1)
+        board.has_token = bool(floor & FLOOR_TOKEN)
+        return board
+
+    def pack(self) -> bytes:
+        """The per-player record of ``game_to_bytes``"""
+        return PLAYER.pack(
+            *(
+                color << 3 | count
+                for color, count in zip(self.line_colors, self.line_counts)
+            ),
+            self.wall,
+            self.floor | FLOOR_TOKEN * self.has_token,
+            self.score,
+            self.floor_penalty_total,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactPlayerBoard):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    def has_completed_horizontal_line(self) -> bool:
+        """Check if any horizontal line on the wall is complete"""
+        return any(self.wall & mask == mask for mask in ROW_MASKS)
+
+    def has_tile_type_in_row(self, row: int, tile_type: TileType) -> bool:
+        """Check if tile type exists in given wall row"""
+        return bool(self.wall & WALL_BIT[row][tile_type.value - 1])
+
+    def can_place_tile_type_in_pattern_line(
+        self, line_index: int, tile_type: TileType
+    ) -> bool:
+        """Check if tile type can be placed in pattern line"""
+        if line_index < 0 or line_index >= 5:
+            return False
+        if self.has_tile_type_in_row(line_index, tile_type):
+            return False
+        color = self.line_colors[line_index]
+        return color == 0 or color == tile_type.value
@@ -0,0 +1,2 @@
+from .observation import ObservationEncoder
+from .incremental import IncrementalEncoder
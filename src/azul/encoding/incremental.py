@@ -0,0 +1,89 @@
+import numpy as np
+from azul.game.changes import ChangeTracker
+from azul.game.state_machine import AzulGame
+from .observation import (
+    CENTER_SIZE,
+    FACTORY_SIZE,
+    N_COLORS,
+    PLAYER_SIZE,
+    ObservationEncoder,
+)
+
+
+class _Encoded:
+    """A game's observation with seats in table order, kept on its tracker"""
+
+    __slots__ = ("obs", "n_discarded")
+
+    def __init__(self, size: int):
+        self.obs = np.zeros(size, dtype=np.float32)
+        self.n_discarded = 0
+
+
+class IncrementalEncoder(ObservationEncoder):
+    """``ObservationEncoder`` that re-encodes only what changed since the
+    previous call on the same game.
+
+    The first call attaches a ``ChangeTracker`` to the game. Later calls
+    update the marked factories, center and player blocks of a cached
+    observation and copy it out with the seats rotated to the mover. Each
+    game supports one incremental consumer; encoders can share games.
+    """
+
+    def encode(self, game: AzulGame, out: np.ndarray | None = None) -> np.ndarray:
+        changes = game.changes
+        if changes is None:
+            changes = game.changes = ChangeTracker()
+        if changes.cache is None or changes.cache.obs.size != self.size:
+            changes.cache = _Encoded(self.size)
+            changes.everything = True
+        cached = changes.cache
+        self._update(game, changes, cached)
+        changes.clear()
+
+        obs = np.empty(self.size, dtype=np.float32) if out is None else out
+        players = FACTORY_SIZE + CENTER_SIZE
+        rotation = game.current_player * PLAYER_SIZE
+        end = players + self.num_players * PLAYER_SIZE
+        obs[:players] = cached.obs[:players]
+        obs[players : end - rotation] = cached.obs[players + rotation : end]
+        obs[end - rotation : end] = cached.obs[players : players + rotation]
+        obs[end:] = cached.obs[end:]
+        return obs
+
+    def _update(self, game: AzulGame, changes: ChangeTracker, cached: _Encoded):
+        obs = cached.obs
+        if len(game.discard_pile) < cached.n_discarded:
+            changes.everything = True
+        if changes.everything:
+            obs[:] = 0
+            changes.factories = range(len(game.factories))
+            changes.center = True
+            changes.players = range(self.num_players)
+
+        for i in changes.factories:
+            block = obs[i * N_COLORS : (i + 1) * N_COLORS]
+            block[:] = 0
+            self._encode_factory(game.factories[i], block)
+        if changes.center:
+            block = obs[FACTORY_SIZE : FACTORY_SIZE + CENTER_SIZE]
+            block[:] = 0
+            self._encode_center(game, block)
+        offset = FACTORY_SIZE + CENTER_SIZE
+        for p in changes.players:
+            block = obs[offset + p * PLAYER_SIZE : offset + (p + 1) * PLAYER_SIZE]
+            block[:] = 0
+            self._encode_player(game.players[p], block)
+
+        offset += self.num_players * PLAYER_SIZE
+        discard = game.discard_pile
+        if changes.everything:
+            obs[offset:] = 0
+            self._encode_globals(game, obs[offset:])
+        else:
+            # Tiles only move between visible holders during a round, so the
+            # inferred bag counts stay put; new discards are appended
+            for tile in discard[cached.n_discarded :]:
+                obs[offset + tile.type.value - 1] += 1
+            obs[offset + 2 * N_COLORS + 1] = game.first_player_token_taken
+        cached.n_discarded = len(discard)
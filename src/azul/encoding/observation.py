@@ -0,0 +1,98 @@
+import numpy as np
+from azul.game.actions import (
+    MAX_FACTORIES,
+    action_space_size,
+    action_to_index,
+    legal_actions,
+)
+from azul.game.determinization import infer_bag_counts
+from azul.game.state_machine import AzulGame
+from azul.tile import TileType, SpecialTileType
+
+N_COLORS = len(TileType)
+FACTORY_SIZE = MAX_FACTORIES * N_COLORS
+CENTER_SIZE = N_COLORS + 1  # color counts plus the first player token
+LINE_SIZE = N_COLORS + 1  # one-hot color plus number of tiles
+PLAYER_SIZE = 5 * LINE_SIZE + 25 + 3  # lines, wall, floor count, token, score
+GLOBAL_SIZE = 2 * N_COLORS + 2  # discard and bag counts, round, token taken
+
+
+class ObservationEncoder:
+    """Encode a position as a flat float32 vector from the mover's perspective.
+
+    Seats are rotated so the player to move comes first. Unused factory
+    slots (fewer than four players) stay zero, so the factory block has the
+    same layout for every player count.
+    """
+
+    def __init__(self, num_players: int = 2):
+        self.num_players = num_players
+        self.size = FACTORY_SIZE + CENTER_SIZE + num_players * PLAYER_SIZE + GLOBAL_SIZE
+        self.n_actions = action_space_size()
+
+    def encode(self, game: AzulGame, out: np.ndarray | None = None) -> np.ndarray:
+        """Write the observation into ``out`` (allocated if not given)"""
+        obs = np.zeros(self.size, dtype=np.float32) if out is None else out
+        obs[:] = 0
+
+        for i, factory in enumerate(game.factories):
+            self._encode_factory(factory, obs[i * N_COLORS : (i + 1) * N_COLORS])
+        self._encode_center(game, obs[FACTORY_SIZE : FACTORY_SIZE + CENTER_SIZE])
+
+        offset = FACTORY_SIZE + CENTER_SIZE
+        for seat in range(self.num_players):
+            player = game.players[(game.current_player + seat) % self.num_players]
+            self._encode_player(player, obs[offset : offset + PLAYER_SIZE])
+            offset += PLAYER_SIZE
+
+        self._encode_globals(game, obs[offset:])
+        return obs
+
+    @staticmethod
+    def _encode_factory(factory, obs: np.ndarray) -> None:
+        for tile in factory._tiles:
+            obs[tile.type.value - 1] += 1
+
+    @staticmethod
+    def _encode_center(game: AzulGame, obs: np.ndarray) -> None:
+        for tile in game.board_center._tiles:
+            if tile.type == SpecialTileType.TILE_1:
+                obs[N_COLORS] = 1
+            else:
+                obs[tile.type.value - 1] += 1
+
+    @staticmethod
+    def _encode_globals(game: AzulGame, obs: np.ndarray) -> None:
+        for tile in game.discard_pile:
+            obs[tile.type.value - 1] += 1
+        for tile_type, n in infer_bag_counts(game).items():
+            obs[N_COLORS + tile_type.value - 1] = n
+        obs[2 * N_COLORS] = game.round_number
+        obs[2 * N_COLORS + 1] = game.first_player_token_taken
+
+    @staticmethod
+    def _encode_player(player, obs: np.ndarray) -> None:
+        for i, line in enumerate(player.pattern_lines):
+            if line._tiles:
+                obs[i * LINE_SIZE + line._tiles[0].type.value - 1] = 1
+                obs[i * LINE_SIZE + N_COLORS] = len(line)
+
+        offset = 5 * LINE_SIZE
+        for r, row in enumerate(player.wall.grid):
+            for c, tile in enumerate(row):
+                if tile is not None:
+                    obs[offset + 5 * r + c] = 1
+
+        offset += 25
+        floor = player.floor_line._tiles
+        obs[offset] = len(floor)
+        obs[offset + 1] = any(t.type == SpecialTileType.TILE_1 for t in floor)
+        obs[offset + 2] = player.score
+
+    def action_mask(self, game: AzulGame, out: np.ndarray | None = None) -> np.ndarray:
+        """Boolean mask over the action index space, True for legal actions"""
+        mask = np.zeros(self.n_actions, dtype=np.bool_) if out is None else out
+        mask[:] = False
+        for action in legal_actions(game):
+            mask[action_to_index(action)] = True
+        return mask
@@ -0,0 +1,2 @@
+from .client import EngineClient, EngineProcessError, ExternalAgent
+from .session import EngineError, EngineSession
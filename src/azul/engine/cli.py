@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+from azul.agents import make_agent
+from .session import EngineSession
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-engine",
+        description="Serve an agent over the line protocol on stdin/stdout",
+    )
+    parser.add_argument("--agent", default="oneply")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def serve(session: EngineSession, fd_in: int = 0, out=sys.stdout) -> None:
+    """Read whatever input is available, answer it as one batch, repeat"""
+    buffer = b""
+    while not session.finished:
+        chunk = os.read(fd_in, 1 << 16)
+        if not chunk:
+            break
+        *complete, buffer = (buffer + chunk).split(b"\n")
+        replies = session.handle([line.decode() for line in complete])
+        if replies:
+            out.write("".join(f"{line}\n" for line in replies))
+            out.flush()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    serve(EngineSession(make_agent(args.agent, args.seed), args.agent))
+
+
+if __name__ == "__main__":
+    main()
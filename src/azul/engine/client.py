@@ -0,0 +1,114 @@
+import subprocess
+import threading
+from azul.game.state_machine import AzulGame
+
+
+class EngineProcessError(Exception):
+    """The engine process answered with an error or went away"""
+
+
+class EngineClient:
+    """Drive an external engine process over the line protocol"""
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0
+        )
+        self.name = self._handshake()
+
+    def _send(self, lines: list[str]) -> None:
+        self.process.stdin.write("".join(f"{line}\n" for line in lines).encode())
+        self.process.stdin.flush()
+
+    def _readline(self) -> str:
+        line = self.process.stdout.readline()
+        if not line:
+            raise EngineProcessError(f"{self.command[0]} exited")
+        return line.decode().strip()
+
+    def _handshake(self) -> str:
+        self._send(["azul"])
+        name = ""
+        while (line := self._readline()) != "azulok":
+            if line.startswith("id name "):
+                name = line[len("id name ") :]
+        return name
+
+    def bestmoves(
+        self,
+        games: list[AzulGame],
+        movetime: int | None = None,
+        nodes: int | None = None,
+    ) -> list[int]:
+        """Action indices for many positions, sent as one pipelined batch"""
+        limits = ""
+        if movetime is not None:
+            limits += f" movetime {movetime}"
+        if nodes is not None:
+            limits += f" nodes {nodes}"
+        requests = [
+            f"go id {i} position {game.to_bytes().hex()}{limits}"
+            for i, game in enumerate(games)
+        ]
+        # Write from a thread so a large batch cannot deadlock against the
+        # engine filling the pipe with replies
+        writer = threading.Thread(target=self._send, args=(requests,))
+        writer.start()
+        moves: dict[int, int] = {}
+        try:
+            while len(moves) < len(games):
+                kind, *rest = self._readline().split()
+                if kind == "bestmove":
+                    moves[int(rest[1])] = int(rest[2])
+                elif kind == "error":
+                    raise EngineProcessError(" ".join(rest))
+        finally:
+            writer.join()
+        return [moves[i] for i in range(len(games))]
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            try:
+                self._send(["quit"])
+            except BrokenPipeError:
+                pass
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    def __enter__(self) -> "EngineClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ExternalAgent:
+    """An agent whose moves come from an engine process, e.g. a third-party
+    bot; usable anywhere a built-in agent is"""
+
+    def __init__(
+        self,
+        command: list[str],
+        movetime: int | None = None,
+        nodes: int | None = None,
+    ):
+        self.command = command
+        self.movetime = movetime
+        self.nodes = nodes
+        self._client: EngineClient | None = None
+
+    def act_positions(self, games: list[AzulGame]) -> list[int]:
+        if self._client is None:
+            self._client = EngineClient(self.command)
+        return self._client.bestmoves(games, self.movetime, self.nodes)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        self.close()
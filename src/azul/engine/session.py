@@ -0,0 +1,173 @@
+"""Line-based engine protocol in the spirit of UCI.
+
+Commands, one per line::
+
+    azul                        -> id name <agent>, then azulok
+    isready                     -> readyok
+    position <hex>              set the position for following ``go``s
+    go [id <tag>] [position <hex>] [movetime <ms>] [nodes <n>]
+                                -> [info id <tag> depth <d> nodes <n> nps <x>]
+                                   bestmove id <tag> <action index>
+    quit
+
+Positions are ``AzulGame.to_bytes`` in hex and moves are indices from
+``azul.game.actions.action_to_index``. Any number of ``go`` commands may be
+sent without waiting; replies come in order and carry the request's tag.
+Problems are answered with ``error [id <tag>] <message>``.
+"""
+
+import struct
+import numpy as np
+from azul.encoding import ObservationEncoder
+from azul.game.actions import action_to_index
+from azul.game.state_machine import AzulGame
+
+GO_OPTIONS = {"id": str, "position": str, "movetime": int, "nodes": int}
+
+
+class EngineError(Exception):
+    pass
+
+
+def parse_go(tokens: list[str]) -> dict:
+    if len(tokens) % 2:
+        raise EngineError("go takes key value pairs")
+    options = {}
+    for key, value in zip(tokens[::2], tokens[1::2]):
+        if key not in GO_OPTIONS:
+            raise EngineError(f"unknown go option {key!r}")
+        try:
+            options[key] = GO_OPTIONS[key](value)
+        except ValueError:
+            raise EngineError(f"bad value for {key}: {value!r}") from None
+    return options
+
+
+def decode_position(hex_data: str) -> AzulGame:
+    try:
+        return AzulGame.from_bytes(bytes.fromhex(hex_data), seed=0)
+    except (ValueError, IndexError, struct.error) as e:
+        raise EngineError(f"bad position: {e}") from None
+
+
+def _tag(request_id: str | None) -> str:
+    return "" if request_id is None else f"id {request_id} "
+
+
+class EngineSession:
+    """Protocol state for one client, independent of how lines arrive.
+
+    ``handle`` takes every line that is available at once. Consecutive
+    ``go`` requests are answered with a single batched ``act`` (or
+    ``act_positions``) call, so pipelining clients pay the agent overhead
+    once per batch rather than once per position. Search agents get their
+    own call per request so that ``movetime`` and ``nodes`` apply to each.
+    """
+
+    def __init__(self, agent, name: str = "agent"):
+        self.agent = agent
+        self.name = name
+        self.position: AzulGame | None = None
+        self.finished = False
+        self._encoders: dict[int, ObservationEncoder] = {}
+        self._pending: list[tuple[str | None, AzulGame]] = []
+        # Search limits a ``go`` falls back to when it does not set them
+        self._time_budget = getattr(agent, "time_budget", None)
+        self._max_nodes = getattr(agent, "max_nodes", None)
+
+    def handle(self, lines: list[str]) -> list[str]:
+        out = []
+        for line in lines:
+            tokens = line.split()
+            if not tokens:
+                continue
+            command, args = tokens[0], tokens[1:]
+            if command != "go":
+                self._flush(out)
+            try:
+                self._command(command, args, out)
+            except EngineError as e:
+                request_id = None
+                if command == "go" and "id" in args[:-1]:
+                    request_id = args[args.index("id") + 1]
+                out.append(f"error {_tag(request_id)}{e}")
+            if self.finished:
+                break
+        self._flush(out)
+        return out
+
+    def _command(self, command: str, args: list[str], out: list[str]) -> None:
+        if command == "azul":
+            out += [f"id name {self.name}", "azulok"]
+        elif command == "isready":
+            out.append("readyok")
+        elif command == "position":
+            if len(args) != 1:
+                raise EngineError("position takes one hex encoded state")
+            self.position = decode_position(args[0])
+        elif command == "go":
+            self._go(parse_go(args), out)
+        elif command == "quit":
+            self.finished = True
+        else:
+            raise EngineError(f"unknown command {command!r}")
+
+    def _go(self, options: dict, out: list[str]) -> None:
+        request_id = options.get("id")
+        if "position" in options:
+            game = decode_position(options["position"])
+        elif self.position is not None:
+            game = self.position
+        else:
+            raise EngineError("no position set")
+        if game.current_state != game.factory_offer:
+            raise EngineError(f"no move to make in state {game.current_state.id}")
+
+        if not hasattr(self.agent, "search"):
+            self._pending.append((request_id, game))
+            return
+        self._flush(out)
+        if "movetime" in options:
+            self.agent.time_budget = options["movetime"] / 1000
+        else:
+            self.agent.time_budget = self._time_budget
+        self.agent.max_nodes = options.get("nodes", self._max_nodes)
+        result = self.agent.search(game)
+        tag = _tag(request_id)
+        out.append(
+            f"info {tag}depth {result.depth} nodes {result.nodes} "
+            f"nps {result.nodes_per_second:.0f}"
+        )
+        out.append(f"bestmove {tag}{action_to_index(result.action)}")
+
+    def _flush(self, out: list[str]) -> None:
+        """Answer the queued ``go`` requests"""
+        if not self._pending:
+            return
+        games = [game for _, game in self._pending]
+        if hasattr(self.agent, "act_positions"):
+            choices = self.agent.act_positions(games)
+        else:
+            choices = self._act_batched(games)
+        for (request_id, _), action in zip(self._pending, choices):
+            out.append(f"bestmove {_tag(request_id)}{int(action)}")
+        self._pending.clear()
+
+    def _act_batched(self, games: list[AzulGame]) -> list[int]:
+        """One ``act`` call per player count, as observations differ in size"""
+        by_players: dict[int, list[int]] = {}
+        for i, game in enumerate(games):
+            by_players.setdefault(game.num_players, []).append(i)
+        choices = [0] * len(games)
+        for num_players, rows in by_players.items():
+            encoder = self._encoders.get(num_players)
+            if encoder is None:
+                encoder = self._encoders[num_players] = ObservationEncoder(num_players)
+            obs = np.zeros((len(rows), encoder.size), dtype=np.float32)
+            mask = np.zeros((len(rows), encoder.n_actions), dtype=np.bool_)
+            for row, i in enumerate(rows):
+                encoder.encode(games[i], obs[row])
+                encoder.action_mask(games[i], mask[row])
+            for i, action in zip(rows, self.agent.act(obs, mask)):
+                choices[i] = int(action)
+        return choices
@@ -0,0 +1,2 @@
+from .engine import Engine, EngineFactory, ReferenceEngine, Snapshot, snapshot_game
+from .harness import Divergence, fuzz, fuzz_game, replay, shrink
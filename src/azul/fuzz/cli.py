@@ -0,0 +1,50 @@
+import argparse
+import importlib
+import sys
+import time
+from .engine import EngineFactory
+from .harness import fuzz
+
+
+def load_factory(spec: str) -> EngineFactory:
+    """Resolve ``package.module:attribute`` to an engine factory"""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Engine must be given as module:attribute, got {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-fuzz",
+        description="Play random games through AzulGame and another engine in lockstep",
+    )
+    parser.add_argument(
+        "--engine",
+        required=True,
+        help="engine factory as module:attribute, called with (num_players, seed)",
+    )
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    factory = load_factory(args.engine)
+    start = time.perf_counter()
+    divergences = fuzz(factory, args.games, args.players, args.seed)
+    elapsed = time.perf_counter() - start
+
+    for divergence in divergences:
+        print(divergence.describe())
+    print(
+        f"{args.games} games, {len(divergences)} diverging, {elapsed:.1f}s "
+        f"({args.games / max(elapsed, 1e-9):.1f} games/s)"
+    )
+    sys.exit(1 if divergences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from typing import Callable, NamedTuple, Protocol
+from azul.game.actions import (
+    Action,
+    advance,
+    apply_action,
+    is_game_over,
+    legal_actions,
+)
+from azul.game.state_machine import AzulGame
+
+
+class Snapshot(NamedTuple):
+    """Engine-independent view of a position, compared field by field"""
+
+    legal_actions: frozenset[Action]
+    current_player: int
+    round_number: int
+    scores: tuple[int, ...]
+    walls: tuple[int, ...]  # 25-bit occupancy mask per player
+    pattern_lines: tuple[tuple[tuple[int, int], ...], ...]  # (color, count)
+    floor_lines: tuple[int, ...]
+    discard_size: int
+    bag_size: int
+    game_over: bool
+
+
+class Engine(Protocol):
+    """A game implementation the fuzzer can drive in lockstep.
+
+    Engines are built from ``(num_players, seed)`` and must deal the same
+    tiles as ``AzulGame`` for the same seed. ``apply`` plays a move and then
+    runs any phases that need no decision.
+    """
+
+    def legal_actions(self) -> list[Action]: ...
+
+    def apply(self, action: Action) -> None: ...
+
+    def snapshot(self) -> Snapshot: ...
+
+
+EngineFactory = Callable[[int, int], Engine]
+
+
+def snapshot_game(game: AzulGame) -> Snapshot:
+    return Snapshot(
+        legal_actions=frozenset(legal_actions(game)),
+        current_player=game.current_player,
+        round_number=game.round_number,
+        scores=tuple(p.score for p in game.players),
+        walls=tuple(p.wall.mask() for p in game.players),
+        pattern_lines=tuple(
+            tuple(
+                (line._tiles[0].type.value if line._tiles else 0, len(line))
+                for line in p.pattern_lines
+            )
+            for p in game.players
+        ),
+        floor_lines=tuple(len(p.floor_line) for p in game.players),
+        discard_size=len(game.discard_pile),
+        bag_size=len(game.bag),
+        game_over=is_game_over(game),
+    )
+
+
+class ReferenceEngine:
+    """``AzulGame`` behind the ``Engine`` interface"""
+
+    def __init__(self, num_players: int, seed: int):
+        self.game = AzulGame(num_players=num_players, seed=seed, verbose=False)
+        advance(self.game)
+
+    def legal_actions(self) -> list[Action]:
+        return legal_actions(self.game)
+
+    def apply(self, action: Action) -> None:
+        apply_action(self.game, action)
+        advance(self.game)
+
+    def snapshot(self) -> Snapshot:
+        return snapshot_game(self.game)
@@ -0,0 +1,135 @@
+import random
+from typing import NamedTuple, Sequence
+from azul.game.actions import Action
+from .engine import EngineFactory, ReferenceEngine, Snapshot
+
+
+class Divergence(NamedTuple):
+    """Where two engines first disagree on a seeded action sequence"""
+
+    num_players: int
+    seed: int
+    actions: list[Action]  # the divergence shows after the last action
+    fields: list[str]
+    reference: Snapshot
+    candidate: Snapshot
+
+    def describe(self) -> str:
+        lines = [
+            f"seed {self.seed}, {self.num_players} players, "
+            f"{len(self.actions)} action(s):"
+        ]
+        lines += [f"  {i}: {a}" for i, a in enumerate(self.actions)]
+        for field in self.fields:
+            lines.append(f"  {field}:")
+            lines.append(f"    reference {getattr(self.reference, field)}")
+            lines.append(f"    candidate {getattr(self.candidate, field)}")
+        return "\n".join(lines)
+
+
+def _differing_fields(a: Snapshot, b: Snapshot) -> list[str]:
+    return [
+        field for field in Snapshot._fields if getattr(a, field) != getattr(b, field)
+    ]
+
+
+def replay(
+    factory: EngineFactory,
+    num_players: int,
+    seed: int,
+    actions: Sequence[Action],
+    reference: EngineFactory = ReferenceEngine,
+) -> Divergence | None:
+    """Play ``actions`` in both engines, comparing after every step.
+
+    Raises ValueError if an action is illegal in the reference engine.
+    """
+    ref, cand = reference(num_players, seed), factory(num_players, seed)
+    played = []
+    for step in range(len(actions) + 1):
+        ref_snap, cand_snap = ref.snapshot(), cand.snapshot()
+        fields = _differing_fields(ref_snap, cand_snap)
+        if fields:
+            return Divergence(num_players, seed, played, fields, ref_snap, cand_snap)
+        if step == len(actions):
+            return None
+        action = actions[step]
+        if action not in ref_snap.legal_actions:
+            raise ValueError(f"{action} is not legal after {len(played)} action(s)")
+        ref.apply(action)
+        cand.apply(action)
+        played.append(action)
+
+
+def fuzz_game(
+    factory: EngineFactory,
+    num_players: int,
+    seed: int,
+    reference: EngineFactory = ReferenceEngine,
+) -> Divergence | None:
+    """Play one random game through both engines in lockstep"""
+    rng = random.Random(seed)
+    ref, cand = reference(num_players, seed), factory(num_players, seed)
+    played = []
+    while True:
+        ref_snap, cand_snap = ref.snapshot(), cand.snapshot()
+        fields = _differing_fields(ref_snap, cand_snap)
+        if fields:
+            return Divergence(num_players, seed, played, fields, ref_snap, cand_snap)
+        if ref_snap.game_over:
+            return None
+        action = rng.choice(ref.legal_actions())
+        ref.apply(action)
+        cand.apply(action)
+        played.append(action)
+
+
+def shrink(
+    divergence: Divergence,
+    factory: EngineFactory,
+    reference: EngineFactory = ReferenceEngine,
+) -> Divergence:
+    """Delta-debug the action sequence down to a minimal reproducing one.
+
+    Removes ever smaller chunks of actions, keeping a candidate whenever it
+    is still legal in the reference engine and still diverges.
+    """
+
+    def check(actions):
+        try:
+            return replay(
+                factory, divergence.num_players, divergence.seed, actions, reference
+            )
+        except ValueError:
+            return None
+
+    best = divergence
+    chunk = max(len(best.actions) // 2, 1)
+    while True:
+        start = 0
+        while start < len(best.actions):
+            candidate = best.actions[:start] + best.actions[start + chunk :]
+            found = check(candidate)
+            if found is not None:
+                best = found  # replay already truncates at the divergence
+            else:
+                start += chunk
+        if chunk == 1:
+            return best
+        chunk //= 2
+
+
+def fuzz(
+    factory: EngineFactory,
+    n_games: int,
+    num_players: int = 2,
+    seed: int = 0,
+    reference: EngineFactory = ReferenceEngine,
+) -> list[Divergence]:
+    """Fuzz ``n_games`` seeds and return the shrunk divergences"""
+    found = []
+    for game_seed in range(seed, seed + n_games):
+        divergence = fuzz_game(factory, num_players, game_seed, reference)
+        if divergence is not None:
+            found.append(shrink(divergence, factory, reference))
+    return found
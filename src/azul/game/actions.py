@@ -0,0 +1,97 @@
+from typing import NamedTuple
+from azul.tile import TileType, SpecialTileType
+from .state_machine import AzulGame
+
+CENTER = -1  # Action.source for taking tiles from the board center
+FLOOR = -1  # Action.line for dropping tiles straight onto the floor line
+
+N_COLORS = len(TileType)
+N_LINES = 6  # five pattern lines plus the floor line
+MAX_FACTORIES = 9  # 2 * 4 + 1 factories in a four player game
+
+
+class Action(NamedTuple):
+    """A factory-offer move: take all tiles of one color and place them"""
+
+    source: int
+    tile_type: TileType
+    line: int
+
+
+def source_colors(game: AzulGame, source: int) -> list[TileType]:
+    """Colors that can be taken from a factory or the center, in enum order"""
+    holder = game.board_center if source == CENTER else game.factories[source]
+    present = {t.type for t in holder._tiles if t.type != SpecialTileType.TILE_1}
+    return [tile_type for tile_type in TileType if tile_type in present]
+
+
+def legal_actions(game: AzulGame) -> list[Action]:
+    """All legal moves for the current player in the factory offer phase"""
+    if game.current_state != game.factory_offer:
+        return []
+
+    player = game.players[game.current_player]
+    actions = []
+    for source in [*range(len(game.factories)), CENTER]:
+        for tile_type in source_colors(game, source):
+            for line in range(5):
+                if player.can_place_tile_type_in_pattern_line(line, tile_type):
+                    actions.append(Action(source, tile_type, line))
+            actions.append(Action(source, tile_type, FLOOR))
+    return actions
+
+
+def apply_action(game: AzulGame, action: Action) -> None:
+    """Play an action for the current player"""
+    if action.source == CENTER:
+        game.player_take_from_center(action.tile_type, action.line)
+    else:
+        game.player_take_from_factory(action.source, action.tile_type, action.line)
+
+
+def advance(game: AzulGame) -> None:
+    """Run phases without decisions until a player has to move or the game ends"""
+    while True:
+        if game.current_state == game.setup:
+            game.start_game()
+        elif game.current_state == game.wall_tiling:
+            game.complete_wall_tiling()
+        elif game.current_state == game.preparing_next_round:
+            game.start_next_round()
+        elif (
+            game.current_state == game.factory_offer
+            and not game.check_tiles_available()
+        ):
+            # Bag and discard pile ran dry before any factory could be filled
+            game.complete_factory_phase()
+        else:
+            return
+
+
+def is_game_over(game: AzulGame) -> bool:
+    return game.current_state == game.game_ended
+
+
+def action_space_size() -> int:
+    """Size of the fixed action index space, shared by all player counts"""
+    return (MAX_FACTORIES + 1) * N_COLORS * N_LINES
+
+
+def action_to_index(action: Action) -> int:
+    """Flatten an action to an index; the center is slot 0, factory i slot i + 1"""
+    source_slot = 0 if action.source == CENTER else action.source + 1
+    line_slot = N_LINES - 1 if action.line == FLOOR else action.line
+    return (source_slot * N_COLORS + action.tile_type.value - 1) * N_LINES + line_slot
+
+
+def index_to_action(index: int) -> Action:
+    """Inverse of ``action_to_index``"""
+    if not 0 <= index < action_space_size():
+        raise ValueError(f"Action index must be in [0, {action_space_size()})")
+    rest, line_slot = divmod(index, N_LINES)
+    source_slot, color = divmod(rest, N_COLORS)
+    return Action(
+        CENTER if source_slot == 0 else source_slot - 1,
+        TileType(color + 1),
+        FLOOR if line_slot == N_LINES - 1 else line_slot,
+    )
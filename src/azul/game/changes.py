@@ -0,0 +1,31 @@
+class ChangeTracker:
+    """Which parts of a game changed since a consumer last caught up.
+
+    The game marks factories, the center and player boards as its moves
+    touch them; phase changes mark everything. Within a round the discard
+    pile only grows, by floor line overflow, so consumers can follow it by
+    its length. A tracker serves a single consumer, which reads the marks,
+    updates its copy and calls ``clear``. The consumer may keep its copy in
+    ``cache``.
+    """
+
+    __slots__ = ("factories", "center", "players", "everything", "cache")
+
+    def __init__(self):
+        self.cache = None
+        self.clear()
+        self.everything = True
+
+    def clear(self) -> None:
+        self.factories: set[int] = set()
+        self.center = False
+        self.players: set[int] = set()
+        self.everything = False
+
+    def __repr__(self) -> str:
+        if self.everything:
+            return "ChangeTracker(everything)"
+        return (
+            f"ChangeTracker(factories={sorted(self.factories)}, center={self.center}, "
+            f"players={sorted(self.players)})"
+        )
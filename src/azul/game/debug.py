@@ -0,0 +1,53 @@
+from .state_machine import AzulGame
+
+
+def _names(tiles) -> str:
+    return ", ".join(tile.type.name for tile in tiles)
+
+
+def format_game_state(game: AzulGame) -> str:
+    """Human-readable dump of every holder and player board"""
+    lines = [
+        "=" * 60,
+        f"ROUND {game.round_number} - {game.current_state.id.upper()}",
+        f"Current Player: {game.current_player + 1}",
+        f"Starting Player: {game.starting_player + 1}",
+        f"First Player Token Taken: {game.first_player_token_taken}",
+        "=" * 60,
+        "BAG STATE:",
+        f"  Tiles in bag: {len(game.bag) if game.bag else 0}",
+        f"  Tiles in discard: {len(game.discard_pile)}",
+        "FACTORIES STATE:",
+    ]
+    for i, factory in enumerate(game.factories):
+        if factory._tiles:
+            lines.append(
+                f"  Factory {i}: [{_names(factory._tiles)}] ({len(factory)} tiles)"
+            )
+        else:
+            lines.append(f"  Factory {i}: [Empty]")
+    lines.append(f"CENTER STATE: [{_names(game.board_center._tiles)}]")
+
+    lines.append("PLAYER BOARDS:")
+    for i, player in enumerate(game.players):
+        lines.append(f"  Player {i + 1} (Score: {player.score}):")
+        lines.append("    Pattern Lines:")
+        for j, line in enumerate(player.pattern_lines):
+            complete = " [COMPLETE]" if line.is_complete() else ""
+            tiles = _names(line._tiles) or "Empty"
+            lines.append(
+                f"      Line {j + 1} ({len(line)}/{j + 1}): [{tiles}]{complete}"
+            )
+        lines.append("    Wall:")
+        for r, row in enumerate(player.wall.grid):
+            cells = ", ".join(tile.type.name if tile else "Empty" for tile in row)
+            lines.append(f"      Row {r + 1}: [{cells}]")
+        floor = player.floor_line
+        if floor._tiles:
+            lines.append(
+                f"    Floor Line: [{_names(floor._tiles)}] "
+                f"(Penalty: {floor.calculate_penalty()})"
+            )
+        else:
+            lines.append("    Floor Line: [Empty]")
+    return "\n".join(lines)
@@ -0,0 +1,97 @@
+import copy
+import random
+from typing import MutableSequence
+from azul.board_components import Bag
+from azul.tile import Tile, TileType
+from .state_machine import AzulGame
+
+
+class DeterminizedBag(Bag):
+    """Bag that draws tiles in its stored order instead of reshuffling"""
+
+    def __init__(self, tiles: MutableSequence[Tile], rng: random.Random):
+        super().__init__(tiles, rng)
+
+    def extend(self, tiles: MutableSequence[Tile]):
+        """Refills (e.g. from the discard pile) are shuffled once on arrival"""
+        tiles = list(tiles)
+        self._rng.shuffle(tiles)
+        self._tiles.extend(tiles)
+
+    def _shuffle(self) -> None:
+        # Order was sampled up front, drawing pops from the end
+        pass
+
+
+def count_visible_tiles(game: AzulGame) -> dict[TileType, int]:
+    """Count colored tiles outside the bag, i.e. everything players can see"""
+    counts = {tile_type: 0 for tile_type in TileType}
+
+    def add(tiles):
+        for tile in tiles:
+            if tile.type in counts:
+                counts[tile.type] += 1
+
+    for factory in game.factories:
+        add(factory._tiles)
+    add(game.board_center._tiles)
+    add(game.discard_pile)
+
+    for player in game.players:
+        for line in player.pattern_lines:
+            add(line._tiles)
+        add(player.floor_line._tiles)
+        add(tile for row in player.wall.grid for tile in row if tile is not None)
+
+    return counts
+
+
+def infer_bag_counts(game: AzulGame) -> dict[TileType, int]:
+    """Infer how many tiles of each color are in the bag from public information"""
+    n_per_type = game.tile_generator.n_tiles_per_type
+    visible = count_visible_tiles(game)
+    counts = {tile_type: n_per_type - n for tile_type, n in visible.items()}
+    if any(n < 0 for n in counts.values()):
+        raise ValueError(f"More than {n_per_type} tiles of a color visible: {visible}")
+    return counts
+
+
+class Determinizer:
+    """Sample hidden bag states consistent with what the players can see.
+
+    Bag counts are inferred once per position, so each ``sample`` call is a
+    single list copy and shuffle, cheap enough to run once per playout.
+    """
+
+    def __init__(self, game: AzulGame, rng: random.Random | None = None):
+        self.rng = rng or random.Random()
+        self.bag_counts = infer_bag_counts(game)
+        self._bag_types = [
+            tile_type for tile_type, n in self.bag_counts.items() for _ in range(n)
+        ]
+
+    def __len__(self):
+        return len(self._bag_types)
+
+    def sample(self) -> list[TileType]:
+        """Sample a bag order; the last entry is drawn first"""
+        order = list(self._bag_types)
+        self.rng.shuffle(order)
+        return order
+
+    def apply(self, game: AzulGame) -> AzulGame:
+        """Overwrite the bag of ``game`` in place with a sampled order"""
+        if game.bag is None or len(game.bag) != len(self):
+            raise ValueError(
+                f"Bag holds {0 if game.bag is None else len(game.bag)} tile(s), "
+                f"but {len(self)} were inferred from public information."
+            )
+        tiles = game.bag._tiles
+        for tile, tile_type in zip(tiles, self.sample()):
+            tile.type = tile_type
+        game.bag = DeterminizedBag(tiles, self.rng)
+        return game
+
+    def determinize(self, game: AzulGame) -> AzulGame:
+        """Return a copy of ``game`` with a sampled hidden bag"""
+        return self.apply(copy.deepcopy(game))
@@ -0,0 +1,104 @@
+import sys
+from collections import deque
+from contextlib import contextmanager
+from typing import IO, NamedTuple
+from azul.tile import TileType
+
+
+class MoveRecord(NamedTuple):
+    seq: int
+    round_number: int
+    player: int
+    source: int  # factory index, -1 for the center
+    tile_type: TileType
+    line: int  # pattern line index, -1 for the floor
+
+
+class FlightRecorder:
+    """Ring buffer of a game's recent moves plus periodic compact snapshots.
+
+    Recording a move is a tuple append; every ``snapshot_every`` moves and at
+    the start of each round the position is stored as ``to_bytes`` output.
+    The last ``capacity`` moves are kept together with the newest snapshot
+    at or before them and every move since, so the window can be replayed.
+    Nothing is formatted until ``dump`` is called, typically from ``guard``
+    when something has gone wrong.
+    """
+
+    def __init__(self, game, capacity: int = 64, snapshot_every: int = 16):
+        self.game = game
+        self.capacity = capacity
+        self.snapshot_every = snapshot_every
+        self.n_moves = 0
+        self.moves: deque[MoveRecord] = deque()
+        # (number of moves played, encoded position), oldest first
+        self.snapshots: deque[tuple[int, bytes]] = deque()
+
+    def record_move(self, source: int, tile_type: TileType, line: int) -> None:
+        """Called by the game before a move is carried out"""
+        game = self.game
+        self.moves.append(
+            MoveRecord(
+                self.n_moves,
+                game.round_number,
+                game.current_player,
+                source,
+                tile_type,
+                line,
+            )
+        )
+        self.n_moves += 1
+        self._trim()
+
+    def _trim(self) -> None:
+        """Drop what is not needed to replay the last ``capacity`` moves"""
+        start = max(self.n_moves - self.capacity, 0)
+        snapshots = self.snapshots
+        while len(snapshots) > 1 and snapshots[1][0] <= start:
+            snapshots.popleft()
+        if snapshots:
+            start = min(start, snapshots[0][0])
+        moves = self.moves
+        while moves and moves[0].seq < start:
+            moves.popleft()
+
+    def after_move(self) -> None:
+        if self.n_moves % self.snapshot_every == 0:
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        self.snapshots.append((self.n_moves, self.game.to_bytes()))
+
+    def dump(self) -> str:
+        """Recent moves, the oldest kept snapshot and the current position"""
+        from .debug import format_game_state
+
+        game = self.game
+        lines = [
+            f"FLIGHT RECORDER: {len(self.moves)} of {self.n_moves} move(s), "
+            f"{len(self.snapshots)} snapshot(s)"
+        ]
+        if self.snapshots:
+            seq, data = self.snapshots[0]
+            lines += [
+                f"Snapshot before move {seq} ({data.hex()}):",
+                format_game_state(type(game).from_bytes(data)),
+            ]
+        for move in self.moves:
+            source = "center" if move.source < 0 else f"factory {move.source}"
+            line = "floor" if move.line < 0 else f"line {move.line + 1}"
+            lines.append(
+                f"  #{move.seq} round {move.round_number} player "
+                f"{move.player + 1}: {move.tile_type.name} from {source} -> {line}"
+            )
+        lines += ["Current position:", format_game_state(game)]
+        return "\n".join(lines)
+
+    @contextmanager
+    def guard(self, stream: IO[str] | None = None):
+        """Write a dump if the block raises, then let the error propagate"""
+        try:
+            yield self
+        except Exception:
+            print(self.dump(), file=stream or sys.stderr)
+            raise
@@ -0,0 +1,108 @@
+import math
+import random
+from azul.tile import SpecialTileType, TileType
+
+
+class InvariantViolation(AssertionError):
+    """The game reached a state the rules do not allow"""
+
+
+# States in which the first player token must be somewhere on the table. It
+# leaves play when floor lines are cleared and is recreated for the next round.
+TOKEN_STATES = ("setup", "factory_offer", "preparing_next_round")
+
+
+def _holders(game):
+    """Every place a tile can be, with a name for error messages"""
+    yield "bag", game.bag._tiles
+    yield "discard pile", game.discard_pile
+    yield "center", game.board_center._tiles
+    for i, factory in enumerate(game.factories):
+        yield f"factory {i}", factory._tiles
+    for p, player in enumerate(game.players):
+        for i, line in enumerate(player.pattern_lines):
+            yield f"player {p} line {i}", line._tiles
+        yield f"player {p} floor", player.floor_line._tiles
+        yield f"player {p} wall", [t for row in player.wall.grid for t in row if t]
+
+
+def check_invariants(game) -> None:
+    """Raise ``InvariantViolation`` unless tiles are conserved and the boards
+    follow the placement rules"""
+    counts = {tile_type: 0 for tile_type in TileType}
+    n_tokens = 0
+    seen = set()
+    for name, tiles in _holders(game):
+        for tile in tiles:
+            if id(tile) in seen:
+                raise InvariantViolation(f"{tile!r} is in two places, e.g. {name}")
+            seen.add(id(tile))
+            if tile.type == SpecialTileType.TILE_1:
+                n_tokens += 1
+            else:
+                counts[tile.type] += 1
+
+    n_per_type = game.tile_generator.n_tiles_per_type
+    wrong = {t.name: n for t, n in counts.items() if n != n_per_type}
+    if wrong:
+        raise InvariantViolation(
+            f"Expected {n_per_type} tiles of every color, counted {wrong}"
+        )
+    expected_tokens = (1,) if game.current_state.id in TOKEN_STATES else (0, 1)
+    if n_tokens not in expected_tokens:
+        raise InvariantViolation(
+            f"Found {n_tokens} first player tokens in state {game.current_state.id}"
+        )
+
+    for p, player in enumerate(game.players):
+        for i, line in enumerate(player.pattern_lines):
+            types = {tile.type for tile in line._tiles}
+            if len(types) > 1:
+                raise InvariantViolation(
+                    f"Player {p} line {i} mixes {sorted(t.name for t in types)}"
+                )
+            if len(line) > i + 1:
+                raise InvariantViolation(
+                    f"Player {p} line {i} holds {len(line)} tiles, capacity {i + 1}"
+                )
+            if types and player.wall.has_tile_type_in_row(i, *types):
+                raise InvariantViolation(
+                    f"Player {p} line {i} collects a color already on the wall"
+                )
+        floor = player.floor_line
+        n_colored = sum(t.type != SpecialTileType.TILE_1 for t in floor._tiles)
+        if n_colored > floor.max_size:
+            raise InvariantViolation(
+                f"Player {p} floor holds {n_colored} tiles, capacity {floor.max_size}"
+            )
+
+
+class InvariantChecker:
+    """Run ``check_invariants`` on a random fraction ``rate`` of game updates.
+
+    With ``rate`` 1 every update is checked. Otherwise the gap to the next
+    check is drawn from a geometric distribution, so skipped updates cost a
+    counter decrement rather than a random number each.
+    """
+
+    def __init__(self, rate: float = 1.0, seed: int | None = None):
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1]")
+        self.rate = rate
+        self.rng = random.Random(seed)
+        self.n_checks = 0
+        self._countdown = self._draw()
+
+    def _draw(self) -> int:
+        if self.rate >= 1:
+            return 0
+        return int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.rate))
+
+    def tick(self, game) -> None:
+        """Called by the game after every move and phase change"""
+        if self._countdown:
+            self._countdown -= 1
+            return
+        self._countdown = self._draw()
+        self.n_checks += 1
+        check_invariants(game)
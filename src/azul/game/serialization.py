@@ -0,0 +1,198 @@
+import struct
+from azul.board_components import Wall
+from azul.tile import SpecialTileType, TileGenerator, TileType
+from .actions import MAX_FACTORIES, N_COLORS
+from .symmetry import _color_counts
+
+STATE_IDS = [
+    "setup",
+    "factory_offer",
+    "wall_tiling",
+    "preparing_next_round",
+    "game_ended",
+]
+
+# Flags in the header
+TOKEN_TAKEN = 1
+TOKEN_IN_CENTER = 2
+VERBOSE = 4
+
+# Floor byte: colored tile count in the low bits, token flag above
+FLOOR_TOKEN = 16
+
+# players, state, round, current, starting, flags, factories, center, bag, discard
+HEADER = struct.Struct(f"<6B{MAX_FACTORIES}H{3 * N_COLORS}B")
+# pattern lines (color << 3 | count), wall mask, floor, score, floor penalty total
+PLAYER = struct.Struct("<5BIBHh")
+
+
+def encoded_size(num_players: int) -> int:
+    return HEADER.size + num_players * PLAYER.size
+
+
+def _pack_factory(factory) -> int:
+    """Up to four tile colors in 3 bits each, largest first"""
+    packed = 0
+    for value in sorted((tile.type.value for tile in factory._tiles), reverse=True):
+        packed = packed << 3 | value
+    return packed
+
+
+def _unpack_factory(packed: int) -> list[int]:
+    values = []
+    while packed:
+        values.append(packed & 7)
+        packed >>= 3
+    return values
+
+
+def game_to_bytes(game) -> bytes:
+    """Encode a complete position as a fixed-size struct.
+
+    Tile identity, order inside holders and the bag order are not kept;
+    the bag is reshuffled on every draw anyway.
+    """
+    flags = (
+        TOKEN_TAKEN * game.first_player_token_taken
+        | TOKEN_IN_CENTER * game.board_center.contains_onetile()
+        | VERBOSE * game.verbose
+    )
+    factories = [_pack_factory(f) for f in game.factories]
+    factories += [0] * (MAX_FACTORIES - len(factories))
+    parts = [
+        HEADER.pack(
+            game.num_players,
+            STATE_IDS.index(game.current_state.id),
+            game.round_number,
+            game.current_player,
+            game.starting_player,
+            flags,
+            *factories,
+            *_color_counts(game.board_center._tiles),
+            *_color_counts(game.bag._tiles),
+            *_color_counts(game.discard_pile),
+        )
+    ]
+    for player in game.players:
+        lines = [
+            (line._tiles[0].type.value << 3 | len(line)) if line._tiles else 0
+            for line in player.pattern_lines
+        ]
+        floor = player.floor_line._tiles
+        n_colored = sum(tile.type != SpecialTileType.TILE_1 for tile in floor)
+        has_token = n_colored < len(floor)
+        parts.append(
+            PLAYER.pack(
+                *lines,
+                player.wall.mask(),
+                n_colored | FLOOR_TOKEN * has_token,
+                player.score,
+                player.floor_penalty_total,
+            )
+        )
+    return b"".join(parts)
+
+
+def game_from_bytes(
+    cls,
+    data: bytes,
+    seed: int | None = None,
+    check_rate: float | None = None,
+    history: int = 64,
+):
+    """Rebuild a game of class ``cls`` from ``game_to_bytes`` output.
+
+    A freshly set up game supplies the tiles, which are then moved to where
+    the encoding puts them; the counts must add up to the full tile set.
+    The tiles come from a private generator, so rebuilding a game does not
+    use up ids of the shared one.
+    """
+    header = HEADER.unpack_from(data)
+    num_players, state, round_number, current, starting, flags = header[:6]
+    factories = header[6 : 6 + MAX_FACTORIES]
+    counts = header[6 + MAX_FACTORIES :]
+    center, bag, discard = (
+        counts[:N_COLORS],
+        counts[N_COLORS : 2 * N_COLORS],
+        counts[2 * N_COLORS :],
+    )
+    if len(data) != encoded_size(num_players):
+        raise ValueError(
+            f"Expected {encoded_size(num_players)} bytes for {num_players} players, "
+            f"got {len(data)}"
+        )
+
+    game = cls(
+        num_players=num_players,
+        seed=seed,
+        verbose=False,
+        history=history,
+        check_rate=check_rate,
+        tile_generator=TileGenerator(),
+    )
+    pool = {tile_type: [] for tile_type in TileType}
+    for tile in game.bag._tiles:
+        pool[tile.type].append(tile)
+    game.bag._tiles.clear()
+    token = game.board_center._tiles[0]
+    game.board_center._tiles.clear()
+
+    def take(value: int, n: int = 1):
+        tiles = pool[TileType(value)]
+        if len(tiles) < n:
+            raise ValueError(
+                f"Encoding uses more than the available {TileType(value).name} tiles"
+            )
+        return [tiles.pop() for _ in range(n)]
+
+    for factory, packed in zip(game.factories, factories):
+        for value in _unpack_factory(packed):
+            factory.extend(take(value))
+    for value, n in enumerate(center, start=1):
+        game.board_center.extend(take(value, n))
+    if flags & TOKEN_IN_CENTER:
+        game.board_center.append(token)
+    for value, n in enumerate(discard, start=1):
+        game.discard_pile.extend(take(value, n))
+
+    floor_counts = []
+    for i, player in enumerate(game.players):
+        *lines, wall_mask, floor, score, penalty_total = PLAYER.unpack_from(
+            data, HEADER.size + i * PLAYER.size
+        )
+        for line, packed in zip(player.pattern_lines, lines):
+            if packed:
+                line.extend(take(packed >> 3, packed & 7))
+        for r in range(5):
+            for c in range(5):
+                if wall_mask >> (5 * r + c) & 1:
+                    player.wall.grid[r][c] = take(Wall.WALL_PATTERN[r][c].value)[0]
+        player.wall.revision += 1
+        if floor & FLOOR_TOKEN:
+            player.floor_line.append(token)
+        floor_counts.append(floor & (FLOOR_TOKEN - 1))
+        player.score = score
+        player.floor_penalty_total = penalty_total
+
+    for value, n in enumerate(bag, start=1):
+        game.bag.extend(take(value, n))
+
+    # Floor lines get the remaining tiles; only their count per player matters
+    # for scoring, all of them end up in the discard pile together
+    leftover = [tile for tiles in pool.values() for tile in tiles]
+    if len(leftover) != sum(floor_counts):
+        raise ValueError(
+            f"Encoding accounts for {sum(floor_counts)} floor tile(s), "
+            f"but {len(leftover)} tile(s) are left over"
+        )
+    for player, n in zip(game.players, floor_counts):
+        player.floor_line.extend(leftover[:n])
+        leftover = leftover[n:]
+
+    game.round_number = round_number
+    game.current_player = current
+    game.starting_player = starting
+    game.first_player_token_taken = bool(flags & TOKEN_TAKEN)
+    game.verbose = bool(flags & VERBOSE)
+    game.current_state_value = STATE_IDS[state]
+    return game
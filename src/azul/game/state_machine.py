@@ -1,3 +1,4 @@
+import random
 from statemachine import StateMachine, State
 from azul.board_components import (
     Tileholder,
@@ -9,7 +10,16 @@ from azul.board_components import (
     StagingLine,
     Wall,
 )
-from azul.tile import Tile, get_tile_generator, TileType, SpecialTileType
+from azul.tile import (
+    Tile,
+    TileGenerator,
+    get_tile_generator,
+    TileType,
+    SpecialTileType,
+)
+from .changes import ChangeTracker
+from .flight_recorder import FlightRecorder
+from .invariants import InvariantChecker
 
 
 class AzulGame(StateMachine):
@@ -30,11 +40,32 @@ class AzulGame(StateMachine):
     ) | wall_tiling.to(preparing_next_round, unless="game_should_end")
     start_next_round = preparing_next_round.to(factory_offer)
 
-    def __init__(self, num_players: int = 2, seed: int = 42):
+    DEFAULT_CHECK_RATE = 0.0  # used when a game is created without check_rate
+
+    def __init__(
+        self,
+        num_players: int = 2,
+        seed: int = 42,
+        verbose: bool = True,
+        history: int = 64,
+        check_rate: float | None = None,
+        tile_generator: TileGenerator | None = None,
+    ):
         if num_players < 2 or num_players > 4:
             raise ValueError("Number of players must be between 2 and 4")
 
         self.num_players = num_players
+        self.verbose = verbose
+        self.rng = random.Random(seed)
+        # Last ``history`` moves for post-mortem dumps, None when disabled
+        self.recorder = FlightRecorder(self, history) if history else None
+        # Fraction of updates verified by check_invariants: 1 in debug runs,
+        # small in production, 0 to disable
+        if check_rate is None:
+            check_rate = self.DEFAULT_CHECK_RATE
+        self.invariants = InvariantChecker(check_rate) if check_rate else None
+        # Set by incremental consumers such as IncrementalEncoder
+        self.changes: ChangeTracker | None = None
         self.current_player = 0
         self.starting_player = 0
         self.round_number = 1
@@ -50,11 +81,46 @@ class AzulGame(StateMachine):
         self.first_player_token_taken = False
         self.tiles_available = True
 
-        # Initialize tile generator
-        self.tile_generator = get_tile_generator()
+        # Initialize tile generator, shared between games unless one is given
+        self.tile_generator = tile_generator or get_tile_generator()
 
         super().__init__()
 
+    def to_bytes(self) -> bytes:
+        """Compact fixed-size encoding of the complete position"""
+        from .serialization import game_to_bytes
+
+        return game_to_bytes(self)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        seed: int | None = None,
+        check_rate: float | None = None,
+        history: int = 64,
+    ) -> "AzulGame":
+        """Rebuild a game from ``to_bytes`` output, with a freshly seeded bag"""
+        from .serialization import game_from_bytes
+
+        return game_from_bytes(cls, data, seed, check_rate, history)
+
+    def __reduce__(self):
+        # Pickle (and copy) through the compact encoding, not the object graph.
+        # The copy's bag is seeded from this game's rng state, so copies of one
+        # position draw the same refills; recorded moves are not carried over
+        return type(self).from_bytes, (
+            self.to_bytes(),
+            hash(self.rng.getstate()) & 0xFFFFFFFF,
+            self.invariants.rate if self.invariants is not None else 0,
+            self.recorder.capacity if self.recorder is not None else 0,
+        )
+
+    def log(self, message: str):
+        """Print game progress unless running headless"""
+        if self.verbose:
+            print(message)
+
     def game_should_end(self) -> bool:
         """Check if game should end"""
         return any(player.has_completed_horizontal_line() for player in self.players)
@@ -70,13 +136,13 @@ class AzulGame(StateMachine):
 
         # Create bag with game tiles
         game_tiles = self.tile_generator.create_game_tiles()
-        self.bag = Bag(game_tiles)
+        self.bag = Bag(game_tiles, self.rng)
 
         # Add special tile to center
         special_tile = self.tile_generator.create_game_special_tile()
         self.board_center.extend([special_tile])
 
-        print(f"Game setup complete for {self.num_players} players")
+        self.log(f"Game setup complete for {self.num_players} players")
 
     def on_enter_factory_offer(self):
         """Fill factories and prepare for tile selection"""
@@ -87,8 +153,15 @@ class AzulGame(StateMachine):
         self.first_player_token_taken = False
         self.tiles_available = True
 
-        print(f"Round {self.round_number}: Factory Offer phase started")
-        print(f"Player {self.current_player + 1} starts")
+        if self.recorder is not None:
+            self.recorder.snapshot()
+        if self.invariants is not None:
+            self.invariants.tick(self)
+        if self.changes is not None:
+            self.changes.everything = True
+
+        self.log(f"Round {self.round_number}: Factory Offer phase started")
+        self.log(f"Player {self.current_player + 1} starts")
 
     def fill_factories(self):
         """Fill all factories with tiles from bag"""
@@ -96,22 +169,14 @@ class AzulGame(StateMachine):
             # FIXED: Clear factory before filling (in case of leftover tiles)
             factory._tiles.clear()
 
-            if len(self.bag) >= 4:
-                tiles = self.bag.pop_random(4)
-                factory.extend(tiles)
-            elif len(self.bag) > 0:
-                # Use remaining tiles from bag
-                remaining = self.bag.pop_random(len(self.bag))
-                factory.extend(remaining)
-
-                # Refill bag from discard pile if needed
-                if self.discard_pile and len(factory) < 4:
-                    self.bag.extend(self.discard_pile)
-                    self.discard_pile.clear()
-                    needed = 4 - len(factory)
-                    if len(self.bag) >= needed:
-                        additional = self.bag.pop_random(needed)
-                        factory.extend(additional)
+            # Refill bag from discard pile once it runs short
+            if len(self.bag) < 4 and self.discard_pile:
+                factory.extend(self.bag.pop_random(len(self.bag)))
+                self.bag.extend(self.discard_pile)
+                self.discard_pile.clear()
+
+            needed = 4 - len(factory)
+            factory.extend(self.bag.pop_random(min(needed, len(self.bag))))
 
     def take_tiles_from_factory(
         self, factory_index: int, tile_type: TileType
@@ -126,20 +191,27 @@ class AzulGame(StateMachine):
 
         factory._tiles.clear()
         self.board_center.extend(remaining_tiles)
+        if self.changes is not None:
+            self.changes.factories.add(factory_index)
+            self.changes.center = True
 
         return taken_tiles
 
     def take_tiles_from_center(self, tile_type: TileType) -> list[Tile]:
         """Take all tiles of specific type from center"""
+        # The first player token goes along with the first tiles taken from center
+        taken_types = (tile_type, SpecialTileType.TILE_1)
         taken_tiles = [
-            tile for tile in self.board_center._tiles if tile.type == tile_type
+            tile for tile in self.board_center._tiles if tile.type in taken_types
         ]
         remaining_tiles = [
-            tile for tile in self.board_center._tiles if tile.type != tile_type
+            tile for tile in self.board_center._tiles if tile.type not in taken_types
         ]
 
         self.board_center._tiles.clear()
         self.board_center.extend(remaining_tiles)
+        if self.changes is not None:
+            self.changes.center = True
 
         # Handle first player token
         if not self.first_player_token_taken:
@@ -151,6 +223,8 @@ class AzulGame(StateMachine):
                 self.first_player_token_taken = True
                 # Add to floor line
                 self.players[self.current_player].floor_line.extend(special_tiles)
+                if self.changes is not None:
+                    self.changes.players.add(self.current_player)
                 taken_tiles = [
                     tile for tile in taken_tiles if tile.type != SpecialTileType.TILE_1
                 ]
@@ -162,6 +236,8 @@ class AzulGame(StateMachine):
     ):
         """Place tiles on player's pattern line"""
         player = self.players[player_index]
+        if self.changes is not None:
+            self.changes.players.add(player_index)
 
         if pattern_line_index < 0 or pattern_line_index >= 5:
             # All tiles go to floor line
@@ -205,7 +281,9 @@ class AzulGame(StateMachine):
 
     def on_enter_wall_tiling(self):
         """Wall-tiling phase: move tiles from pattern lines to wall"""
-        print("Wall-tiling phase started")
+        self.log("Wall-tiling phase started")
+        if self.changes is not None:
+            self.changes.everything = True
 
         for player in self.players:
             points_scored = 0
@@ -225,15 +303,18 @@ class AzulGame(StateMachine):
             # Apply floor line penalties
             penalty = player.floor_line.calculate_penalty()
             points_scored += penalty  # penalty is negative
+            player.floor_penalty_total += penalty
 
             # Update score (minimum 0)
             player.score = max(0, player.score + points_scored)
 
-            # Clear floor line
-            self.discard_pile.extend(player.floor_line._tiles)
+            # Clear floor line (the first player token is recreated next round)
+            self.discard_pile.extend(
+                t for t in player.floor_line._tiles if t.type != SpecialTileType.TILE_1
+            )
             player.floor_line._tiles.clear()
 
-            print(
+            self.log(
                 f"Player {player.player_id + 1} scored {points_scored} points (total: {player.score})"
             )
 
@@ -255,44 +336,31 @@ class AzulGame(StateMachine):
         self.board_center._tiles.clear()
         self.board_center.extend(special_tiles)
 
-        print(f"Preparing round {self.round_number}")
+        if self.invariants is not None:
+            self.invariants.tick(self)
+        if self.changes is not None:
+            self.changes.everything = True
+
+        self.log(f"Preparing round {self.round_number}")
 
     def on_enter_game_ended(self):
         """Calculate final scores and determine winner"""
-        print("Game ended! Calculating final scores...")
+        self.log("Game ended! Calculating final scores...")
+        if self.changes is not None:
+            self.changes.everything = True
 
         for player in self.players:
-            bonus_points = 0
-
-            # Bonus for complete horizontal lines (2 points each)
-            for row in player.wall.grid:
-                if all(tile is not None for tile in row):
-                    bonus_points += 2
-
-            # Bonus for complete vertical lines (7 points each)
-            for col in range(5):
-                if all(player.wall.grid[row][col] is not None for row in range(5)):
-                    bonus_points += 7
-
-            # Bonus for complete color sets (10 points each)
-            for tile_type in TileType:
-                type_count = sum(
-                    1
-                    for row in player.wall.grid
-                    for tile in row
-                    if tile and tile.type == tile_type
-                )
-                if type_count == 5:
-                    bonus_points += 10
+            # 2 points per complete row, 7 per column, 10 per complete color
+            bonus_points = player.wall.end_game_bonus()
 
             player.score += bonus_points
-            print(
+            self.log(
                 f"Player {player.player_id + 1}: {player.score} points (bonus: {bonus_points})"
             )
 
         # Determine winner
         winner = max(self.players, key=lambda p: p.score)
-        print(f"Player {winner.player_id + 1} wins with {winner.score} points!")
+        self.log(f"Player {winner.player_id + 1} wins with {winner.score} points!")
 
     # Player action methods
     def player_take_from_factory(
@@ -302,6 +370,9 @@ class AzulGame(StateMachine):
         if not self.current_state == self.factory_offer:
             raise ValueError("Not in factory offer phase")
 
+        if self.recorder is not None:
+            self.recorder.record_move(factory_index, tile_type, pattern_line_index)
+
         tiles = self.take_tiles_from_factory(factory_index, tile_type)
         self.place_tiles_on_player_board(self.current_player, tiles, pattern_line_index)
 
@@ -310,11 +381,19 @@ class AzulGame(StateMachine):
         if not self.check_tiles_available():
             self.complete_factory_phase()
 
+        if self.recorder is not None:
+            self.recorder.after_move()
+        if self.invariants is not None:
+            self.invariants.tick(self)
+
     def player_take_from_center(self, tile_type: TileType, pattern_line_index: int):
         """Player takes tiles from center"""
         if not self.current_state == self.factory_offer:
             raise ValueError("Not in factory offer phase")
 
+        if self.recorder is not None:
+            self.recorder.record_move(-1, tile_type, pattern_line_index)
+
         tiles = self.take_tiles_from_center(tile_type)
         self.place_tiles_on_player_board(self.current_player, tiles, pattern_line_index)
 
@@ -322,3 +401,8 @@ class AzulGame(StateMachine):
 
         if not self.check_tiles_available():
             self.complete_factory_phase()
+
+        if self.recorder is not None:
+            self.recorder.after_move()
+        if self.invariants is not None:
+            self.invariants.tick(self)
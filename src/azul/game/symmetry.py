@@ -0,0 +1,96 @@
+from azul.tile import TileType, SpecialTileType
+from .actions import Action, CENTER
+from .state_machine import AzulGame
+
+
+def _color_counts(tiles) -> tuple[int, ...]:
+    counts = [0] * len(TileType)
+    for tile in tiles:
+        if tile.type != SpecialTileType.TILE_1:
+            counts[tile.type.value - 1] += 1
+    return tuple(counts)
+
+
+def factory_key(factory) -> tuple[int, ...]:
+    """Order-independent description of a factory's contents"""
+    return tuple(sorted(tile.type.value for tile in factory._tiles))
+
+
+def player_key(player) -> tuple:
+    """Hashable description of a player board"""
+    lines = tuple(
+        (line._tiles[0].type.value if line._tiles else 0, len(line))
+        for line in player.pattern_lines
+    )
+    floor = player.floor_line._tiles
+    has_token = any(t.type == SpecialTileType.TILE_1 for t in floor)
+    return lines, player.wall.mask(), len(floor), has_token, player.score
+
+
+class CanonicalForm:
+    """Canonical description of a position under factory and seat symmetry.
+
+    ``factory_order[k]`` is the original index of the factory in canonical
+    slot ``k`` and ``player_order[k]`` the original index of the player in
+    canonical seat ``k``.
+    """
+
+    def __init__(self, key: tuple, factory_order: list[int], player_order: list[int]):
+        self.key = key
+        self.factory_order = factory_order
+        self.player_order = player_order
+        self._factory_slot = {f: k for k, f in enumerate(factory_order)}
+
+    def __eq__(self, other: "CanonicalForm") -> bool:
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def to_canonical(self, action: Action) -> Action:
+        """Map an action in the original game to the canonical game"""
+        if action.source == CENTER:
+            return action
+        return action._replace(source=self._factory_slot[action.source])
+
+    def from_canonical(self, action: Action) -> Action:
+        """Map an action in the canonical game back to the original game"""
+        if action.source == CENTER:
+            return action
+        return action._replace(source=self.factory_order[action.source])
+
+    def to_canonical_player(self, player_index: int) -> int:
+        return self.player_order.index(player_index)
+
+    def from_canonical_player(self, seat: int) -> int:
+        return self.player_order[seat]
+
+
+def canonicalize(game: AzulGame, rotate_players: bool = True) -> CanonicalForm:
+    """Canonical form of a game position.
+
+    Factories are sorted by their contents, so positions that only differ in
+    factory order share a key. With ``rotate_players`` seats are rotated so
+    that the player to move is seat 0, which also identifies positions that
+    differ by a rotation of the player order.
+    """
+    factory_keys = [factory_key(f) for f in game.factories]
+    factory_order = sorted(range(len(factory_keys)), key=factory_keys.__getitem__)
+
+    n = game.num_players
+    first = game.current_player if rotate_players else 0
+    player_order = [(first + k) % n for k in range(n)]
+
+    key = (
+        game.current_state.id,
+        game.round_number,
+        tuple(factory_keys[f] for f in factory_order),
+        _color_counts(game.board_center._tiles),
+        game.board_center.contains_onetile(),
+        _color_counts(game.discard_pile),
+        (game.current_player - first) % n,
+        (game.starting_player - first) % n,
+        game.first_player_token_taken,
+        tuple(player_key(game.players[p]) for p in player_order),
+    )
+    return CanonicalForm(key, factory_order, player_order)
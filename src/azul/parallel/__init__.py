@@ -0,0 +1 @@
+from .shm_ring import RingSpec, SharedMemoryTransport, TransitionRing
@@ -0,0 +1,148 @@
+from multiprocessing import shared_memory
+from typing import NamedTuple
+import numpy as np
+
+HEADER_SIZE = 64  # head and tail counters, padded so records stay aligned
+
+
+def transition_dtype(obs_size: int, n_actions: int) -> np.dtype:
+    """Fixed-size record layout for one transition"""
+    return np.dtype(
+        [
+            ("obs", np.float32, (obs_size,)),
+            ("mask", np.bool_, (n_actions,)),
+            ("action", np.int32),
+            ("reward", np.float32),
+            ("done", np.bool_),
+        ]
+    )
+
+
+class RingSpec(NamedTuple):
+    """Everything a worker needs to attach to an existing ring"""
+
+    name: str
+    capacity: int
+    obs_size: int
+    n_actions: int
+
+
+class TransitionRing:
+    """Single-producer/single-consumer ring of transitions in shared memory.
+
+    The producer only writes ``head`` and the consumer only writes ``tail``;
+    both are monotonically increasing counters, so no lock is needed. A record
+    is written completely before ``head`` is advanced past it.
+    """
+
+    def __init__(self, spec: RingSpec, shm: shared_memory.SharedMemory):
+        self.spec = spec
+        self._shm = shm
+        self._counters = np.ndarray((2,), dtype=np.int64, buffer=shm.buf)
+        self._records = np.ndarray(
+            (spec.capacity,),
+            dtype=transition_dtype(spec.obs_size, spec.n_actions),
+            buffer=shm.buf,
+            offset=HEADER_SIZE,
+        )
+
+    @classmethod
+    def create(cls, capacity: int, obs_size: int, n_actions: int) -> "TransitionRing":
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, but {capacity} given.")
+        size = HEADER_SIZE + capacity * transition_dtype(obs_size, n_actions).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        ring = cls(RingSpec(shm.name, capacity, obs_size, n_actions), shm)
+        ring._counters[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, spec: RingSpec) -> "TransitionRing":
+        return cls(spec, shared_memory.SharedMemory(name=spec.name))
+
+    def __len__(self):
+        head, tail = self._counters
+        return int(head - tail)
+
+    def push(
+        self,
+        obs: np.ndarray,
+        mask: np.ndarray,
+        action: int,
+        reward: float,
+        done: bool,
+    ) -> bool:
+        """Append a transition; returns False without writing if the ring is full"""
+        head, tail = self._counters
+        if head - tail >= self.spec.capacity:
+            return False
+        record = self._records[head % self.spec.capacity]
+        record["obs"] = obs
+        record["mask"] = mask
+        record["action"] = action
+        record["reward"] = reward
+        record["done"] = done
+        self._counters[0] = head + 1
+        return True
+
+    def pop_batch(self, max_n: int | None = None) -> np.ndarray:
+        """Remove and return up to ``max_n`` transitions as a record array copy"""
+        head, tail = self._counters
+        n = int(head - tail) if max_n is None else min(int(head - tail), max_n)
+        start = int(tail % self.spec.capacity)
+        first = min(n, self.spec.capacity - start)
+        batch = np.concatenate(
+            [self._records[start : start + first], self._records[: n - first]]
+        )
+        self._counters[1] = tail + n
+        return batch
+
+    def close(self) -> None:
+        del self._counters, self._records
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+class SharedMemoryTransport:
+    """Collect transitions from many worker processes into one consumer.
+
+    The consumer creates one ring per worker and hands ``specs[i]`` to worker
+    ``i``, which attaches with ``TransitionRing.attach``. Records are copied
+    straight into shared memory, so nothing is pickled on the hot path.
+    """
+
+    def __init__(self, n_workers: int, capacity: int, obs_size: int, n_actions: int):
+        self.rings = [
+            TransitionRing.create(capacity, obs_size, n_actions)
+            for _ in range(n_workers)
+        ]
+        self._next = 0
+
+    @property
+    def specs(self) -> list[RingSpec]:
+        return [ring.spec for ring in self.rings]
+
+    def __len__(self):
+        return sum(len(ring) for ring in self.rings)
+
+    def drain(self, max_n: int | None = None) -> np.ndarray:
+        """Pop up to ``max_n`` transitions, visiting workers round-robin"""
+        batches = []
+        remaining = max_n
+        for k in range(len(self.rings)):
+            ring = self.rings[(self._next + k) % len(self.rings)]
+            batch = ring.pop_batch(remaining)
+            batches.append(batch)
+            if remaining is not None:
+                remaining -= len(batch)
+                if remaining == 0:
+                    break
+        self._next = (self._next + 1) % len(self.rings)
+        return np.concatenate(batches)
+
+    def close(self) -> None:
+        for ring in self.rings:
+            ring.close()
+            ring.unlink()
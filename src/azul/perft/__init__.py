@@ -0,0 +1 @@
+from .perft import divide, opening, perft
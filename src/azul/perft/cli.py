@@ -0,0 +1,44 @@
+import argparse
+import time
+from azul.game.actions import FLOOR
+from .perft import divide, opening, perft
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-perft",
+        description="Count move sequences from the opening to a fixed depth",
+    )
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--divide", action="store_true", help="print counts per first move"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    game = opening(args.players, args.seed)
+
+    start = time.perf_counter()
+    if args.divide:
+        counts = divide(game, args.depth)
+        for action, n in counts.items():
+            source = "center" if action.source < 0 else f"factory {action.source}"
+            line = "floor" if action.line == FLOOR else f"line {action.line + 1}"
+            print(f"{source} {action.tile_type.name} -> {line}: {n}")
+        nodes = sum(counts.values())
+    else:
+        nodes = perft(game, args.depth)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"perft({args.depth}) seed {args.seed}, {args.players} players: {nodes} "
+        f"nodes in {elapsed:.2f}s ({nodes / max(elapsed, 1e-9):.0f} nodes/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
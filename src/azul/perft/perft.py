@@ -0,0 +1,44 @@
+import copy
+from azul.game.actions import Action, advance, apply_action, legal_actions
+from azul.game.state_machine import AzulGame
+
+
+def perft(game: AzulGame, depth: int) -> int:
+    """Number of move sequences of length ``depth`` in the factory offer phase.
+
+    Positions where the round has ended have no moves and only count when
+    reached at exactly ``depth``. The last ply is bulk-counted from the move
+    list instead of being played.
+    """
+    if depth < 0:
+        raise ValueError(f"depth must be non-negative, got {depth}")
+    if depth == 0:
+        return 1
+    actions = legal_actions(game)
+    if depth == 1:
+        return len(actions)
+    nodes = 0
+    for action in actions:
+        child = copy.deepcopy(game)
+        apply_action(child, action)
+        nodes += perft(child, depth - 1)
+    return nodes
+
+
+def divide(game: AzulGame, depth: int) -> dict[Action, int]:
+    """Perft per first move, for narrowing down a mismatching count"""
+    if depth < 1:
+        raise ValueError(f"divide needs depth of at least 1, got {depth}")
+    counts = {}
+    for action in legal_actions(game):
+        child = copy.deepcopy(game)
+        apply_action(child, action)
+        counts[action] = perft(child, depth - 1)
+    return counts
+
+
+def opening(num_players: int = 2, seed: int = 0) -> AzulGame:
+    """Start of the first round for a seed"""
+    game = AzulGame(num_players=num_players, seed=seed, verbose=False)
+    advance(game)
+    return game
@@ -0,0 +1,9 @@
+from azul.board_components.features import FLOOR_PENALTY
+from .kernel import (
+    WALL_COLOR,
+    WALL_COLUMN,
+    PlacementScores,
+    end_game_bonus,
+    placement_points,
+    score_placements,
+)
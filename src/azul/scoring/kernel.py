@@ -0,0 +1,107 @@
+from typing import NamedTuple
+import numpy as np
+from azul.board_components import Wall
+from azul.tile import TileType
+
+# WALL_COLUMN[row, color] is the wall column of a color (TileType.value - 1)
+WALL_COLUMN = np.array(
+    [[Wall.WALL_PATTERN[row].index(t) for t in TileType] for row in range(5)]
+)
+# WALL_COLOR[row, col] is the color (TileType.value - 1) of a wall cell
+WALL_COLOR = np.array([[t.value - 1 for t in row] for row in Wall.WALL_PATTERN])
+
+BITS = 1 << np.arange(5)
+FULL = 31  # all five bits of a row or column
+
+
+def _neighbour_runs() -> np.ndarray:
+    """RUN[mask, i] counts the filled cells touching position ``i`` in a
+    5-cell line whose filled cells are the bits of ``mask``, both ways"""
+    runs = np.zeros((32, 5), dtype=np.int64)
+    for mask in range(32):
+        for i in range(5):
+            n = 0
+            for j in range(i - 1, -1, -1):
+                if not mask >> j & 1:
+                    break
+                n += 1
+            for j in range(i + 1, 5):
+                if not mask >> j & 1:
+                    break
+                n += 1
+            runs[mask, i] = n
+    return runs
+
+
+RUN = _neighbour_runs()
+
+
+class PlacementScores(NamedTuple):
+    points: np.ndarray  # Wall.calculate_points of each candidate
+    bonus: np.ndarray  # end-game bonus of the wall with the candidate placed
+
+
+def line_masks(walls: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Bit masks of the filled cells in every row and every column"""
+    filled = walls.astype(np.int64)
+    return filled @ BITS, np.swapaxes(filled, -1, -2) @ BITS
+
+
+def _points(horizontal: np.ndarray, vertical: np.ndarray) -> np.ndarray:
+    """Scoring rule for runs of neighbours, each excluding the placed tile"""
+    return (
+        np.where(horizontal > 0, horizontal + 1, 0)
+        + np.where(vertical > 0, vertical + 1, 0)
+        + ((horizontal == 0) & (vertical == 0))
+    )
+
+
+def placement_points(walls: np.ndarray) -> np.ndarray:
+    """``Wall.calculate_points`` for every cell of a batch of (5, 5) walls"""
+    rows, cols = line_masks(walls)
+    index = np.arange(5)
+    horizontal = RUN[rows[..., :, None], index]
+    vertical = RUN[cols[..., None, :], index[:, None]]
+    return _points(horizontal, vertical)
+
+
+def end_game_bonus(walls: np.ndarray) -> np.ndarray:
+    """``Wall.end_game_bonus`` of a batch of (5, 5) walls"""
+    rows, cols = line_masks(walls)
+    colors = _wall_color_counts(walls)
+    return (
+        Wall.ROW_BONUS * (rows == FULL).sum(axis=-1)
+        + Wall.COLUMN_BONUS * (cols == FULL).sum(axis=-1)
+        + Wall.COLOR_BONUS * (colors == 5).sum(axis=-1)
+    )
+
+
+def _wall_color_counts(walls: np.ndarray) -> np.ndarray:
+    """Tiles of each color on a batch of walls, shaped (..., color)"""
+    filled = walls.reshape(*walls.shape[:-2], 25).astype(np.int64)
+    return filled @ np.eye(5, dtype=np.int64)[WALL_COLOR.reshape(25)]
+
+
+def score_placements(
+    walls: np.ndarray, rows: np.ndarray, cols: np.ndarray
+) -> PlacementScores:
+    """Score candidate placements on a batch of walls in one call.
+
+    ``walls`` is shaped (batch, 5, 5); ``rows`` and ``cols`` are (batch, k)
+    cell coordinates, each candidate placed on its own, on empty cells.
+    """
+    row_masks, col_masks = line_masks(walls)
+    rows, cols = np.asarray(rows), np.asarray(cols)
+    row_bits = np.take_along_axis(row_masks, rows, axis=-1)
+    col_bits = np.take_along_axis(col_masks, cols, axis=-1)
+    points = _points(RUN[row_bits, cols], RUN[col_bits, rows])
+
+    color_counts = np.take_along_axis(
+        _wall_color_counts(walls), WALL_COLOR[rows, cols], axis=-1
+    )
+    bonus = end_game_bonus(walls)[..., None] + (
+        Wall.ROW_BONUS * (row_bits | BITS[cols] == FULL) * (row_bits != FULL)
+        + Wall.COLUMN_BONUS * (col_bits | BITS[rows] == FULL) * (col_bits != FULL)
+        + Wall.COLOR_BONUS * (color_counts == 4)
+    )
+    return PlacementScores(points, bonus)
@@ -0,0 +1,8 @@
+from .expectimax import (
+    ExpectimaxAgent,
+    SearchResult,
+    SearchTimeout,
+    evaluate,
+    projected_score,
+)
+from .mcts import MCTSAgent, MCTSResult
@@ -0,0 +1,220 @@
+import copy
+import time
+import zlib
+from typing import NamedTuple
+from azul.board_components import PlayerBoard
+from azul.game.actions import (
+    CENTER,
+    FLOOR,
+    Action,
+    action_to_index,
+    advance,
+    apply_action,
+    is_game_over,
+    legal_actions,
+)
+from azul.game.state_machine import AzulGame
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search once the move's time budget is spent"""
+
+
+class SearchResult(NamedTuple):
+    action: Action
+    value: float
+    depth: int  # deepest fully searched iteration, 0 if none finished
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / max(self.elapsed, 1e-9)
+
+
+def projected_score(player: PlayerBoard, partial_weight: float = 0.5) -> float:
+    """Score after the coming wall tiling, with partial lines counted in part"""
+    features = player.features
+    projected = player.score + features.floor_penalty()
+    for row, line in enumerate(player.pattern_lines):
+        if not line._tiles:
+            continue
+        points = features.line_points(row)
+        if line.is_complete():
+            projected += points
+        else:
+            projected += partial_weight * points * len(line) / (row + 1)
+    return projected
+
+
+def evaluate(game: AzulGame, partial_weight: float = 0.5) -> list[float]:
+    """Value of a position for every seat: own projection minus best opponent"""
+    if is_game_over(game):
+        scores = [float(p.score) for p in game.players]
+    else:
+        scores = [projected_score(p, partial_weight) for p in game.players]
+    return [
+        s - max(scores[:seat] + scores[seat + 1 :]) for seat, s in enumerate(scores)
+    ]
+
+
+def static_order_key(game: AzulGame, action: Action) -> float:
+    """Cheap guess at a move's quality: tiles kept on the lines minus the floor"""
+    holder = (
+        game.board_center if action.source == CENTER else game.factories[action.source]
+    )
+    n = sum(tile.type == action.tile_type for tile in holder._tiles)
+    if action.source == CENTER and holder.contains_onetile():
+        n_floor = 1
+    else:
+        n_floor = 0
+    if action.line == FLOOR:
+        return -(n + n_floor)
+    line = game.players[game.current_player].pattern_lines[action.line]
+    space = action.line + 1 - len(line)
+    placed = min(n, space)
+    completes = placed == space
+    return placed + completes - 1.5 * (n - placed + n_floor)
+
+
+class ExpectimaxAgent:
+    """Anytime expectimax over the moves of a game under a wall-clock budget.
+
+    Searches depth 1, 2, ... until ``time_budget`` seconds or ``max_nodes``
+    nodes are spent and keeps the best move of the deepest iteration. Each
+    player maximizes their own ``evaluate`` component (max-n), and the
+    factory refill at a round boundary is a chance node averaged over
+    ``chance_samples`` draws from the bag. Below the root only the ``width``
+    best moves are searched, ordered by the previous iteration or, for new
+    positions, statically.
+    """
+
+    def __init__(
+        self,
+        time_budget: float = 1.0,
+        max_depth: int = 64,
+        chance_samples: int = 4,
+        width: int | None = 8,
+        partial_weight: float = 0.5,
+        seed: int = 0,
+        max_nodes: int | None = None,
+    ):
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.chance_samples = chance_samples
+        self.width = width
+        self.partial_weight = partial_weight
+        self.seed = seed
+        self.max_nodes = max_nodes
+        self.last_result: SearchResult | None = None
+        self._deadline = 0.0
+        self._nodes = 0
+        # Position -> moves ordered best first by the last iteration
+        self._order: dict[bytes, list[Action]] = {}
+
+    def choose(self, game: AzulGame) -> Action:
+        return self.search(game).action
+
+    def act_positions(self, games: list[AzulGame]) -> list[int]:
+        return [action_to_index(self.choose(game)) for game in games]
+
+    def search(self, game: AzulGame) -> SearchResult:
+        start = time.perf_counter()
+        self._deadline = start + self.time_budget
+        self._nodes = 0
+        self._order.clear()
+
+        root = game.to_bytes()
+        actions = self._ordered(game, root)
+        if not actions:
+            raise ValueError("No legal moves in this position")
+        best, best_value, depth = actions[0], float("-inf"), 0
+
+        for iteration in range(1, self.max_depth + 1):
+            values: dict[Action, float] = {}
+            try:
+                for action in actions:
+                    values[action] = self._child_values(game, action, iteration - 1)[
+                        game.current_player
+                    ]
+            except SearchTimeout:
+                pass
+            if values:
+                # Moves are searched best first, so a cut-off iteration has
+                # still compared its candidates against the previous best
+                action = max(values, key=values.__getitem__)
+                best, best_value = action, values[action]
+            if len(values) < len(actions):
+                break
+            depth = iteration
+            actions = sorted(actions, key=values.__getitem__, reverse=True)
+            self._order[root] = actions
+            if self._exhausted():
+                break
+
+        self.last_result = SearchResult(
+            best, best_value, depth, self._nodes, time.perf_counter() - start
+        )
+        return self.last_result
+
+    def _ordered(self, game: AzulGame, key: bytes) -> list[Action]:
+        if key in self._order:
+            return self._order[key]
+        actions = legal_actions(game)
+        actions.sort(key=lambda a: static_order_key(game, a), reverse=True)
+        return actions
+
+    def _exhausted(self) -> bool:
+        return time.perf_counter() >= self._deadline or (
+            self.max_nodes is not None and self._nodes >= self.max_nodes
+        )
+
+    def _tick(self) -> None:
+        self._nodes += 1
+        if self._exhausted():
+            raise SearchTimeout
+
+    def _child_values(self, game: AzulGame, action: Action, depth: int) -> list[float]:
+        child = copy.deepcopy(game)
+        child.verbose = False
+        apply_action(child, action)
+        if child.current_state == child.wall_tiling:
+            child.complete_wall_tiling()
+            if is_game_over(child):
+                self._tick()
+                return evaluate(child, self.partial_weight)
+            return self._chance(child, depth)
+        return self._value(child, depth)
+
+    def _chance(self, game: AzulGame, depth: int) -> list[float]:
+        """Average over factory refills; ``game`` is between rounds"""
+        self._tick()
+        if depth == 0:
+            return evaluate(game, self.partial_weight)
+        data = game.to_bytes()
+        base = zlib.crc32(data) ^ self.seed
+        total = [0.0] * game.num_players
+        for k in range(self.chance_samples):
+            sample = AzulGame.from_bytes(data, seed=base + k)
+            advance(sample)
+            values = (
+                evaluate(sample, self.partial_weight)
+                if is_game_over(sample)
+                else self._value(sample, depth)
+            )
+            total = [t + v for t, v in zip(total, values)]
+        return [t / self.chance_samples for t in total]
+
+    def _value(self, game: AzulGame, depth: int) -> list[float]:
+        """Max-n value of a position where the current player is to move"""
+        self._tick()
+        if depth == 0:
+            return evaluate(game, self.partial_weight)
+        key = game.to_bytes()
+        ordered = self._ordered(game, key)
+        n = len(ordered) if self.width is None else self.width
+        mover = game.current_player
+        scored = [(self._child_values(game, a, depth - 1), a) for a in ordered[:n]]
+        scored.sort(key=lambda item: item[0][mover], reverse=True)
+        self._order[key] = [a for _, a in scored] + ordered[n:]
+        return scored[0][0]
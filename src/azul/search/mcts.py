@@ -0,0 +1,239 @@
+import math
+import random
+import time
+import zlib
+from typing import Callable, NamedTuple
+import numpy as np
+from azul.agents.heuristic import HeuristicEvaluator
+from azul.encoding import ObservationEncoder
+from azul.game.actions import (
+    Action,
+    action_to_index,
+    advance,
+    apply_action,
+    index_to_action,
+    is_game_over,
+)
+from azul.game.state_machine import AzulGame
+
+# (observations, action masks) -> (values per seat with the mover first, priors)
+Evaluator = Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]
+
+
+class MCTSResult(NamedTuple):
+    action: Action
+    value: float  # mean value of the chosen move for the player to move
+    visits: dict[Action, int]
+    n_leaves: int
+    n_batches: int
+    depth: int  # deepest leaf reached below the root
+    elapsed: float
+
+    @property
+    def nodes(self) -> int:
+        return self.n_leaves
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.n_leaves / max(self.elapsed, 1e-9)
+
+
+class Node:
+    """A position in the tree; its edges are created on expansion"""
+
+    __slots__ = (
+        "game",
+        "mover",
+        "terminal",
+        "value",
+        "indices",
+        "priors",
+        "n",
+        "w",
+        "vl",
+        "children",
+    )
+
+    def __init__(self, game: AzulGame, terminal: bool = False):
+        self.game = game
+        self.mover = game.current_player
+        self.terminal = terminal  # game over or round boundary, value is final
+        self.value: np.ndarray | None = None  # per absolute seat once evaluated
+        self.indices: np.ndarray | None = None
+        self.priors: np.ndarray | None = None
+        self.n: np.ndarray | None = None
+        self.w: np.ndarray | None = None  # from the mover's point of view
+        self.vl: np.ndarray | None = None  # pending virtual losses
+        self.children: dict[int, "Node"] = {}
+
+    def expand(self, priors: np.ndarray, mask: np.ndarray) -> None:
+        self.indices = np.flatnonzero(mask)
+        self.priors = priors[self.indices]
+        size = len(self.indices)
+        self.n = np.zeros(size)
+        self.w = np.zeros(size)
+        self.vl = np.zeros(size)
+
+
+class MCTSAgent:
+    """PUCT tree search that evaluates leaves in batches.
+
+    Each batch descends ``batch_size`` times from the root, adding a virtual
+    loss to every edge on the way so later descents spread over other
+    leaves, then evaluates all new leaves with one ``evaluator`` call and
+    backs the values up. The tree covers the rest of the current round; a
+    move that ends it is a leaf evaluated after one sampled factory refill
+    (``ExpectimaxAgent`` averages over refills instead). Finished games are
+    valued like the evaluator does, through ``tanh`` of the score margin
+    over its ``value_scale`` (``value_scale`` here if it has none).
+
+    The search stops after ``n_simulations`` leaves, or ``max_nodes`` when
+    set, and also once a batch ends past ``time_budget`` seconds.
+    """
+
+    def __init__(
+        self,
+        evaluator: Evaluator | None = None,
+        n_simulations: int = 800,
+        batch_size: int = 32,
+        c_puct: float = 1.5,
+        virtual_loss: float = 1.0,
+        value_scale: float = 10.0,
+        seed: int | None = None,
+        time_budget: float | None = None,
+        max_nodes: int | None = None,
+    ):
+        self.evaluator = evaluator
+        self.n_simulations = n_simulations
+        self.batch_size = batch_size
+        self.c_puct = c_puct
+        self.virtual_loss = virtual_loss
+        self.value_scale = value_scale
+        self.time_budget = time_budget
+        self.max_nodes = max_nodes
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.last_result: MCTSResult | None = None
+
+    def choose(self, game: AzulGame) -> Action:
+        return self.search(game).action
+
+    def act_positions(self, games: list[AzulGame]) -> list[int]:
+        return [action_to_index(self.choose(game)) for game in games]
+
+    def search(self, game: AzulGame) -> MCTSResult:
+        start = time.perf_counter()
+        encoder = ObservationEncoder(game.num_players)
+        evaluator = self.evaluator or HeuristicEvaluator(game.num_players)
+        root = Node(self._copy(game))
+        if is_game_over(root.game):
+            raise ValueError("No legal moves in this position")
+        self._evaluate([root], encoder, evaluator)
+        if not len(root.indices):
+            raise ValueError("No legal moves in this position")
+
+        budget = self.n_simulations if self.max_nodes is None else self.max_nodes
+        deadline = math.inf if self.time_budget is None else start + self.time_budget
+        n_leaves, n_batches, depth = 1, 0, 0
+        while n_leaves < budget and time.perf_counter() < deadline:
+            descents = [
+                self._select(root)
+                for _ in range(min(self.batch_size, budget - n_leaves))
+            ]
+            depth = max(depth, *(len(path) for path, _ in descents))
+            # Descents that met on the same new leaf share its evaluation
+            leaves = list({id(leaf): leaf for _, leaf in descents}.values())
+            self._evaluate(
+                [leaf for leaf in leaves if leaf.value is None], encoder, evaluator
+            )
+            for path, leaf in descents:
+                self._backup(path, leaf.value)
+            n_leaves += len(descents)
+            n_batches += 1
+
+        best = int(np.argmax(root.n))
+        visits = {index_to_action(int(i)): int(n) for i, n in zip(root.indices, root.n)}
+        self.last_result = MCTSResult(
+            index_to_action(int(root.indices[best])),
+            float(root.w[best] / max(root.n[best], 1)),
+            visits,
+            n_leaves,
+            n_batches,
+            depth,
+            time.perf_counter() - start,
+        )
+        return self.last_result
+
+    def _select(self, node: Node) -> tuple[list[tuple[Node, int]], Node]:
+        """Descend by PUCT to a leaf, adding virtual loss along the path"""
+        path = []
+        while node.indices is not None and len(node.indices):
+            visits = node.n + node.vl
+            q = (node.w - self.virtual_loss * node.vl) / np.maximum(visits, 1)
+            u = self.c_puct * node.priors * math.sqrt(visits.sum() + 1) / (1 + visits)
+            edge = int(np.argmax(q + u))
+            node.vl[edge] += 1
+            path.append((node, edge))
+            if edge not in node.children:
+                node.children[edge] = self._child(node, edge)
+                return path, node.children[edge]
+            node = node.children[edge]
+        return path, node
+
+    def _copy(self, game: AzulGame) -> AzulGame:
+        """A headless copy whose bag is seeded from the search's rng"""
+        data = game.to_bytes()
+        copied = AzulGame.from_bytes(
+            data, seed=zlib.crc32(data) ^ self.rng.getrandbits(32), history=0
+        )
+        copied.verbose = False
+        return copied
+
+    def _child(self, node: Node, edge: int) -> Node:
+        game = self._copy(node.game)
+        apply_action(game, index_to_action(int(node.indices[edge])))
+        if game.current_state == game.wall_tiling:
+            # The copy's freshly seeded bag samples the next refill
+            advance(game)
+            return Node(game, terminal=True)
+        return Node(game)
+
+    def _evaluate(
+        self, leaves: list[Node], encoder: ObservationEncoder, evaluator: Evaluator
+    ) -> None:
+        """Set every leaf's value, expanding the ones inside the round"""
+        scale = getattr(evaluator, "value_scale", self.value_scale)
+        pending = []
+        for leaf in leaves:
+            if is_game_over(leaf.game):
+                scores = np.array([p.score for p in leaf.game.players], float)
+                leaf.value = np.array(
+                    [
+                        math.tanh((s - np.delete(scores, seat).max()) / scale)
+                        for seat, s in enumerate(scores)
+                    ]
+                )
+            else:
+                pending.append(leaf)
+        if pending:
+            obs = np.stack([encoder.encode(leaf.game) for leaf in pending])
+            masks = np.stack([encoder.action_mask(leaf.game) for leaf in pending])
+            batch_values, priors = evaluator(obs, masks)
+            batch_values = np.asarray(batch_values, dtype=float)
+            num_players = leaves[0].game.num_players
+            if batch_values.ndim == 1:
+                others = -batch_values[:, None] / (num_players - 1)
+                batch_values = np.concatenate(
+                    [batch_values[:, None], np.repeat(others, num_players - 1, 1)],
+                    axis=1,
+                )
+            for leaf, v, p, m in zip(pending, batch_values, priors, masks):
+                leaf.value = np.roll(v, leaf.mover)
+                if not leaf.terminal:
+                    leaf.expand(p, m)
+
+    def _backup(self, path: list[tuple[Node, int]], value: np.ndarray) -> None:
+        for node, edge in path:
+            node.vl[edge] -= 1
+            node.n[edge] += 1
+            node.w[edge] += value[node.mover]
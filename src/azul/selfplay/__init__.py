@@ -0,0 +1,4 @@
+from .coordinator import SelfPlayCoordinator
+from .jobs import Job, JobQueue, evaluation_jobs, make_jobs
+from .shards import ReplayShard, iter_shards, load_shard, write_shard
+from .worker import run_job, run_worker, spawn_local_workers
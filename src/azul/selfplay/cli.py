@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import time
+from azul.agents import AGENT_FACTORIES, EXTERNAL_PREFIX, agent_name
+from .coordinator import SelfPlayCoordinator
+from .jobs import evaluation_jobs, make_jobs
+from .worker import run_worker, spawn_local_workers
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-selfplay",
+        description="Distribute self-play and evaluation games to workers over TCP",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="hand out jobs and collect shards")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8766)
+    serve.add_argument("--games", type=int, default=1000)
+    serve.add_argument("--job-size", type=int, default=64, help="games per job")
+    serve.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    serve.add_argument("--seed", type=int, default=0)
+    serve.add_argument(
+        "--agents",
+        nargs="+",
+        default=["random"],
+        type=agent_name,
+        help=f"built-in agents ({', '.join(AGENT_FACTORIES)}) or "
+        f"'{EXTERNAL_PREFIX}<command>'; one agent plays itself, one per seat "
+        "plays every seat rotation",
+    )
+    serve.add_argument("--out", default="shards", help="replay shard directory")
+    serve.add_argument("--lease-timeout", type=float, default=300.0)
+    serve.add_argument("--max-attempts", type=int, default=3)
+    serve.add_argument(
+        "--local-workers", type=int, default=0, help="worker processes to start here"
+    )
+
+    work = commands.add_parser("work", help="play jobs for a coordinator")
+    work.add_argument("--host", default="127.0.0.1")
+    work.add_argument("--port", type=int, default=8766)
+    work.add_argument("--name", default=None)
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    if len(args.agents) == 1:
+        jobs = make_jobs(
+            args.games, args.job_size, args.agents * args.players, args.seed
+        )
+    elif len(args.agents) == args.players:
+        jobs = evaluation_jobs(args.agents, args.games, args.job_size, args.seed)
+    else:
+        raise SystemExit(f"Give one agent or one per seat ({args.players})")
+
+    coordinator = SelfPlayCoordinator(
+        jobs,
+        args.out,
+        args.host,
+        args.port,
+        lease_timeout=args.lease_timeout,
+        max_attempts=args.max_attempts,
+    )
+    start = time.perf_counter()
+    host, port = await coordinator.start()
+    print(f"Serving {len(jobs)} jobs on {host}:{port}, shards in {args.out}")
+    workers = spawn_local_workers(host, port, args.local_workers)
+    try:
+        await coordinator.wait_finished()
+        # Local workers leave once told there is nothing left
+        for worker in workers:
+            await asyncio.to_thread(worker.join, 5)
+    finally:
+        await coordinator.close()
+    elapsed = time.perf_counter() - start
+
+    queue = coordinator.queue
+    print(
+        f"{coordinator.n_games} games in {len(queue.done)} jobs, "
+        f"{elapsed:.1f}s, {len(queue.failed)} job(s) failed"
+    )
+    for job_id, reason in sorted(queue.failed.items()):
+        print(f"  job {job_id}: {reason}")
+    for name, stats in coordinator.scores.items():
+        print(
+            f"{name:<18}mean score {stats.mean:7.2f}  "
+            f"wins {coordinator.wins.get(name, 0.0):8.1f}"
+        )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "work":
+        n_jobs = run_worker(args.host, args.port, args.name)
+        print(f"Completed {n_jobs} job(s)")
+        return
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+from azul.agents.coordinator import GameResult
+from azul.game.actions import action_space_size
+from azul.server.protocol import ProtocolError, decode, encode
+from azul.stats import RunningStats
+from .jobs import Job, JobQueue
+from .shards import write_shard
+
+MAX_LINE = 16 * 2**20  # a result line carries every move of its games
+
+
+class SelfPlayCoordinator:
+    """Serves a ``JobQueue`` to workers over line-delimited JSON on TCP.
+
+    Workers send ``{"op": "lease", "worker": name}`` and get a job, a hint
+    to retry later, or ``done``; they return ``{"op": "result", "job_id",
+    "games"}``. Results are written as replay shards in ``directory`` and
+    scores are aggregated per agent. A worker's leases are retried as soon
+    as its connection drops, and silent ones once ``lease_timeout`` passes.
+    """
+
+    def __init__(
+        self,
+        jobs: list[Job],
+        directory: str | Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        lease_timeout: float = 300.0,
+        max_attempts: int = 3,
+    ):
+        self.queue = JobQueue(jobs, lease_timeout, max_attempts)
+        self.directory = Path(directory)
+        self.host = host
+        self.port = port
+        self.scores: dict[str, RunningStats] = {}
+        self.wins: dict[str, float] = {}
+        self.n_games = 0
+        self.address: tuple[str, int] | None = None
+        self._server: asyncio.Server | None = None
+        self._expiry: asyncio.Task | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._storing: set[int] = set()  # jobs whose shard is being written
+        self._finished = asyncio.Event()
+
+    async def start(self) -> tuple[str, int]:
+        """Start listening; returns the bound address"""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE
+        )
+        self._expiry = asyncio.create_task(self._expire_loop())
+        self._check_finished()
+        self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def wait_finished(self) -> None:
+        await self._finished.wait()
+
+    async def close(self) -> None:
+        if self._expiry is not None:
+            self._expiry.cancel()
+        for writer in list(self._writers):
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "SelfPlayCoordinator":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _expire_loop(self) -> None:
+        interval = min(self.queue.lease_timeout / 4, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            self.queue.expire()
+            self._check_finished()
+
+    def _check_finished(self) -> None:
+        if self.queue.finished:
+            self._finished.set()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        workers = set()
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    request = decode(line)
+                    if request.get("op") == "lease":
+                        workers.add(str(request.get("worker")))
+                    result = await self.dispatch(request)
+                    response = {"ok": True, "result": result}
+                except ProtocolError as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(encode(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for worker in workers:
+                self.queue.release(worker)
+            self._check_finished()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def dispatch(self, request: dict[str, Any]) -> Any:
+        op = request.get("op")
+        if op == "lease":
+            job = self.queue.lease(str(request.get("worker")))
+            return {
+                "done": self.queue.finished,
+                "job": None if job is None else job.to_json(),
+                "retry_after": min(self.queue.lease_timeout / 4, 1.0),
+            }
+        if op == "result":
+            await self.submit(request.get("job_id"), request.get("games"))
+            return None
+        raise ProtocolError(f"Unknown op {op!r}")
+
+    async def submit(self, job_id: Any, games: Any) -> None:
+        """Check a job's results, store them as a shard and tally them"""
+        job = self.queue.jobs.get(job_id) if type(job_id) is int else None
+        if job is None:
+            raise ProtocolError(f"Unknown job {job_id!r}")
+        if not isinstance(games, list):
+            raise ProtocolError(f"Malformed games for job {job_id}: not a list")
+        try:
+            results = [_game_result(game, job.num_players) for game in games]
+        except (TypeError, ValueError) as e:
+            raise ProtocolError(f"Malformed games for job {job_id}: {e}") from None
+        expected = list(range(job.seed, job.seed + job.n_games))
+        if sorted(r.seed for r in results) != expected:
+            raise ProtocolError(f"Job {job_id} results do not cover its seeds")
+        if job_id in self.queue.done or job_id in self._storing:
+            return  # a retried job finished twice; the first result stands
+        self._storing.add(job_id)
+        try:
+            # Compressing a shard takes a while; keep serving other workers
+            await asyncio.to_thread(
+                write_shard,
+                self.directory,
+                job,
+                sorted(results, key=lambda r: r.seed),
+            )
+        finally:
+            self._storing.discard(job_id)
+        # Tally first, so the totals are complete once the queue is finished
+        self._tally(job, results)
+        self.queue.complete(job_id)
+        self._check_finished()
+
+    def _tally(self, job: Job, results: list[GameResult]) -> None:
+        for result in results:
+            self.n_games += 1
+            best = max(result.scores)
+            winners = [s for s, score in enumerate(result.scores) if score == best]
+            for seat, name in enumerate(job.agents):
+                self.scores.setdefault(name, RunningStats()).add(result.scores[seat])
+                if seat in winners:
+                    self.wins[name] = self.wins.get(name, 0.0) + 1 / len(winners)
+
+
+def _game_result(game: Any, num_players: int) -> GameResult:
+    """Parse one game of a worker's result, rejecting wrong types and sizes"""
+    if not isinstance(game, dict):
+        raise TypeError("a game must be an object")
+    result = GameResult(**game)
+    for field in ("seed", "rounds", "n_moves"):
+        if type(getattr(result, field)) is not int:
+            raise TypeError(f"'{field}' must be an integer")
+    scores, actions = result.scores, result.actions
+    if not isinstance(scores, list) or any(type(s) is not int for s in scores):
+        raise TypeError("'scores' must be a list of integers")
+    if len(scores) != num_players:
+        raise ValueError(f"{len(scores)} scores for {num_players} players")
+    if not isinstance(actions, list) or any(type(a) is not int for a in actions):
+        raise TypeError("'actions' must be a list of integers")
+    if not all(0 <= a < action_space_size() for a in actions):
+        raise ValueError("action index out of range")
+    return result
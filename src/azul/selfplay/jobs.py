@@ -0,0 +1,138 @@
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, NamedTuple
+
+
+class Job(NamedTuple):
+    """A batch of games with seeds ``seed, seed + 1, ...``"""
+
+    job_id: int
+    agents: list[str]  # agent name per seat
+    seed: int
+    n_games: int
+
+    @property
+    def num_players(self) -> int:
+        return len(self.agents)
+
+    def to_json(self) -> dict[str, Any]:
+        return self._asdict()
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "Job":
+        return cls(
+            int(data["job_id"]),
+            [str(a) for a in data["agents"]],
+            int(data["seed"]),
+            int(data["n_games"]),
+        )
+
+
+def make_jobs(
+    n_games: int,
+    job_size: int,
+    agents: list[str],
+    seed: int = 0,
+    first_id: int = 0,
+) -> list[Job]:
+    """Split a seed range into jobs of at most ``job_size`` games"""
+    return [
+        Job(first_id + i, list(agents), seed + start, min(job_size, n_games - start))
+        for i, start in enumerate(range(0, n_games, job_size))
+    ]
+
+
+def evaluation_jobs(
+    agents: list[str], n_games: int, job_size: int, seed: int = 0
+) -> list[Job]:
+    """Jobs playing every rotation of ``agents`` over the same seeds, so
+    seat order and deals even out"""
+    jobs = []
+    for shift in range(len(agents)):
+        seats = agents[shift:] + agents[:shift]
+        jobs += make_jobs(n_games, job_size, seats, seed, first_id=len(jobs))
+    return jobs
+
+
+class Lease(NamedTuple):
+    worker: str
+    deadline: float
+
+
+class JobQueue:
+    """Hands out jobs to workers under time-limited leases.
+
+    A lease ends when its result arrives, its worker disconnects
+    (``release``) or its deadline passes (``expire``). Jobs whose lease ended
+    without a result go back to the front of the queue until they have been
+    tried ``max_attempts`` times. The first result for a job is kept, even
+    from an expired lease. That loses nothing for agents that are
+    deterministic in their seeds; time-budgeted ones such as expectimax and
+    external ``cmd:`` engines can play differently on every attempt, so
+    their results depend on which attempt reported first.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[Job],
+        lease_timeout: float = 300.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jobs = {job.job_id: job for job in jobs}
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+        self.clock = clock
+        self.pending = deque(self.jobs)
+        self.leases: dict[int, Lease] = {}
+        self.attempts = {job_id: 0 for job_id in self.jobs}
+        self.done: set[int] = set()
+        self.failed: dict[int, str] = {}
+
+    @property
+    def finished(self) -> bool:
+        return not self.pending and not self.leases
+
+    def lease(self, worker: str) -> Job | None:
+        """The next job for ``worker``, None if all are leased or finished"""
+        if not self.pending:
+            return None
+        job_id = self.pending.popleft()
+        self.attempts[job_id] += 1
+        self.leases[job_id] = Lease(worker, self.clock() + self.lease_timeout)
+        return self.jobs[job_id]
+
+    def complete(self, job_id: int) -> bool:
+        """Record a job's result; False if it was already done or unknown"""
+        if job_id not in self.jobs or job_id in self.done:
+            return False
+        self.leases.pop(job_id, None)
+        self.failed.pop(job_id, None)
+        if job_id in self.pending:
+            self.pending.remove(job_id)
+        self.done.add(job_id)
+        return True
+
+    def release(self, worker: str, reason: str = "worker disconnected") -> list[int]:
+        """Retry every job leased to ``worker``"""
+        lost = [
+            job_id for job_id, lease in self.leases.items() if lease.worker == worker
+        ]
+        for job_id in lost:
+            self._retry(job_id, reason)
+        return lost
+
+    def expire(self) -> list[int]:
+        """Retry every job whose lease deadline has passed"""
+        now = self.clock()
+        lost = [job_id for job_id, lease in self.leases.items() if lease.deadline < now]
+        for job_id in lost:
+            self._retry(job_id, "lease expired")
+        return lost
+
+    def _retry(self, job_id: int, reason: str) -> None:
+        del self.leases[job_id]
+        if self.attempts[job_id] >= self.max_attempts:
+            self.failed[job_id] = reason
+        else:
+            self.pending.appendleft(job_id)
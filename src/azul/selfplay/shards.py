@@ -0,0 +1,99 @@
+import os
+from pathlib import Path
+from typing import Iterator, NamedTuple
+import numpy as np
+from azul.agents.coordinator import GameResult
+from azul.game.actions import advance, apply_action, index_to_action
+from azul.game.state_machine import AzulGame
+from .jobs import Job
+
+
+class ReplayShard(NamedTuple):
+    """The games of one job; actions of game i are
+    ``actions[offsets[i]:offsets[i + 1]]``"""
+
+    job: Job
+    seeds: np.ndarray
+    scores: np.ndarray  # (game, seat)
+    rounds: np.ndarray
+    actions: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def game_actions(self, i: int) -> np.ndarray:
+        return self.actions[self.offsets[i] : self.offsets[i + 1]]
+
+    def results(self) -> Iterator[GameResult]:
+        for i in range(len(self)):
+            actions = self.game_actions(i)
+            yield GameResult(
+                int(self.seeds[i]),
+                self.scores[i].tolist(),
+                int(self.rounds[i]),
+                len(actions),
+                actions.tolist(),
+            )
+
+    def replay(self, i: int) -> AzulGame:
+        """Play game ``i`` again from its seed; returns the finished game"""
+        game = AzulGame(self.job.num_players, seed=int(self.seeds[i]), verbose=False)
+        advance(game)
+        for index in self.game_actions(i):
+            apply_action(game, index_to_action(int(index)))
+            advance(game)
+        return game
+
+
+def shard_path(directory: str | Path, job_id: int) -> Path:
+    return Path(directory) / f"shard-{job_id:06d}.npz"
+
+
+def write_shard(directory: str | Path, job: Job, results: list[GameResult]) -> Path:
+    """Store a job's games; written to a temporary file and renamed, so a
+    shard is either complete or absent"""
+    path = shard_path(directory, job.job_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lengths = [len(r.actions) for r in results]
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(
+        tmp,
+        job_id=job.job_id,
+        agents=np.array(job.agents),
+        seed=job.seed,
+        seeds=np.array([r.seed for r in results], dtype=np.int64),
+        scores=np.array([r.scores for r in results], dtype=np.int16),
+        rounds=np.array([r.rounds for r in results], dtype=np.int16),
+        actions=np.concatenate(
+            [np.asarray(r.actions, dtype=np.int16) for r in results]
+            or [np.zeros(0, np.int16)]
+        ),
+        offsets=np.cumsum([0] + lengths),
+    )
+    os.replace(tmp, path)
+    return path
+
+
+def load_shard(path: str | Path) -> ReplayShard:
+    with np.load(path) as data:
+        job = Job(
+            int(data["job_id"]),
+            data["agents"].tolist(),
+            int(data["seed"]),
+            len(data["seeds"]),
+        )
+        return ReplayShard(
+            job,
+            data["seeds"],
+            data["scores"],
+            data["rounds"],
+            data["actions"],
+            data["offsets"],
+        )
+
+
+def iter_shards(directory: str | Path) -> Iterator[ReplayShard]:
+    for path in sorted(Path(directory).glob("shard-*.npz")):
+        if not path.name.endswith(".tmp.npz"):
+            yield load_shard(path)
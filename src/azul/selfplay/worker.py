@@ -0,0 +1,89 @@
+import json
+import multiprocessing
+import os
+import socket
+import time
+from typing import Any
+from azul.agents import BatchedCoordinator, make_agent
+from azul.agents.coordinator import GameResult
+from .jobs import Job
+
+
+def run_job(job: Job) -> list[GameResult]:
+    """Play a job's games; seats with the same agent name share an instance"""
+    instances = {}
+    for seat, name in enumerate(job.agents):
+        if name not in instances:
+            instances[name] = make_agent(name, job.seed + seat)
+    coordinator = BatchedCoordinator(
+        [instances[name] for name in job.agents],
+        num_players=job.num_players,
+        n_concurrent=min(job.n_games, 256),
+        seed=job.seed,
+        record_actions=True,
+    )
+    return coordinator.play(job.n_games)
+
+
+class WorkerConnection:
+    """Blocking line-delimited JSON client for ``SelfPlayCoordinator``"""
+
+    def __init__(self, host: str, port: int, timeout: float | None = None):
+        self.socket = socket.create_connection((host, port), timeout=timeout)
+        self.file = self.socket.makefile("rwb")
+
+    def request(self, op: str, **params) -> Any:
+        self.file.write(json.dumps({"op": op, **params}).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("Coordinator closed the connection")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+
+def run_worker(
+    host: str, port: int, name: str | None = None, max_jobs: int | None = None
+) -> int:
+    """Lease and play jobs until the coordinator has none left; returns the
+    number of jobs completed"""
+    name = name or f"{socket.gethostname()}:{os.getpid()}"
+    connection = WorkerConnection(host, port)
+    n_jobs = 0
+    try:
+        while max_jobs is None or n_jobs < max_jobs:
+            reply = connection.request("lease", worker=name)
+            if reply["done"]:
+                break
+            if reply["job"] is None:
+                # Everything is leased; wait in case a lease comes back
+                time.sleep(reply["retry_after"])
+                continue
+            job = Job.from_json(reply["job"])
+            games = [result._asdict() for result in run_job(job)]
+            connection.request("result", job_id=job.job_id, games=games)
+            n_jobs += 1
+    except ConnectionError:
+        pass
+    finally:
+        connection.close()
+    return n_jobs
+
+
+def spawn_local_workers(host: str, port: int, n: int) -> list[multiprocessing.Process]:
+    """Start ``n`` worker processes on this machine"""
+    processes = [
+        multiprocessing.Process(
+            target=run_worker, args=(host, port, f"local-{i}"), daemon=True
+        )
+        for i in range(n)
+    ]
+    for process in processes:
+        process.start()
+    return processes
@@ -0,0 +1,3 @@
+from .client import GameClient, ServerError
+from .protocol import ProtocolError, game_state
+from .server import GameServer
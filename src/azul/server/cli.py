@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+from .server import GameServer
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-server",
+        description="Host games over line-delimited JSON on a TCP socket",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-games", type=int, default=10_000)
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    server = GameServer(args.host, args.port, max_games=args.max_games)
+    host, port = await server.start()
+    print(f"Serving games on {host}:{port}")
+    await server.serve_forever()
+
+
+def main(argv=None):
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
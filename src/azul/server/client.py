@@ -0,0 +1,86 @@
+import asyncio
+import itertools
+from typing import Any
+from azul.game.actions import Action
+from .protocol import action_to_json, decode, encode
+from .server import MAX_LINE
+
+
+class ServerError(Exception):
+    """The server rejected a request"""
+
+
+class GameClient:
+    """Async client for ``GameServer``; pushed updates land in ``events``"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count()
+        self._task = asyncio.create_task(self._receive_loop())
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "GameClient":
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def _receive_loop(self) -> None:
+        try:
+            while line := await self.reader.readline():
+                message = decode(line)
+                if "event" in message:
+                    self.events.put_nowait(message)
+                elif (future := self._pending.pop(message.get("id"), None)) is not None:
+                    future.set_result(message)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Server closed the connection")
+                    )
+
+    async def request(self, op: str, **params) -> Any:
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.writer.write(encode({"op": op, "id": request_id, **params}))
+        await self.writer.drain()
+        response = await future
+        if not response["ok"]:
+            raise ServerError(response["error"])
+        return response["result"]
+
+    async def create(self, players: int = 2, seed: int | None = None) -> str:
+        return (await self.request("create", players=players, seed=seed))["game_id"]
+
+    async def state(self, game_id: str) -> dict[str, Any]:
+        return await self.request("state", game_id=game_id)
+
+    async def legal(self, game_id: str) -> list[dict[str, Any]]:
+        return await self.request("legal", game_id=game_id)
+
+    async def move(self, game_id: str, action: Action) -> dict[str, Any]:
+        return await self.request("move", game_id=game_id, move=action_to_json(action))
+
+    async def subscribe(self, game_id: str) -> dict[str, Any]:
+        return await self.request("subscribe", game_id=game_id)
+
+    async def unsubscribe(self, game_id: str) -> None:
+        await self.request("unsubscribe", game_id=game_id)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def __aenter__(self) -> "GameClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
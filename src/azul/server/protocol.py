@@ -0,0 +1,38 @@
+import json
+from typing import Any
+from azul.game.actions import Action
+from azul.stream.snapshot import action_to_json, game_state
+from azul.tile import TileType
+
+# Messages are JSON objects, one per line. Requests carry an "op" and an
+# optional "id" echoed in the response; pushed updates carry an "event".
+
+
+class ProtocolError(Exception):
+    """A request the server cannot act on; reported back to the client"""
+
+
+def encode(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict[str, Any]:
+    try:
+        message = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"Malformed JSON: {e.msg}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("A message must be a JSON object")
+    return message
+
+
+def action_from_json(data: Any) -> Action:
+    """Parse a move; ``source`` -1 is the center and ``line`` -1 the floor"""
+    try:
+        source, color, line = data["source"], data["color"], data["line"]
+        return Action(int(source), TileType[color], int(line))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ProtocolError(
+            "A move needs integer 'source' and 'line' and a 'color' name "
+            f"({', '.join(t.name for t in TileType)})"
+        ) from e
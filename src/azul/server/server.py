@@ -0,0 +1,217 @@
+import asyncio
+import itertools
+from typing import Any
+from azul.game.actions import advance, is_game_over, legal_actions
+from azul.game.state_machine import AzulGame
+from azul.stream import StatePublisher
+from .protocol import (
+    ProtocolError,
+    action_from_json,
+    action_to_json,
+    decode,
+    encode,
+    game_state,
+)
+
+MAX_LINE = 64 * 1024
+
+
+class Connection:
+    """A client socket with a bounded outgoing queue, so a slow reader does
+    not hold up the event loop or the other subscribers"""
+
+    def __init__(self, writer: asyncio.StreamWriter, max_queue: int):
+        self.writer = writer
+        self.max_queue = max_queue
+        self.queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self.subscriptions: set[str] = set()
+        self.task = asyncio.create_task(self._send_loop())
+
+    def send(self, message: dict[str, Any], force: bool = False) -> bool:
+        """Queue a message; False if the client has fallen too far behind.
+
+        ``force`` queues it past the limit, for a last message to a client
+        that is being dropped.
+        """
+        if not force and self.queue.qsize() >= self.max_queue:
+            return False
+        self.queue.put_nowait(encode(message))
+        return True
+
+    async def _send_loop(self) -> None:
+        while (data := await self.queue.get()) is not None:
+            self.writer.write(data)
+            await self.writer.drain()
+
+    async def close(self) -> None:
+        if self.queue.qsize() >= self.max_queue:
+            self.task.cancel()
+        else:
+            self.queue.put_nowait(None)
+        try:
+            await self.task
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        self.writer.close()
+
+
+class GameServer:
+    """Hosts many games for clients speaking line-delimited JSON over TCP.
+
+    Requests are ``{"op": ..., "id": ...}`` objects with ops ``create``,
+    ``state``, ``legal``, ``move``, ``subscribe`` and ``unsubscribe``.
+    Subscribing returns a keyframe and the deltas since, after which every
+    move is pushed as a delta (see ``azul.stream``).
+    Engine calls take well under a millisecond, so they run directly on the
+    event loop; only sockets are awaited.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_games: int = 10_000,
+        max_queue: int = 1024,
+    ):
+        self.host = host
+        self.port = port
+        self.max_games = max_games
+        self.max_queue = max_queue
+        self.games: dict[str, AzulGame] = {}
+        self.publishers: dict[str, StatePublisher] = {}
+        self.subscribers: dict[str, set[Connection]] = {}
+        self._ids = itertools.count(1)
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> tuple[str, int]:
+        """Start listening; returns the bound address"""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=MAX_LINE
+        )
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "GameServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = Connection(writer, self.max_queue)
+        try:
+            while line := await reader.readline():
+                request_id = None
+                try:
+                    request = decode(line)
+                    request_id = request.get("id")
+                    result = self.dispatch(connection, request)
+                    response = {"id": request_id, "ok": True, "result": result}
+                except ProtocolError as e:
+                    response = {"id": request_id, "ok": False, "error": str(e)}
+                except Exception as e:
+                    # A bug in handling one request should not cost the client
+                    # its connection
+                    response = {
+                        "id": request_id,
+                        "ok": False,
+                        "error": f"Internal error: {type(e).__name__}: {e}",
+                    }
+                if not connection.send(response):
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for game_id in connection.subscriptions:
+                self.subscribers.get(game_id, set()).discard(connection)
+            await connection.close()
+
+    def dispatch(self, connection: Connection, request: dict[str, Any]) -> Any:
+        op = request.get("op")
+        if op == "create":
+            return self.create(request.get("players", 2), request.get("seed"))
+
+        game_id = str(request.get("game_id"))
+        game = self.games.get(game_id)
+        if game is None:
+            raise ProtocolError(f"Unknown game {game_id!r}")
+        if op == "state":
+            return game_state(game)
+        if op == "legal":
+            return [action_to_json(a) for a in legal_actions(game)]
+        if op == "move":
+            return self.move(game_id, request.get("move"))
+        if op == "subscribe":
+            connection.subscriptions.add(game_id)
+            self.subscribers[game_id].add(connection)
+            return self.publishers[game_id].join()
+        if op == "unsubscribe":
+            connection.subscriptions.discard(game_id)
+            self.subscribers[game_id].discard(connection)
+            return None
+        raise ProtocolError(f"Unknown op {op!r}")
+
+    def create(self, num_players: Any, seed: Any) -> dict[str, Any]:
+        # JSON true and 2.0 compare equal to integers but are not accepted
+        if type(num_players) is not int or num_players not in (2, 3, 4):
+            raise ProtocolError("'players' must be 2, 3 or 4")
+        if seed is not None and type(seed) is not int:
+            raise ProtocolError("'seed' must be an integer")
+        if len(self.games) >= self.max_games:
+            for finished in [k for k, g in self.games.items() if is_game_over(g)]:
+                self.remove(finished)
+        if len(self.games) >= self.max_games:
+            raise ProtocolError(f"Server is full ({self.max_games} games)")
+        game = AzulGame(num_players=num_players, seed=seed, verbose=False)
+        advance(game)
+        game_id = str(next(self._ids))
+        self.games[game_id] = game
+        self.publishers[game_id] = StatePublisher(game)
+        self.subscribers[game_id] = set()
+        return {"game_id": game_id, "state": game_state(game)}
+
+    def move(self, game_id: str, data: Any) -> dict[str, Any]:
+        game = self.games[game_id]
+        action = action_from_json(data)
+        if action not in legal_actions(game):
+            raise ProtocolError(f"Illegal move {action_to_json(action)}")
+        delta = self.publishers[game_id].play(action)
+        event = {"event": "update", "game_id": game_id, "delta": delta}
+        for subscriber in list(self.subscribers[game_id]):
+            if not subscriber.send(event):
+                # Drop spectators that stopped reading rather than buffer
+                # without bound, telling them why once they catch up
+                self.subscribers[game_id].discard(subscriber)
+                subscriber.subscriptions.discard(game_id)
+                subscriber.send(
+                    {
+                        "event": "error",
+                        "game_id": game_id,
+                        "error": "Unsubscribed: too far behind",
+                    },
+                    force=True,
+                )
+        if is_game_over(game):
+            for subscriber in self.subscribers[game_id]:
+                subscriber.subscriptions.discard(game_id)
+            self.subscribers[game_id].clear()
+        return game_state(game)
+
+    def remove(self, game_id: str) -> None:
+        """Forget a game, e.g. once it has ended and been recorded"""
+        self.games.pop(game_id, None)
+        self.publishers.pop(game_id, None)
+        for subscriber in self.subscribers.pop(game_id, set()):
+            subscriber.subscriptions.discard(game_id)
@@ -0,0 +1 @@
+from .runner import simulate, simulate_chunk
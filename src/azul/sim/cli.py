@@ -0,0 +1,85 @@
+import argparse
+import time
+from azul.agents import AGENT_FACTORIES, EXTERNAL_PREFIX, agent_name
+from azul.stats import RunningStats, StatsCollector
+from .runner import simulate
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-sim", description="Play headless games and print aggregate stats"
+    )
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--agent",
+        default="random",
+        type=agent_name,
+        help=f"built-in agent ({', '.join(AGENT_FACTORIES)}) or "
+        f"'{EXTERNAL_PREFIX}<command>' for an engine process",
+    )
+    parser.add_argument(
+        "--chunk", type=int, default=None, help="games per work item (default: auto)"
+    )
+    parser.add_argument(
+        "--check-rate",
+        type=float,
+        default=None,
+        help="fraction of game updates checked for tile conservation (1 = all)",
+    )
+    return parser.parse_args(argv)
+
+
+def describe(name: str, stats: RunningStats) -> str:
+    return (
+        f"{name:<18}mean {stats.mean:7.2f}  std {stats.std:6.2f}  "
+        f"min {stats.min:4.0f}  max {stats.max:4.0f}"
+    )
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # A few work items per worker balances load without much pool overhead
+    chunk_size = args.chunk or max(1, min(256, -(-args.games // (4 * args.workers))))
+    start = time.perf_counter()
+    stats = StatsCollector(args.players)
+    for chunk in simulate(
+        args.games,
+        args.players,
+        args.workers,
+        args.seed,
+        args.agent,
+        chunk_size,
+        args.check_rate,
+    ):
+        stats.merge(chunk)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{stats.n_games} games, {args.players} players, agent {args.agent}, "
+        f"seed {args.seed}"
+    )
+    percentiles = "  ".join(
+        f"p{round(q * 100)} {stats.score_percentile(q)}" for q in (0.05, 0.5, 0.95)
+    )
+    print(f"{'score (all)':<18}{percentiles}")
+    for seat in range(args.players):
+        print(describe(f"score seat {seat}", stats.scores[seat]))
+    print(describe("winning score", stats.winning_score))
+    for seat in range(args.players):
+        print(describe(f"floor seat {seat}", stats.floor_penalties[seat]))
+    for seat, breakdown in enumerate(stats.bonus_breakdown()):
+        mean_counts = ", ".join(f"{kind} {n:.2f}" for kind, n in breakdown.items())
+        print(f"{f'bonus seat {seat}':<18}{mean_counts} per game")
+    histogram = ", ".join(f"{r}: {n}" for r, n in stats.rounds().items())
+    print(f"{'rounds histogram':<18}{histogram}")
+    print(
+        f"{'throughput':<18}{stats.n_games / elapsed:.1f} games/s, "
+        f"{stats.n_moves / elapsed:.0f} moves/s ({elapsed:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
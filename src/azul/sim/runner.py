@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+from azul.agents import BatchedCoordinator, make_agent
+from azul.stats import StatsCollector
+
+
+def simulate_chunk(
+    agent: str,
+    num_players: int,
+    seed: int,
+    n_games: int,
+    check_rate: float | None = None,
+) -> StatsCollector:
+    """Play ``n_games`` headless games with seeds ``seed, seed + 1, ...``
+
+    ``check_rate`` is the fraction of game updates verified with
+    ``check_invariants``.
+    """
+    player = make_agent(agent, seed)
+    coordinator = BatchedCoordinator(
+        [player] * num_players,
+        num_players=num_players,
+        n_concurrent=min(n_games, 256),
+        seed=seed,
+        check_rate=check_rate,
+    )
+    stats = StatsCollector(num_players)
+    for game, result in coordinator.iter_games(n_games):
+        stats.add_game(game, result.n_moves)
+    return stats
+
+
+def simulate(
+    n_games: int,
+    num_players: int = 2,
+    workers: int = 1,
+    seed: int = 0,
+    agent: str = "random",
+    chunk_size: int = 256,
+    check_rate: float | None = None,
+):
+    """Play games across ``workers`` processes, yielding stats per chunk"""
+    chunks = [
+        (
+            agent,
+            num_players,
+            seed + start,
+            min(chunk_size, n_games - start),
+            check_rate,
+        )
+        for start in range(0, n_games, chunk_size)
+    ]
+    if workers <= 1:
+        for chunk in chunks:
+            yield simulate_chunk(*chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(simulate_chunk, *zip(*chunks))
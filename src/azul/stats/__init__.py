@@ -0,0 +1 @@
+from .collector import RunningStats, StatsCollector
@@ -0,0 +1,125 @@
+import math
+import numpy as np
+from azul.game.state_machine import AzulGame
+
+MAX_SCORE = 256  # histogram bins; higher scores land in the last bin
+MAX_ROUNDS = 32
+
+
+class RunningStats:
+    """Count, mean and variance in constant memory (Welford), mergeable (Chan)"""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    def merge(self, other: "RunningStats") -> None:
+        if not other.n:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta**2 * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.n if self.n else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+def histogram_percentile(counts: np.ndarray, q: float) -> int:
+    """Smallest bin at or below which a fraction ``q`` of the counts lie"""
+    cumulative = np.cumsum(counts)
+    return int(np.searchsorted(cumulative, q * cumulative[-1]))
+
+
+class StatsCollector:
+    """Running aggregates over finished games in fixed memory.
+
+    Collectors built in different worker processes are combined with
+    ``merge``; nothing about individual games is kept.
+    """
+
+    BONUS_KINDS = ("rows", "columns", "colors")
+
+    def __init__(self, num_players: int):
+        self.num_players = num_players
+        self.n_games = 0
+        self.n_moves = 0
+        self.scores = [RunningStats() for _ in range(num_players)]
+        self.winning_score = RunningStats()
+        self.score_histogram = np.zeros(MAX_SCORE, dtype=np.int64)
+        self.rounds_histogram = np.zeros(MAX_ROUNDS, dtype=np.int64)
+        self.floor_penalties = [RunningStats() for _ in range(num_players)]
+        # bonuses[seat, kind]: total number of completed rows/columns/colors
+        self.bonuses = np.zeros((num_players, len(self.BONUS_KINDS)), dtype=np.int64)
+        self.bonus_points = [RunningStats() for _ in range(num_players)]
+
+    def add_game(self, game: AzulGame, n_moves: int = 0) -> None:
+        """Record a finished game from its final state"""
+        self.n_games += 1
+        self.n_moves += n_moves
+        self.rounds_histogram[min(game.round_number, MAX_ROUNDS - 1)] += 1
+        self.winning_score.add(max(p.score for p in game.players))
+
+        for seat, player in enumerate(game.players):
+            self.scores[seat].add(player.score)
+            self.score_histogram[min(player.score, MAX_SCORE - 1)] += 1
+            self.floor_penalties[seat].add(player.floor_penalty_total)
+
+            wall = player.wall
+            self.bonuses[seat] += (
+                wall.complete_rows(),
+                wall.complete_columns(),
+                wall.complete_colors(),
+            )
+            self.bonus_points[seat].add(wall.end_game_bonus())
+
+    def merge(self, other: "StatsCollector") -> "StatsCollector":
+        if other.num_players != self.num_players:
+            raise ValueError("Cannot merge stats for different player counts")
+        self.n_games += other.n_games
+        self.n_moves += other.n_moves
+        self.winning_score.merge(other.winning_score)
+        self.score_histogram += other.score_histogram
+        self.rounds_histogram += other.rounds_histogram
+        self.bonuses += other.bonuses
+        for mine, theirs in [
+            (self.scores, other.scores),
+            (self.floor_penalties, other.floor_penalties),
+            (self.bonus_points, other.bonus_points),
+        ]:
+            for a, b in zip(mine, theirs):
+                a.merge(b)
+        return self
+
+    def score_percentile(self, q: float) -> int:
+        return histogram_percentile(self.score_histogram, q)
+
+    def rounds(self) -> dict[int, int]:
+        return {r: int(n) for r, n in enumerate(self.rounds_histogram) if n}
+
+    def bonus_breakdown(self) -> list[dict[str, float]]:
+        """Mean completed rows, columns and colors per game for each seat"""
+        n = max(self.n_games, 1)
+        return [
+            {kind: total / n for kind, total in zip(self.BONUS_KINDS, seat)}
+            for seat in self.bonuses
+        ]
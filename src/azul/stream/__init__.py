@@ -0,0 +1,2 @@
+from .delta import StatePublisher, apply_delta, play_move, replay
+from .snapshot import action_to_json, game_state
@@ -0,0 +1,186 @@
+import copy
+from typing import Any
+from azul.board_components import Wall
+from azul.game.actions import CENTER, FLOOR, Action, advance, apply_action
+from azul.game.state_machine import AzulGame
+from azul.tile import SpecialTileType
+from .snapshot import action_to_json, game_state
+
+TOKEN = SpecialTileType.TILE_1.name
+
+
+def _wall_cells(game: AzulGame) -> list[set[tuple[int, int]]]:
+    return [
+        {(r, c) for r, row in enumerate(p.wall.grid) for c, t in enumerate(row) if t}
+        for p in game.players
+    ]
+
+
+def _placements(before: set, after: set) -> list[tuple[int, int, int]]:
+    """(row, col, points) of new wall tiles, scored top row first like tiling"""
+    wall = Wall()
+    for r, c in before:
+        wall.grid[r][c] = True
+    placements = []
+    for r, c in sorted(after - before):
+        wall.grid[r][c] = True
+        placements.append((r, c, wall.calculate_points(r, c)))
+    return placements
+
+
+def play_move(game: AzulGame, action: Action) -> dict[str, Any]:
+    """Play ``action`` and describe what changed.
+
+    The move itself is a handful of counts: tiles of the color going to the
+    pattern line and the floor, what a factory leaves in the center, and
+    whether the first player token moved. When the move ends the round the
+    delta also lists wall placements with their points and the refilled
+    table, since almost every field changes anyway.
+    """
+    seat = game.current_player
+    player = game.players[seat]
+    holder = (
+        game.board_center if action.source == CENTER else game.factories[action.source]
+    )
+    names = [tile.type.name for tile in holder._tiles]
+    color = action.tile_type.name
+    n = names.count(color)
+    token = action.source == CENTER and TOKEN in names
+    to_line = 0
+    if action.line != FLOOR:
+        to_line = min(n, action.line + 1 - len(player.pattern_lines[action.line]))
+    floor_space = player.floor_line.max_size - len(player.floor_line) - token
+    to_floor = min(n - to_line, max(floor_space, 0))
+
+    walls = _wall_cells(game)
+    round_number = game.round_number
+    apply_action(game, action)
+    advance(game)
+
+    delta = {
+        "player": seat,
+        "move": action_to_json(action),
+        "to_line": to_line,
+        "to_floor": to_floor,
+        "to_center": (
+            [] if action.source == CENTER else [x for x in names if x != color]
+        ),
+        "token": token,
+        "current_player": game.current_player,
+        "discard": len(game.discard_pile),
+    }
+    if game.round_number != round_number or game.current_state.id == "game_ended":
+        delta["round_end"] = {
+            "placements": [
+                [p, r, c, game.players[p].wall.grid[r][c].type.name, points]
+                for p, (before, after) in enumerate(zip(walls, _wall_cells(game)))
+                for r, c, points in _placements(before, after)
+            ],
+            "scores": [p.score for p in game.players],
+            "state": game.current_state.id,
+            "round": game.round_number,
+            "starting_player": game.starting_player,
+            "first_player_token_taken": game.first_player_token_taken,
+            "factories": [[t.type.name for t in f._tiles] for f in game.factories],
+            "center": [t.type.name for t in game.board_center._tiles],
+            "bag": len(game.bag),
+        }
+    return delta
+
+
+def apply_delta(state: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
+    """Advance a ``game_state`` snapshot by one delta, in place.
+
+    This is the reference for what a frontend has to do with each message.
+    """
+    player = state["players"][delta["player"]]
+    move = delta["move"]
+    color = move["color"]
+    if move["source"] == CENTER:
+        state["center"] = [
+            x
+            for x in state["center"]
+            if x != color and (x != TOKEN or not delta["token"])
+        ]
+    else:
+        state["factories"][move["source"]] = []
+        state["center"] += delta["to_center"]
+    if delta["token"]:
+        player["floor"].append(TOKEN)
+        state["first_player_token_taken"] = True
+        state["starting_player"] = delta["player"]
+    if move["line"] != FLOOR:
+        player["pattern_lines"][move["line"]] += [color] * delta["to_line"]
+    player["floor"] += [color] * delta["to_floor"]
+    state["current_player"] = delta["current_player"]
+    state["discard"] = delta["discard"]
+
+    round_end = delta.get("round_end")
+    if round_end is not None:
+        for p, r, c, _, _ in round_end["placements"]:
+            state["players"][p]["wall"][r][c] = True
+            state["players"][p]["pattern_lines"][r] = []
+        for p, score in zip(state["players"], round_end["scores"]):
+            p["score"] = score
+            p["floor"] = []
+        for key in (
+            "state",
+            "round",
+            "starting_player",
+            "first_player_token_taken",
+            "factories",
+            "center",
+            "bag",
+        ):
+            # Copied so that later deltas never edit the message itself
+            state[key] = copy.deepcopy(round_end[key])
+    return state
+
+
+class StatePublisher:
+    """Stream of one game for spectators: a keyframe, then one delta per move.
+
+    A fresh keyframe is taken every ``keyframe_interval`` moves and older
+    deltas are dropped, so a late joiner gets at most that many deltas to
+    replay on top of the latest keyframe.
+    """
+
+    def __init__(self, game: AzulGame, keyframe_interval: int = 32):
+        self.game = game
+        self.keyframe_interval = keyframe_interval
+        self.seq = 0
+        self.keyframe = self._keyframe()
+        self.deltas: list[dict[str, Any]] = []
+
+    def _keyframe(self) -> dict[str, Any]:
+        return {"type": "keyframe", "seq": self.seq, "state": game_state(self.game)}
+
+    def play(self, action: Action) -> dict[str, Any]:
+        """Play a move on the game and return its delta message"""
+        delta = {"type": "delta", "seq": self.seq + 1, **play_move(self.game, action)}
+        self.seq += 1
+        if self.seq % self.keyframe_interval == 0:
+            self.keyframe = self._keyframe()
+            self.deltas.clear()
+        else:
+            self.deltas.append(delta)
+        return delta
+
+    def join(self) -> list[dict[str, Any]]:
+        """Messages that bring a new spectator up to date"""
+        return [self.keyframe, *self.deltas]
+
+
+def replay(messages: list[dict[str, Any]]) -> dict[str, Any]:
+    """Rebuild the current state from a keyframe followed by deltas"""
+    keyframe, *deltas = messages
+    state = copy.deepcopy(keyframe["state"])
+    seq = keyframe["seq"]
+    for delta in deltas:
+        if delta["seq"] <= seq:
+            continue
+        if delta["seq"] != seq + 1:
+            raise ValueError(f"Missing delta {seq + 1}, got {delta['seq']}")
+        apply_delta(state, delta)
+        seq += 1
+    return state
@@ -0,0 +1,43 @@
+from typing import Any
+from azul.game.actions import Action
+from azul.game.state_machine import AzulGame
+
+
+def tile_names(tiles) -> list[str]:
+    return [tile.type.name for tile in tiles]
+
+
+def game_state(game: AzulGame) -> dict[str, Any]:
+    """Full position as plain JSON data, tiles named by their type"""
+    return {
+        "state": game.current_state.id,
+        "round": game.round_number,
+        "current_player": game.current_player,
+        "starting_player": game.starting_player,
+        "first_player_token_taken": game.first_player_token_taken,
+        "factories": [tile_names(f._tiles) for f in game.factories],
+        "center": tile_names(game.board_center._tiles),
+        "bag": len(game.bag),
+        "discard": len(game.discard_pile),
+        "players": [
+            {
+                "score": player.score,
+                "pattern_lines": [
+                    tile_names(line._tiles) for line in player.pattern_lines
+                ],
+                "wall": [
+                    [tile is not None for tile in row] for row in player.wall.grid
+                ],
+                "floor": tile_names(player.floor_line._tiles),
+            }
+            for player in game.players
+        ],
+    }
+
+
+def action_to_json(action: Action) -> dict[str, Any]:
+    return {
+        "source": action.source,
+        "color": action.tile_type.name,
+        "line": action.line,
+    }
@@ -1,2 +1,2 @@
-from .tile_generator import get_tile_generator
+from .tile_generator import TileGenerator, get_tile_generator
 from .tile import Tile, TileType, SpecialTileType, T
@@ -18,6 +18,8 @@ T = TypeVar("T", bound=TileType | SpecialTileType)
 
 
 class Tile:
+    __slots__ = ("id", "type")
+
     def __init__(self, type: TileType | SpecialTileType, tile_id: int):
         self.id = tile_id
         self.type = type
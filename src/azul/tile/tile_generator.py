@@ -7,7 +7,8 @@ class TileGenerator:
     def __init__(self, seed=42):
         self.n_tiles_per_type = 20
         self.next_id = 1  # Track the next ID to assign
-        random.seed(seed)
+        # A private generator, so creating one leaves the random module alone
+        self.rng = random.Random(seed)
 
     def _get_next_id(self) -> int:
         """Get the next available tile ID and increment the counter."""
@@ -17,7 +18,7 @@ class TileGenerator:
 
     def create_random_tiles(self, n: int) -> MutableSequence[Tile]:
         return [
-            Tile(random.choice(list(TileType)), self._get_next_id()) for _ in range(n)
+            Tile(self.rng.choice(list(TileType)), self._get_next_id()) for _ in range(n)
         ]
 
     def create_tiles_of_type(
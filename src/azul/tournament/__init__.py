@@ -0,0 +1,2 @@
+from .elo import SPRT, MatchStats, fit_ratings
+from .runner import Tournament, play_pairing_batch, seat_lineups
@@ -0,0 +1,69 @@
+import argparse
+import time
+from azul.agents import AGENT_FACTORIES, EXTERNAL_PREFIX, agent_name
+from .elo import SPRT, fit_ratings
+from .runner import Tournament
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="azul-tournament",
+        description="Round robin between agents with Elo and SPRT early stopping",
+    )
+    parser.add_argument(
+        "--agents",
+        nargs="+",
+        required=True,
+        type=agent_name,
+        help=f"built-in agents ({', '.join(AGENT_FACTORIES)}) or "
+        f"'{EXTERNAL_PREFIX}<command>' for an engine process",
+    )
+    parser.add_argument("--players", type=int, default=2, choices=[2, 3, 4])
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--games", type=int, default=1000, help="max games per pairing")
+    parser.add_argument("--batch", type=int, default=20, help="seeds per work item")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--elo0", type=float, default=0.0)
+    parser.add_argument("--elo1", type=float, default=20.0)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    args = parser.parse_args(argv)
+    if len(set(args.agents)) != len(args.agents):
+        parser.error("--agents: each agent may be named only once")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    tournament = Tournament(
+        args.agents,
+        num_players=args.players,
+        max_games=args.games,
+        batch_size=args.batch,
+        seed=args.seed,
+        sprt=SPRT(args.elo0, args.elo1, args.alpha, args.beta),
+    )
+    start = time.perf_counter()
+    results = tournament.run(workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'pairing':<24}{'games':>7}{'W-D-L':>14}{'elo':>9}{'95% CI':>20}  sprt")
+    for (a, b), stats in results.items():
+        low, high = stats.elo_interval()
+        wdl = f"{stats.wins}-{stats.draws}-{stats.losses}"
+        decision = tournament.decisions[(a, b)] or "-"
+        print(
+            f"{a + ' vs ' + b:<24}{stats.n:>7}{wdl:>14}{stats.elo():>9.1f}"
+            f"{f'[{low:.1f}, {high:.1f}]':>20}  {decision}"
+        )
+
+    print("\nratings:")
+    ratings = fit_ratings(args.agents, results)
+    for name, rating in sorted(ratings.items(), key=lambda item: -item[1]):
+        print(f"  {name:<12}{rating:>8.1f}")
+    n_games = sum(stats.n for stats in results.values())
+    print(f"\n{n_games} games in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import math
+
+EPS = 1e-6
+
+
+def score_to_elo(score: float) -> float:
+    """Elo difference implied by an expected score"""
+    score = min(max(score, EPS), 1 - EPS)
+    return -400 * math.log10(1 / score - 1)
+
+
+def elo_to_score(elo: float) -> float:
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class MatchStats:
+    """Win/draw/loss record of one agent against another"""
+
+    def __init__(self):
+        self.wins = 0
+        self.draws = 0
+        self.losses = 0
+
+    def add(self, outcome: float) -> None:
+        """Record a game result: 1 for a win, 0.5 for a draw, 0 for a loss"""
+        if outcome == 1:
+            self.wins += 1
+        elif outcome == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    @property
+    def n(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        return (self.wins + 0.5 * self.draws) / self.n if self.n else 0.5
+
+    @property
+    def variance(self) -> float:
+        """Per-game variance of the score"""
+        if not self.n:
+            return 0.0
+        s = self.score
+        return (
+            self.wins * (1 - s) ** 2 + self.draws * (0.5 - s) ** 2 + self.losses * s**2
+        ) / self.n
+
+    def elo(self) -> float:
+        return score_to_elo(self.score)
+
+    def elo_interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Confidence interval of the Elo difference (95% by default)"""
+        margin = z * math.sqrt(self.variance / self.n) if self.n else 0.5
+        return score_to_elo(self.score - margin), score_to_elo(self.score + margin)
+
+    def llr(self, elo0: float, elo1: float) -> float:
+        """Log-likelihood ratio of H1 (elo1) over H0 (elo0), normal approximation.
+
+        Half a game of each result is added so that a perfect record still
+        has a variance, and a single game cannot end the test.
+        """
+        if not self.n:
+            return 0.0
+        regularized = MatchStats()
+        regularized.wins = self.wins + 0.5
+        regularized.draws = self.draws + 0.5
+        regularized.losses = self.losses + 0.5
+        s, var = regularized.score, regularized.variance
+        s0, s1 = elo_to_score(elo0), elo_to_score(elo1)
+        return regularized.n * (s1 - s0) * (2 * s - s0 - s1) / (2 * var)
+
+
+class SPRT:
+    """Sequential probability ratio test between two Elo hypotheses"""
+
+    def __init__(
+        self,
+        elo0: float = 0.0,
+        elo1: float = 20.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+    ):
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+
+    def decide(self, stats: MatchStats) -> str | None:
+        """'H1' or 'H0' once the test has decided, otherwise None"""
+        llr = stats.llr(self.elo0, self.elo1)
+        if llr >= self.upper:
+            return "H1"
+        if llr <= self.lower:
+            return "H0"
+        return None
+
+
+def fit_ratings(
+    names: list[str], results: dict[tuple[str, str], MatchStats], iterations=200
+) -> dict[str, float]:
+    """Bradley-Terry ratings on the Elo scale, anchored at the first agent"""
+    strength = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        for name in names:
+            won, expected = 0.0, 0.0
+            for (a, b), stats in results.items():
+                if name not in (a, b) or not stats.n:
+                    continue
+                other = b if name == a else a
+                won += (
+                    stats.wins + 0.5 * stats.draws
+                    if name == a
+                    else stats.losses + 0.5 * stats.draws
+                )
+                # Half a win per pairing keeps winless agents at a finite rating
+                won += 0.5
+                expected += (stats.n + 1) / (strength[name] + strength[other])
+            if expected:
+                strength[name] = won / expected
+    anchor = strength[names[0]]
+    return {name: 400 * math.log10(s / anchor) for name, s in strength.items()}
@@ -0,0 +1,130 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import combinations
+from azul.agents import BatchedCoordinator, make_agent
+from .elo import SPRT, MatchStats
+
+
+def seat_lineups(num_players: int) -> list[list[int]]:
+    """Seat assignments for a pairing, 0 and 1 marking the two agents.
+
+    Agents alternate around the table and every rotation is played. With an
+    odd player count the pattern is also mirrored so both agents get the
+    extra seat equally often.
+    """
+    patterns = [[seat % 2 for seat in range(num_players)]]
+    if num_players % 2:
+        patterns.append([1 - side for side in patterns[0]])
+    # With an even count the pattern repeats every two rotations
+    rotations = dict.fromkeys(
+        tuple(pattern[r:] + pattern[:r])
+        for pattern in patterns
+        for r in range(num_players)
+    )
+    return [list(lineup) for lineup in rotations]
+
+
+def play_pairing_batch(
+    names: tuple[str, str], num_players: int, seed: int, n_games: int
+) -> list[float]:
+    """Play ``n_games`` seeds under every seat lineup; scores for ``names[0]``.
+
+    All lineups share the same seeds, so both agents face the same deals.
+    Each game counts as a win for the agent with the higher mean seat score.
+    """
+    outcomes = []
+    for lineup in seat_lineups(num_players):
+        agents = {side: make_agent(names[side], seed) for side in set(lineup)}
+        coordinator = BatchedCoordinator(
+            [agents[side] for side in lineup],
+            num_players=num_players,
+            n_concurrent=n_games,
+            seed=seed,
+        )
+        for result in coordinator.play(n_games):
+            means = [
+                sum(s for s, side in zip(result.scores, lineup) if side == k)
+                / lineup.count(k)
+                for k in (0, 1)
+            ]
+            outcomes.append(
+                1.0 if means[0] > means[1] else 0.0 if means[0] < means[1] else 0.5
+            )
+    return outcomes
+
+
+class Tournament:
+    """Round robin between agents over a process pool with SPRT early stopping"""
+
+    def __init__(
+        self,
+        names: list[str],
+        num_players: int = 2,
+        max_games: int = 1000,
+        batch_size: int = 20,
+        seed: int = 0,
+        sprt: SPRT | None = None,
+    ):
+        if len(names) < 2:
+            raise ValueError("A tournament needs at least two agents")
+        if len(set(names)) != len(names):
+            raise ValueError("Agent names must be unique")
+        self.names = names
+        self.num_players = num_players
+        self.max_games = max_games
+        self.batch_size = batch_size
+        self.seed = seed
+        self.sprt = sprt or SPRT()
+        self.pairings = list(combinations(names, 2))
+        self.results = {pairing: MatchStats() for pairing in self.pairings}
+        self.decisions: dict[tuple[str, str], str | None] = {
+            pairing: None for pairing in self.pairings
+        }
+
+    def _is_open(self, pairing, submitted: int) -> bool:
+        return self.decisions[pairing] is None and submitted < self.max_games
+
+    def run(self, workers: int = 1) -> dict[tuple[str, str], MatchStats]:
+        submitted = {pairing: 0 for pairing in self.pairings}
+        pending: dict[Future, tuple[str, str]] = {}
+        games_per_batch = self.batch_size * len(seat_lineups(self.num_players))
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+
+            def submit(pairing):
+                seed = self.seed + submitted[pairing] // len(
+                    seat_lineups(self.num_players)
+                )
+                future = pool.submit(
+                    play_pairing_batch,
+                    pairing,
+                    self.num_players,
+                    seed,
+                    self.batch_size,
+                )
+                pending[future] = pairing
+                submitted[pairing] += games_per_batch
+
+            # Keep every worker busy, cycling through the open pairings
+            while True:
+                open_pairings = [
+                    p for p in self.pairings if self._is_open(p, submitted[p])
+                ]
+                while open_pairings and len(pending) < 2 * workers:
+                    for pairing in open_pairings:
+                        if len(pending) < 2 * workers:
+                            submit(pairing)
+                    open_pairings = [
+                        p for p in self.pairings if self._is_open(p, submitted[p])
+                    ]
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pairing = pending.pop(future)
+                    stats = self.results[pairing]
+                    for outcome in future.result():
+                        stats.add(outcome)
+                    if self.decisions[pairing] is None:
+                        self.decisions[pairing] = self.sprt.decide(stats)
+        return self.results
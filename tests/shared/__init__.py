@@ -1 +1,2 @@
 from .tile_fixtures import tg
+from .game_fixtures import game, random_game, random_moves
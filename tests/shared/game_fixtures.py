@@ -0,0 +1,43 @@
+import random
+from collections.abc import Iterator
+import pytest
+from azul.game.actions import Action, advance, apply_action, is_game_over, legal_actions
+from azul.game.state_machine import AzulGame
+
+
+@pytest.fixture(scope="function")
+def game() -> AzulGame:
+    game = AzulGame(num_players=2)
+    game.start_game()
+    return game
+
+
+def random_moves(
+    game: AzulGame, seed: int = 0, n_moves: int | None = None, play: bool = True
+) -> Iterator[Action]:
+    """Random legal moves on ``game`` until it ends or ``n_moves`` were made.
+
+    Each move is yielded before it is played, so breaking out of the loop
+    leaves the game in the position the move was chosen in. With ``play``
+    False the caller plays every yielded move itself.
+    """
+    rng = random.Random(seed)
+    advance(game)
+    n = 0
+    while not is_game_over(game) and (n_moves is None or n < n_moves):
+        action = rng.choice(legal_actions(game))
+        yield action
+        if play:
+            apply_action(game, action)
+            advance(game)
+        n += 1
+
+
+def random_game(
+    num_players: int = 2, seed: int = 0, n_moves: int | None = None, **options
+) -> AzulGame:
+    """A headless game after ``n_moves`` random moves, played out when None"""
+    game = AzulGame(num_players=num_players, seed=seed, verbose=False, **options)
+    for _ in random_moves(game, seed, n_moves):
+        pass
+    return game
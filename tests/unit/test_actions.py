@@ -0,0 +1,39 @@
+import pytest
+from azul.game.actions import (
+    CENTER,
+    FLOOR,
+    Action,
+    action_space_size,
+    action_to_index,
+    apply_action,
+    index_to_action,
+    legal_actions,
+)
+from azul.game.state_machine import AzulGame
+from azul.tile import TileType
+from tests.shared import game
+
+
+class TestActions:
+    @pytest.mark.unit
+    def test_opening_moves(self, game: AzulGame):
+        actions = legal_actions(game)
+        n_colors = sum(len({t.type for t in f._tiles}) for f in game.factories)
+        # Every line is open on an empty board, the center only holds the token
+        assert len(actions) == n_colors * 6
+        assert all(a.source != CENTER for a in actions)
+
+    @pytest.mark.unit
+    def test_apply_moves_tiles(self, game: AzulGame):
+        action = Action(0, game.factories[0][0].type, FLOOR)
+        n_taken = game.factories[0].count(action.tile_type)
+        apply_action(game, action)
+        assert len(game.factories[0]) == 0
+        assert len(game.players[0].floor_line) == n_taken
+        assert game.current_player == 1
+
+    @pytest.mark.unit
+    def test_index_roundtrip(self):
+        indices = range(action_space_size())
+        assert [action_to_index(index_to_action(i)) for i in indices] == list(indices)
+        assert index_to_action(0) == Action(CENTER, TileType.RED, 0)
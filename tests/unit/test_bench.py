@@ -0,0 +1,34 @@
+import tracemalloc
+import pytest
+from azul.bench import profile_allocations
+from azul.bench.allocations import HOT_FUNCTIONS
+from azul.bench.cli import main
+
+
+class TestAllocationProfile:
+    @pytest.mark.unit
+    def test_attributes_hot_functions(self):
+        originals = [owner.__dict__[name] for owner, name in HOT_FUNCTIONS]
+        report = profile_allocations(n_games=2)
+        assert report.games == 2 and report.moves > 0
+        assert set(report.functions) == {
+            f"{owner.__name__}.{name}" for owner, name in HOT_FUNCTIONS
+        }
+        assert all(f.calls > 0 for f in report.functions.values())
+        # Every move puts tiles on the floor line or a pattern line
+        assert report.functions["Floorline.add_tiles"].calls == report.moves
+        assert report.max_peak_per_game >= report.peak_per_game > 0
+        # Instrumentation is removed and tracing stopped afterwards
+        assert [owner.__dict__[name] for owner, name in HOT_FUNCTIONS] == originals
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.unit
+    def test_sees_copying_in_add_partially(self):
+        report = profile_allocations(n_games=1)
+        assert report.functions["StagingLine.add_partially"].peak_per_call > 0
+
+    @pytest.mark.unit
+    def test_cli(self, capsys):
+        main(["--allocations", "--games", "1"])
+        out = capsys.readouterr().out
+        assert "per move" in out and "Bag.pop_random" in out
@@ -0,0 +1,63 @@
+import pytest
+from azul.bench import measure_footprint
+from azul.compact import CompactPlayerBoard, GameArrays
+from azul.game.serialization import HEADER, PLAYER
+from azul.tile import TileType
+from tests.shared import random_game
+
+
+class TestCompactPlayerBoard:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_moves", [0, 9, 60])
+    def test_matches_encoding(self, n_moves: int):
+        game = random_game(3, seed=n_moves, n_moves=n_moves)
+        data = game.to_bytes()
+        for seat, player in enumerate(game.players):
+            board = CompactPlayerBoard.from_player_board(player)
+            offset = HEADER.size + seat * PLAYER.size
+            assert board == CompactPlayerBoard.unpack(data, offset)
+            assert board.pack() == data[offset : offset + PLAYER.size]
+
+    @pytest.mark.unit
+    def test_placement_rules_match_player_board(self):
+        game = random_game(2, seed=3, n_moves=45)
+        for player in game.players:
+            board = CompactPlayerBoard.from_player_board(player)
+            assert (
+                board.has_completed_horizontal_line()
+                == player.has_completed_horizontal_line()
+            )
+            for line in range(-1, 6):
+                for tile_type in TileType:
+                    assert board.can_place_tile_type_in_pattern_line(
+                        line, tile_type
+                    ) == player.can_place_tile_type_in_pattern_line(line, tile_type)
+
+    @pytest.mark.unit
+    def test_has_no_instance_dict(self):
+        assert not hasattr(CompactPlayerBoard(), "__dict__")
+
+
+class TestGameArrays:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 4])
+    def test_roundtrip(self, num_players: int):
+        games = [random_game(num_players, seed, n_moves=seed * 7) for seed in range(6)]
+        arrays = GameArrays(len(games), num_players)
+        for i, game in enumerate(games):
+            arrays.store(i, game)
+        for i, game in enumerate(games):
+            assert arrays.to_bytes(i) == game.to_bytes()
+            assert arrays.load(i).to_bytes() == game.to_bytes()
+        assert arrays.score.tolist() == [[p.score for p in g.players] for g in games]
+
+    @pytest.mark.unit
+    def test_rejects_other_player_count(self):
+        with pytest.raises(ValueError):
+            GameArrays(1, 2).store(0, random_game(3, seed=0, n_moves=0))
+
+    @pytest.mark.unit
+    def test_smaller_than_live_games(self):
+        arrays = GameArrays(100, 2)
+        per_game = measure_footprint(lambda i: random_game(2, seed=i, n_moves=0), 20)
+        assert arrays.nbytes / 100 < 100 < per_game
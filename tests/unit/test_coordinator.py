@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from azul.agents import BatchedCoordinator, RandomAgent
+
+
+class CountingAgent(RandomAgent):
+    def __init__(self, seed: int):
+        super().__init__(seed)
+        self.batch_sizes = []
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(len(obs))
+        return super().act(obs, mask)
+
+
+class TestBatchedCoordinator:
+    @pytest.mark.unit
+    def test_plays_all_games(self):
+        results = BatchedCoordinator(
+            [RandomAgent(0), RandomAgent(1)], n_concurrent=8
+        ).play(10)
+        assert sorted(r.seed for r in results) == list(range(10))
+        assert all(len(r.scores) == 2 and r.n_moves > 0 for r in results)
+
+    @pytest.mark.unit
+    def test_shared_agent_gets_one_batch_per_step(self):
+        agent = CountingAgent(0)
+        BatchedCoordinator([agent, agent, agent], num_players=3, n_concurrent=6).play(6)
+        assert agent.batch_sizes[0] == 6
+
+    @pytest.mark.unit
+    def test_seeded_games_are_reproducible(self):
+        def play():
+            coordinator = BatchedCoordinator([RandomAgent(3)] * 2, n_concurrent=4)
+            return sorted(coordinator.play(4))
+
+        assert play() == play()
+
+    @pytest.mark.unit
+    def test_requires_agent_per_seat(self):
+        with pytest.raises(ValueError):
+            BatchedCoordinator([RandomAgent()], num_players=2)
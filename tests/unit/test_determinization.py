@@ -0,0 +1,44 @@
+import random
+import pytest
+from azul.game.determinization import (
+    DeterminizedBag,
+    Determinizer,
+    infer_bag_counts,
+)
+from azul.game.state_machine import AzulGame
+from azul.tile import TileType
+from tests.shared import game
+
+
+class TestDeterminizer:
+    @pytest.mark.unit
+    def test_infers_actual_bag_counts(self, game: AzulGame):
+        counts = infer_bag_counts(game)
+        for tile_type in TileType:
+            assert counts[tile_type] == game.bag.count(tile_type)
+
+    @pytest.mark.unit
+    def test_counts_after_a_move(self, game: AzulGame):
+        tile_type = game.factories[0][0].type
+        game.player_take_from_factory(0, tile_type, 0)
+        counts = infer_bag_counts(game)
+        assert sum(counts.values()) == len(game.bag)
+
+    @pytest.mark.unit
+    def test_sample_is_consistent(self, game: AzulGame):
+        det = Determinizer(game, random.Random(0))
+        order = det.sample()
+        assert len(order) == len(game.bag)
+        for tile_type in TileType:
+            assert order.count(tile_type) == det.bag_counts[tile_type]
+
+    @pytest.mark.unit
+    def test_determinize_leaves_original_untouched(self, game: AzulGame):
+        original = [t.type for t in game.bag._tiles]
+        det = Determinizer(game, random.Random(0))
+        clone = det.determinize(game)
+        assert isinstance(clone.bag, DeterminizedBag)
+        assert [t.type for t in game.bag._tiles] == original
+        drawn = clone.bag.pop_random(4)
+        assert len(drawn) == 4
+        assert len(clone.bag) == len(game.bag) - 4
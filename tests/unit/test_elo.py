@@ -0,0 +1,44 @@
+import pytest
+from azul.tournament import SPRT, MatchStats, fit_ratings
+from azul.tournament.elo import elo_to_score, score_to_elo
+
+
+def record(wins: int, draws: int, losses: int) -> MatchStats:
+    stats = MatchStats()
+    for outcome, n in ((1, wins), (0.5, draws), (0, losses)):
+        for _ in range(n):
+            stats.add(outcome)
+    return stats
+
+
+class TestElo:
+    @pytest.mark.unit
+    def test_score_elo_roundtrip(self):
+        assert score_to_elo(0.5) == 0
+        assert score_to_elo(elo_to_score(100)) == pytest.approx(100)
+
+    @pytest.mark.unit
+    def test_interval_contains_estimate(self):
+        stats = record(60, 10, 30)
+        low, high = stats.elo_interval()
+        assert low < stats.elo() < high
+        assert stats.elo() > 0
+
+    @pytest.mark.unit
+    def test_sprt_decisions(self):
+        sprt = SPRT(elo0=0, elo1=50)
+        assert sprt.decide(record(1, 0, 0)) is None
+        assert sprt.decide(record(300, 0, 100)) == "H1"
+        assert sprt.decide(record(100, 0, 300)) == "H0"
+        assert sprt.decide(record(0, 0, 50)) == "H0"
+
+    @pytest.mark.unit
+    def test_fit_ratings_orders_agents(self):
+        results = {
+            ("a", "b"): record(70, 0, 30),
+            ("a", "c"): record(90, 0, 10),
+            ("b", "c"): record(70, 0, 30),
+        }
+        ratings = fit_ratings(["a", "b", "c"], results)
+        assert ratings["a"] == 0
+        assert ratings["a"] > ratings["b"] > ratings["c"]
@@ -0,0 +1,120 @@
+import sys
+import pytest
+from azul.agents import BatchedCoordinator, make_agent
+from azul.engine import EngineClient, EngineSession, ExternalAgent
+from azul.game.actions import action_to_index, legal_actions
+from azul.game.state_machine import AzulGame
+from azul.perft.perft import opening
+
+ENGINE = [sys.executable, "-m", "azul.engine.cli", "--agent", "greedy"]
+
+
+def legal_indices(game: AzulGame) -> set[int]:
+    return {action_to_index(a) for a in legal_actions(game)}
+
+
+class TestEngineSession:
+    @pytest.mark.unit
+    def test_handshake(self):
+        session = EngineSession(make_agent("random", 0), "random")
+        assert session.handle(["azul", "isready"]) == [
+            "id name random",
+            "azulok",
+            "readyok",
+        ]
+
+    @pytest.mark.unit
+    def test_pipelined_requests_keep_order_and_tags(self):
+        games = [opening(2, seed) for seed in range(5)] + [opening(3, 9)]
+        session = EngineSession(make_agent("greedy", 0))
+        replies = session.handle(
+            [f"go id r{i} position {g.to_bytes().hex()}" for i, g in enumerate(games)]
+        )
+        assert len(replies) == len(games)
+        for i, (reply, game) in enumerate(zip(replies, games)):
+            kind, _, tag, index = reply.split()
+            assert (kind, tag) == ("bestmove", f"r{i}")
+            assert int(index) in legal_indices(game)
+
+    @pytest.mark.unit
+    def test_position_then_go(self):
+        game = opening(2, 1)
+        session = EngineSession(make_agent("oneply", 0))
+        replies = session.handle([f"position {game.to_bytes().hex()}", "go", "go"])
+        assert [r.split()[0] for r in replies] == ["bestmove", "bestmove"]
+        assert int(replies[0].split()[1]) in legal_indices(game)
+
+    @pytest.mark.unit
+    def test_search_limits(self):
+        game = opening(2, 2)
+        session = EngineSession(make_agent("expectimax", 0))
+        replies = session.handle(
+            [f"go id 7 position {game.to_bytes().hex()} movetime 5000 nodes 50"]
+        )
+        info, bestmove = replies
+        fields = info.split()
+        assert fields[:3] == ["info", "id", "7"]
+        assert int(fields[fields.index("nodes") + 1]) == 50
+        assert int(bestmove.split()[-1]) in legal_indices(game)
+
+    @pytest.mark.unit
+    def test_mcts_honours_search_limits(self):
+        game = opening(2, 3)
+        session = EngineSession(make_agent("mcts", 0))
+        replies = session.handle(
+            [f"go id 4 position {game.to_bytes().hex()} movetime 5000 nodes 20"]
+        )
+        info, bestmove = replies
+        fields = info.split()
+        assert fields[:3] == ["info", "id", "4"]
+        assert int(fields[fields.index("nodes") + 1]) == 20
+        assert int(fields[fields.index("depth") + 1]) >= 1
+        assert int(bestmove.split()[-1]) in legal_indices(game)
+        session.handle([f"go position {game.to_bytes().hex()}"])
+        assert session.agent.last_result.nodes == session.agent.n_simulations
+
+    @pytest.mark.unit
+    def test_search_limits_do_not_persist(self):
+        game = opening(2, 2)
+        agent = make_agent("expectimax", 0)
+        budget = agent.time_budget
+        session = EngineSession(agent)
+        session.handle([f"go position {game.to_bytes().hex()} movetime 1 nodes 5"])
+        session.handle([f"go position {game.to_bytes().hex()}"])
+        assert agent.time_budget == budget
+        assert agent.max_nodes is None
+
+    @pytest.mark.unit
+    def test_errors(self):
+        session = EngineSession(make_agent("random", 0))
+        replies = session.handle(
+            ["go id 1", "go id 2 position zz", "go id 3 depth 4", "jump", "quit", "go"]
+        )
+        assert replies[0] == "error id 1 no position set"
+        assert replies[1].startswith("error id 2 bad position")
+        assert replies[2].startswith("error id 3 unknown go option")
+        assert replies[3].startswith("error unknown command")
+        # Nothing after quit is answered
+        assert len(replies) == 4 and session.finished
+
+
+class TestEngineClient:
+    @pytest.mark.unit
+    def test_batch_over_pipes(self):
+        games = [opening(2, seed) for seed in range(50)]
+        with EngineClient(ENGINE) as client:
+            assert client.name == "greedy"
+            moves = client.bestmoves(games)
+        assert all(m in legal_indices(g) for m, g in zip(moves, games))
+
+    @pytest.mark.unit
+    def test_external_agent_in_coordinator(self):
+        agent = ExternalAgent(ENGINE)
+        try:
+            results = BatchedCoordinator(
+                [agent, make_agent("random", 0)], n_concurrent=8
+            ).play(8)
+        finally:
+            agent.close()
+        assert len(results) == 8
+        assert sum(r.scores[0] > r.scores[1] for r in results) >= 6
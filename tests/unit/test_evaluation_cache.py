@@ -0,0 +1,79 @@
+import copy
+import sqlite3
+import pytest
+from azul.cache import EvaluationCache
+from azul.game.actions import apply_action, legal_actions
+from azul.game.state_machine import AzulGame
+from tests.shared import game
+
+
+class TestEvaluationCache:
+    @pytest.mark.unit
+    def test_put_and_get(self, game: AzulGame):
+        action = legal_actions(game)[0]
+        with EvaluationCache() as cache:
+            assert cache.get(game) is None
+            cache.put(game, 1.5, action, depth=2)
+            assert cache.get(game) == (1.5, action, 2)
+
+    @pytest.mark.unit
+    def test_symmetric_positions_share_entries(self, game: AzulGame):
+        action = legal_actions(game)[0]
+        swapped = copy.deepcopy(game)
+        swapped.factories.reverse()
+        with EvaluationCache() as cache:
+            cache.put(game, 3.0, action)
+            hit = cache.get(swapped)
+            assert hit.value == 3.0
+            # The mapped move takes the same tiles in the swapped position
+            assert hit.best_action.tile_type == action.tile_type
+            assert sorted(
+                t.type.value for t in swapped.factories[hit.best_action.source]
+            ) == sorted(t.type.value for t in game.factories[action.source])
+
+    @pytest.mark.unit
+    def test_persists_across_instances(self, game: AzulGame, tmp_path):
+        path = str(tmp_path / "eval.sqlite")
+        with EvaluationCache(path) as cache:
+            cache.put(game, 0.25)
+        with EvaluationCache(path) as cache:
+            assert cache.get(game).value == 0.25
+
+    @pytest.mark.unit
+    def test_lookups_do_not_lock_other_writers(self, game: AzulGame, tmp_path):
+        path = str(tmp_path / "eval.sqlite")
+        with EvaluationCache(path) as cache:
+            cache.put(game, 0.5)
+            cache.flush()
+            assert cache.get(game).value == 0.5
+            other = sqlite3.connect(path, timeout=0)
+            other.execute("UPDATE evaluations SET value = 1.0")
+            other.commit()
+            # Buffered puts do not hold the write lock either
+            child = copy.deepcopy(game)
+            apply_action(child, legal_actions(child)[0])
+            cache.put(child, 2.0)
+            assert cache.get(child).value == 2.0
+            other.execute("UPDATE evaluations SET value = 3.0")
+            other.commit()
+            other.close()
+
+    @pytest.mark.unit
+    def test_shallower_result_does_not_replace_deeper(self, game: AzulGame):
+        with EvaluationCache() as cache:
+            cache.put(game, 1.0, depth=3)
+            cache.put(game, 2.0, depth=1)
+            assert cache.get(game).value == 1.0
+            cache.put(game, 4.0, depth=3)
+            assert cache.get(game).value == 4.0
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, game: AzulGame):
+        with EvaluationCache(max_entries=3, commit_every=1) as cache:
+            cache.put(game, 0.0)
+            for action in legal_actions(game)[:4]:
+                child = copy.deepcopy(game)
+                apply_action(child, action)
+                cache.put(child, 1.0)
+            assert len(cache) <= 3
+            assert cache.get(game) is None
@@ -0,0 +1,78 @@
+import random
+import pytest
+from azul.game.actions import advance, apply_action, is_game_over, legal_actions
+from azul.game.state_machine import AzulGame
+from azul.search import ExpectimaxAgent, evaluate
+from tests.shared import game, random_moves
+
+
+def end_of_round(seed: int) -> AzulGame:
+    """A position with one color in one source left, so every move ends the round"""
+    game = AzulGame(num_players=2, seed=seed, verbose=False)
+    for _ in random_moves(game, seed):
+        offers = {(a.source, a.tile_type) for a in legal_actions(game)}
+        if len(offers) == 1:
+            return game
+    raise AssertionError("game ended without a single-offer position")
+
+
+class TestExpectimaxAgent:
+    @pytest.mark.unit
+    def test_returns_legal_move_within_budget(self, game: AzulGame):
+        agent = ExpectimaxAgent(time_budget=0.05)
+        result = agent.search(game)
+        assert result.action in legal_actions(game)
+        assert result.elapsed < 0.05 + 0.05
+        assert result.nodes > 0 and result.nodes_per_second > 0
+        assert agent.last_result is result
+
+    @pytest.mark.unit
+    def test_tiny_budget_still_moves(self, game: AzulGame):
+        result = ExpectimaxAgent(time_budget=0.0).search(game)
+        assert result.action in legal_actions(game)
+        assert result.depth == 0
+
+    @pytest.mark.unit
+    def test_deepens_with_more_time(self, game: AzulGame):
+        agent = ExpectimaxAgent(time_budget=60, max_depth=2, width=3)
+        result = agent.search(game)
+        assert result.depth == 2
+        shallow = ExpectimaxAgent(time_budget=60, max_depth=1).search(game)
+        assert shallow.nodes < result.nodes
+
+    @pytest.mark.unit
+    def test_does_not_change_the_game(self, game: AzulGame):
+        before = game.to_bytes()
+        ExpectimaxAgent(time_budget=0.05).search(game)
+        assert game.to_bytes() == before
+
+    @pytest.mark.unit
+    def test_searches_through_round_boundary(self):
+        game = end_of_round(seed=4)
+        agent = ExpectimaxAgent(time_budget=60, max_depth=2, width=2, chance_samples=2)
+        result = agent.search(game)
+        assert result.depth == 2
+        # Each root move ends the round: its chance node draws two refills
+        # and searches the opening move of each
+        n_root = len(legal_actions(game))
+        assert result.nodes >= n_root * (1 + 2 * 2)
+
+    @pytest.mark.unit
+    def test_evaluation_is_relative(self, game: AzulGame):
+        game.players[0].score = 10
+        assert evaluate(game) == [10.0, -10.0]
+
+    @pytest.mark.unit
+    def test_beats_random_play(self):
+        agent = ExpectimaxAgent(time_budget=0.01, width=4, chance_samples=1)
+        rng = random.Random(0)
+        game = AzulGame(num_players=2, seed=0, verbose=False)
+        advance(game)
+        while not is_game_over(game):
+            if game.current_player == 0:
+                action = agent.choose(game)
+            else:
+                action = rng.choice(legal_actions(game))
+            apply_action(game, action)
+            advance(game)
+        assert game.players[0].score > game.players[1].score
@@ -0,0 +1,66 @@
+import copy
+import pytest
+from azul.game.state_machine import AzulGame
+from azul.tile import Tile, TileType
+from tests.shared import game, random_moves
+
+
+def positions(seed: int, n_games: int = 3):
+    """Every position of a few random games"""
+    for i in range(n_games):
+        game = AzulGame(num_players=2, seed=seed + i, verbose=False)
+        for _ in random_moves(game, seed + i):
+            yield game
+
+
+class TestBoardFeatures:
+    @pytest.mark.unit
+    def test_accepts_matches_rules(self):
+        for game in positions(seed=0):
+            for player in game.players:
+                for line in range(5):
+                    for tile_type in TileType:
+                        expected = not player.wall.has_tile_type_in_row(
+                            line, tile_type
+                        ) and player.pattern_lines[line].can_add_tile_type(tile_type)
+                        assert player.features.accepts(line, tile_type) == expected
+
+    @pytest.mark.unit
+    def test_round_points_match_wall_tiling(self):
+        for game in positions(seed=1):
+            predicted = [p.features.round_points() for p in game.players]
+            tiled = copy.deepcopy(game)
+            tiled.on_enter_wall_tiling()
+            for before, after, points in zip(game.players, tiled.players, predicted):
+                assert after.score == max(0, before.score + points)
+
+    @pytest.mark.unit
+    def test_wall_features_cached_until_placement(self, game: AzulGame):
+        features = game.players[0].features
+        points = features.cell_points()
+        assert features.cell_points() is points
+        assert points[2][2] == 1
+        game.players[0].wall.place_tile(2, Tile(TileType.BLUE, 0))
+        assert features.cell_points() is not points
+        assert features.cell_points()[2][3] == 2
+        assert TileType.BLUE in features.row_colors()[2]
+
+    @pytest.mark.unit
+    def test_tiles_needed(self, game: AzulGame):
+        wall = game.players[0].wall
+        wall.place_tile(0, Tile(TileType.BLUE, 0))
+        wall.place_tile(1, Tile(TileType.BLUE, 1))
+        needed = game.players[0].features.tiles_needed()
+        assert needed.rows == [4, 4, 5, 5, 5]
+        assert needed.columns == [4, 4, 5, 5, 5]
+        assert needed.colors[TileType.BLUE] == 3
+        assert needed.colors[TileType.RED] == 5
+
+    @pytest.mark.unit
+    def test_floor_penalty(self, game: AzulGame):
+        player = game.players[0]
+        for n in range(8):
+            assert player.features.floor_penalty() == (
+                player.floor_line.calculate_penalty()
+            )
+            player.floor_line.append(Tile(TileType.RED, 100 + n))
@@ -0,0 +1,114 @@
+import io
+import re
+import pytest
+from azul.game.actions import Action, advance, apply_action, legal_actions
+from azul.game.state_machine import AzulGame
+from tests.shared import random_moves
+
+
+def play(game: AzulGame, n_moves: int, seed: int = 0) -> list:
+    return [
+        (game.current_player, *action) for action in random_moves(game, seed, n_moves)
+    ]
+
+
+class TestFlightRecorder:
+    @pytest.mark.unit
+    def test_keeps_last_moves(self):
+        game = AzulGame(num_players=2, seed=0, verbose=False, history=8)
+        played = play(game, 30)
+        recorder = game.recorder
+        assert recorder.n_moves == 30
+        last = list(recorder.moves)[-8:]
+        assert [(m.player, m.source, m.tile_type, m.line) for m in last] == played[-8:]
+        assert [m.seq for m in last] == list(range(22, 30))
+        # Older moves are only kept back to the snapshot before the window
+        assert recorder.moves[0].seq == recorder.snapshots[0][0] <= 22
+
+    @pytest.mark.unit
+    def test_snapshots_cover_the_window(self):
+        game = AzulGame(num_players=3, seed=1, verbose=False, history=16)
+        play(game, 60)
+        recorder = game.recorder
+        oldest_snapshot = recorder.snapshots[0][0]
+        assert oldest_snapshot <= recorder.moves[0].seq
+        seq, data = recorder.snapshots[-1]
+        assert AzulGame.from_bytes(data).to_bytes() == data
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_moves", [10, 45, 90])
+    def test_window_replays_from_dump_snapshot(self, n_moves: int):
+        game = AzulGame(num_players=2, seed=4, verbose=False, history=12)
+        play(game, n_moves, seed=4)
+        recorder = game.recorder
+        match = re.search(r"Snapshot before move (\d+) \((\w+)\)", recorder.dump())
+        seq = int(match.group(1))
+        assert seq <= max(recorder.n_moves - recorder.capacity, 0)
+        snapshots = dict(recorder.snapshots)
+        replayed = AzulGame.from_bytes(bytes.fromhex(match.group(2)))
+        round_number = replayed.round_number
+        for move in recorder.moves:
+            if move.round_number != round_number:
+                # The refill is random, so a new round starts from its snapshot
+                replayed = AzulGame.from_bytes(snapshots[move.seq])
+                round_number = move.round_number
+            elif move.seq in snapshots:
+                assert replayed.to_bytes() == snapshots[move.seq]
+            apply_action(replayed, Action(move.source, move.tile_type, move.line))
+            advance(replayed)
+        if game.round_number != round_number:
+            replayed = AzulGame.from_bytes(snapshots[recorder.n_moves])
+        assert replayed.to_bytes() == game.to_bytes()
+
+    @pytest.mark.unit
+    def test_dump_on_failure(self):
+        game = AzulGame(num_players=2, seed=2, verbose=False)
+        play(game, 5)
+        stream = io.StringIO()
+        with pytest.raises(ValueError):
+            with game.recorder.guard(stream):
+                game.player_take_from_factory(99, legal_actions(game)[0].tile_type, 0)
+        dump = stream.getvalue()
+        assert "FLIGHT RECORDER" in dump
+        assert "Current position:" in dump
+        # The failed move was recorded before it raised
+        assert f"#{game.recorder.n_moves - 1} " in dump
+        assert "factory 99" in dump
+
+    @pytest.mark.unit
+    def test_silent_without_failure(self):
+        game = AzulGame(num_players=2, seed=3, verbose=False)
+        stream = io.StringIO()
+        with game.recorder.guard(stream):
+            play(game, 10)
+        assert stream.getvalue() == ""
+
+    @pytest.mark.unit
+    def test_interrupts_are_not_dumped(self):
+        game = AzulGame(num_players=2, seed=3, verbose=False)
+        stream = io.StringIO()
+        with pytest.raises(KeyboardInterrupt):
+            with game.recorder.guard(stream):
+                raise KeyboardInterrupt
+        assert stream.getvalue() == ""
+
+    @pytest.mark.unit
+    def test_can_be_disabled(self):
+        game = AzulGame(num_players=2, seed=0, verbose=False, history=0)
+        play(game, 10)
+        assert game.recorder is None
+
+    @pytest.mark.unit
+    def test_debugger_dumps_failed_move(self, monkeypatch, capsys):
+        import azul_game_debugger
+
+        def fail(self, *args):
+            raise ValueError("tiles went missing")
+
+        monkeypatch.setattr(AzulGame, "take_tiles_from_factory", fail)
+        monkeypatch.setattr(AzulGame, "take_tiles_from_center", fail)
+        with pytest.raises(ValueError, match="tiles went missing"):
+            azul_game_debugger.run_debug_simulation()
+        dump = capsys.readouterr().err
+        assert "FLIGHT RECORDER: 1 of 1 move(s)" in dump
+        assert "#0 round 1 player 1" in dump
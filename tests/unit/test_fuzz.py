@@ -0,0 +1,39 @@
+import pytest
+from azul.fuzz import ReferenceEngine, fuzz, fuzz_game, replay
+from azul.fuzz.cli import main
+from azul.game.actions import FLOOR, Action
+
+
+class FloorPenaltyBug(ReferenceEngine):
+    """Forgets a player's floor tile whenever a move drops straight to the floor"""
+
+    def apply(self, action: Action) -> None:
+        player = self.game.players[self.game.current_player]
+        super().apply(action)
+        if action.line == FLOOR and len(player.floor_line) > 1:
+            player.floor_line._tiles.pop()
+
+
+class TestFuzz:
+    @pytest.mark.unit
+    def test_reference_matches_itself(self):
+        assert fuzz(ReferenceEngine, 3, num_players=3) == []
+
+    @pytest.mark.unit
+    def test_finds_and_shrinks_divergence(self):
+        divergences = fuzz(FloorPenaltyBug, 3)
+        assert divergences
+        for divergence in divergences:
+            original = fuzz_game(FloorPenaltyBug, 2, divergence.seed)
+            assert len(divergence.actions) <= len(original.actions)
+            assert "floor_lines" in divergence.fields
+            # The shrunk sequence reproduces on its own
+            again = replay(FloorPenaltyBug, 2, divergence.seed, divergence.actions)
+            assert again is not None and again.actions == divergence.actions
+
+    @pytest.mark.unit
+    def test_cli_exit_code(self, capsys):
+        with pytest.raises(SystemExit) as exit_info:
+            main(["--engine", "azul.fuzz:ReferenceEngine", "--games", "2"])
+        assert exit_info.value.code == 0
+        assert "0 diverging" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+import copy
+import numpy as np
+import pytest
+from azul.agents import BatchedCoordinator, OnePlyAgent, RandomAgent
+from azul.agents.heuristic import MoveFeatures
+from azul.encoding import ObservationEncoder
+from azul.game.actions import (
+    FLOOR,
+    action_to_index,
+    apply_action,
+    legal_actions,
+)
+from tests.shared import random_game
+
+
+class TestHeuristic:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_features_match_applied_moves(self, seed: int):
+        game = random_game(seed=seed, n_moves=25)
+        encoder = ObservationEncoder(2)
+        features = MoveFeatures(encoder.encode(game)[None])
+        placed = features.placed.reshape(-1)
+        floor_cost = features.floor_cost.reshape(-1)
+        player = game.current_player
+        for action in legal_actions(game):
+            after = copy.deepcopy(game)
+            apply_action(after, action)
+            if after.current_state != after.factory_offer:
+                continue  # wall tiling already cleared the boards
+            board, before = after.players[player], game.players[player]
+            index = action_to_index(action)
+            if action.line != FLOOR:
+                line = action.line
+                assert placed[index] == len(board.pattern_lines[line]) - len(
+                    before.pattern_lines[line]
+                )
+            penalty = (
+                board.floor_line.calculate_penalty()
+                - before.floor_line.calculate_penalty()
+            )
+            assert floor_cost[index] == penalty
+
+    @pytest.mark.unit
+    def test_one_ply_beats_random(self):
+        results = BatchedCoordinator(
+            [OnePlyAgent(seed=0), RandomAgent(0)], n_concurrent=10
+        ).play(10)
+        assert np.mean([r.scores[0] for r in results]) > np.mean(
+            [r.scores[1] for r in results]
+        )
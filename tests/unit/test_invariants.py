@@ -0,0 +1,78 @@
+import pytest
+from azul.game.actions import advance, apply_action, legal_actions
+from azul.game.invariants import (
+    InvariantChecker,
+    InvariantViolation,
+    check_invariants,
+)
+from azul.game.state_machine import AzulGame
+from azul.tile import Tile, TileType
+from tests.shared import game, random_game
+
+
+class TestCheckInvariants:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_full_games_pass_in_debug_mode(self, num_players: int):
+        game = random_game(num_players, seed=5, check_rate=1)
+        assert game.invariants.n_checks > 20
+
+    @pytest.mark.unit
+    def test_detects_lost_tile(self, game: AzulGame):
+        game.bag._tiles.pop()
+        with pytest.raises(InvariantViolation, match="tiles of every color"):
+            check_invariants(game)
+
+    @pytest.mark.unit
+    def test_detects_extra_tile(self, game: AzulGame):
+        game.discard_pile.append(Tile(TileType.RED, -1))
+        with pytest.raises(InvariantViolation, match="RED"):
+            check_invariants(game)
+
+    @pytest.mark.unit
+    def test_detects_duplicated_tile(self, game: AzulGame):
+        game.discard_pile.append(game.bag._tiles[0])
+        with pytest.raises(InvariantViolation, match="two places"):
+            check_invariants(game)
+
+    @pytest.mark.unit
+    def test_detects_missing_token(self, game: AzulGame):
+        game.board_center._tiles.clear()
+        with pytest.raises(InvariantViolation, match="first player tokens"):
+            check_invariants(game)
+
+    @pytest.mark.unit
+    def test_detects_mixed_pattern_line(self, game: AzulGame):
+        red = next(t for t in game.bag._tiles if t.type == TileType.RED)
+        blue = next(t for t in game.bag._tiles if t.type == TileType.BLUE)
+        game.bag._tiles.remove(red)
+        game.bag._tiles.remove(blue)
+        game.players[0].pattern_lines[2].extend([red, blue])
+        with pytest.raises(InvariantViolation, match="mixes"):
+            check_invariants(game)
+
+    @pytest.mark.unit
+    def test_move_raises_when_checking(self):
+        game = AzulGame(num_players=2, seed=0, verbose=False, check_rate=1)
+        advance(game)
+        game.bag._tiles.pop()
+        with pytest.raises(InvariantViolation):
+            apply_action(game, legal_actions(game)[0])
+
+
+class TestInvariantChecker:
+    @pytest.mark.unit
+    def test_sampled_rate(self, game: AzulGame):
+        checker = InvariantChecker(rate=0.1, seed=0)
+        for _ in range(5000):
+            checker.tick(game)
+        assert 350 < checker.n_checks < 650
+
+    @pytest.mark.unit
+    def test_disabled_by_default(self, game: AzulGame):
+        assert game.invariants is None
+
+    @pytest.mark.unit
+    def test_rejects_bad_rate(self):
+        with pytest.raises(ValueError):
+            InvariantChecker(rate=1.5)
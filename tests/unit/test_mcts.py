@@ -0,0 +1,99 @@
+import random
+import numpy as np
+import pytest
+from azul.agents import HeuristicEvaluator
+from azul.encoding import ObservationEncoder
+from azul.game.actions import advance, apply_action, is_game_over, legal_actions
+from azul.game.state_machine import AzulGame
+from azul.search import MCTSAgent
+from azul.search.mcts import Node
+from azul.search.expectimax import projected_score
+from tests.shared import game, random_game
+
+
+class RecordingEvaluator:
+    """Uniform priors and zero values, remembering every batch it sees"""
+
+    def __init__(self):
+        self.batches: list[int] = []
+
+    def __call__(self, obs, mask):
+        self.batches.append(len(obs))
+        priors = mask / mask.sum(axis=1, keepdims=True)
+        return np.zeros(len(obs)), priors
+
+
+class TestMCTSAgent:
+    @pytest.mark.unit
+    def test_returns_legal_move(self, game: AzulGame):
+        agent = MCTSAgent(n_simulations=64, batch_size=8, seed=0)
+        result = agent.search(game)
+        assert result.action in legal_actions(game)
+        assert result.n_leaves == 64
+        assert sum(result.visits.values()) == 63
+        assert agent.last_result is result
+
+    @pytest.mark.unit
+    def test_evaluates_leaves_in_batches(self, game: AzulGame):
+        evaluator = RecordingEvaluator()
+        result = MCTSAgent(evaluator, n_simulations=65, batch_size=16).search(game)
+        assert result.n_batches == 4
+        # The root alone, then one call per batch
+        assert evaluator.batches[0] == 1
+        assert len(evaluator.batches) == 1 + result.n_batches
+        assert max(evaluator.batches) > 1
+
+    @pytest.mark.unit
+    def test_virtual_loss_spreads_a_batch(self, game: AzulGame):
+        evaluator = RecordingEvaluator()
+        MCTSAgent(evaluator, n_simulations=17, batch_size=16).search(game)
+        # With equal priors and values every descent in the batch picks a
+        # different root move
+        assert evaluator.batches == [1, 16]
+
+    @pytest.mark.unit
+    def test_does_not_change_the_game(self, game: AzulGame):
+        before = game.to_bytes()
+        MCTSAgent(n_simulations=32, batch_size=8, seed=0).search(game)
+        assert game.to_bytes() == before
+
+    @pytest.mark.unit
+    def test_finished_games_use_the_evaluator_scale(self):
+        game = random_game(2, seed=0)
+        margin = game.players[0].score - game.players[1].score
+        leaf = Node(game, terminal=True)
+        evaluator = HeuristicEvaluator(2, value_scale=3.0)
+        MCTSAgent(evaluator)._evaluate([leaf], ObservationEncoder(2), evaluator)
+        assert leaf.value == pytest.approx([np.tanh(margin / 3), np.tanh(-margin / 3)])
+
+    @pytest.mark.unit
+    def test_heuristic_evaluator_matches_projection(self):
+        game = random_game(3, seed=1, n_moves=8)
+        encoder = ObservationEncoder(3)
+        obs = encoder.encode(game)[None]
+        mask = encoder.action_mask(game)[None]
+        evaluator = HeuristicEvaluator(3)
+        expected = [
+            projected_score(game.players[(game.current_player + seat) % 3])
+            for seat in range(3)
+        ]
+        assert evaluator.projected_scores(obs)[0] == pytest.approx(expected)
+        values, priors = evaluator(obs, mask)
+        assert values.shape == (1, 3)
+        assert priors.sum() == pytest.approx(1.0)
+        assert np.all(priors[~mask] == 0)
+
+    @pytest.mark.unit
+    def test_beats_random_play(self):
+        agent = MCTSAgent(n_simulations=32, batch_size=8, seed=0)
+        rng = random.Random(0)
+        game = AzulGame(num_players=2, seed=0, verbose=False)
+        advance(game)
+        while not is_game_over(game):
+            if game.current_player == 0:
+                action = agent.choose(game)
+            else:
+                action = rng.choice(legal_actions(game))
+            apply_action(game, action)
+            advance(game)
+        assert game.players[0].score > game.players[1].score
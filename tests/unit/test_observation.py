@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from azul.encoding import IncrementalEncoder, ObservationEncoder
+from azul.game.actions import (
+    action_to_index,
+    apply_action,
+    legal_actions,
+)
+from azul.game.state_machine import AzulGame
+from tests.shared import game, random_moves
+
+
+class TestObservationEncoder:
+    @pytest.mark.unit
+    def test_opening_observation(self, game: AzulGame):
+        encoder = ObservationEncoder(2)
+        obs = encoder.encode(game)
+        assert obs.shape == (encoder.size,)
+        # 20 factory tiles, the token, 80 tiles in the bag and the round number
+        assert obs.sum() == 20 + 1 + 80 + 1
+
+    @pytest.mark.unit
+    def test_mask_matches_legal_actions(self, game: AzulGame):
+        mask = ObservationEncoder(2).action_mask(game)
+        legal = {action_to_index(a) for a in legal_actions(game)}
+        assert set(mask.nonzero()[0]) == legal
+
+
+class TestIncrementalEncoder:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_matches_full_encoding(self, num_players: int):
+        full = ObservationEncoder(num_players)
+        incremental = IncrementalEncoder(num_players)
+        game = AzulGame(num_players=num_players, seed=num_players, verbose=False)
+        for _ in random_moves(game, num_players):
+            assert np.array_equal(incremental.encode(game), full.encode(game))
+        assert np.array_equal(incremental.encode(game), full.encode(game))
+
+    @pytest.mark.unit
+    def test_move_marks_only_touched_parts(self, game: AzulGame):
+        IncrementalEncoder(2).encode(game)
+        assert not game.changes.everything
+        action = next(a for a in legal_actions(game) if a.source == 3)
+        apply_action(game, action)
+        assert game.changes.factories == {3}
+        assert game.changes.center
+        assert game.changes.players == {0}
+
+    @pytest.mark.unit
+    def test_encoders_share_a_game(self, game: AzulGame):
+        first, second = IncrementalEncoder(2), IncrementalEncoder(2)
+        first.encode(game)
+        apply_action(game, legal_actions(game)[0])
+        assert np.array_equal(second.encode(game), first.encode(game))
+        assert np.array_equal(first.encode(game), ObservationEncoder(2).encode(game))
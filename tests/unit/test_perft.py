@@ -0,0 +1,37 @@
+import pytest
+from azul.perft import divide, opening, perft
+
+# Reference counts; engine changes must reproduce these exactly
+KNOWN_NODES = [
+    (2, 0, 1, 90),
+    (2, 0, 2, 7560),
+    (3, 0, 2, 13680),
+]
+
+
+class TestPerft:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players,seed,depth,nodes", KNOWN_NODES)
+    def test_known_node_counts(self, num_players, seed, depth, nodes):
+        assert perft(opening(num_players, seed), depth) == nodes
+
+    @pytest.mark.unit
+    def test_divide_sums_to_perft(self):
+        game = opening(2, 1)
+        counts = divide(game, 2)
+        assert sum(counts.values()) == perft(game, 2)
+
+    @pytest.mark.unit
+    def test_perft_leaves_game_untouched(self):
+        game = opening(2, 0)
+        before = [len(f) for f in game.factories]
+        perft(game, 2)
+        assert [len(f) for f in game.factories] == before
+
+    @pytest.mark.unit
+    def test_invalid_depth_raises(self):
+        game = opening(2, 0)
+        with pytest.raises(ValueError):
+            perft(game, -1)
+        with pytest.raises(ValueError):
+            divide(game, 0)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from azul.board_components import Wall
+from azul.scoring import end_game_bonus, placement_points, score_placements
+from azul.tile import Tile
+
+
+def make_wall(filled: np.ndarray) -> Wall:
+    wall = Wall()
+    for r in range(5):
+        for c in range(5):
+            if filled[r, c]:
+                wall.grid[r][c] = Tile(Wall.WALL_PATTERN[r][c], 5 * r + c)
+    return wall
+
+
+@pytest.fixture
+def walls() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.random((40, 5, 5)) < rng.random((40, 1, 1))
+
+
+class TestScoringKernel:
+    @pytest.mark.unit
+    def test_placement_points_match_wall(self, walls: np.ndarray):
+        points = placement_points(walls)
+        for b in range(len(walls)):
+            wall = make_wall(walls[b])
+            for r in range(5):
+                for c in range(5):
+                    assert points[b, r, c] == wall.calculate_points(r, c)
+
+    @pytest.mark.unit
+    def test_end_game_bonus_matches_wall(self, walls: np.ndarray):
+        bonus = end_game_bonus(walls)
+        assert bonus.shape == (len(walls),)
+        for b in range(len(walls)):
+            assert bonus[b] == make_wall(walls[b]).end_game_bonus()
+
+    @pytest.mark.unit
+    def test_score_placements_match_placing(self, walls: np.ndarray):
+        rng = np.random.default_rng(1)
+        rows = rng.integers(0, 5, (len(walls), 6))
+        cols = rng.integers(0, 5, (len(walls), 6))
+        scores = score_placements(walls, rows, cols)
+        assert scores.points.shape == scores.bonus.shape == rows.shape
+        for b in range(len(walls)):
+            for k in range(rows.shape[1]):
+                r, c = rows[b, k], cols[b, k]
+                if walls[b, r, c]:
+                    continue
+                wall = make_wall(walls[b])
+                assert scores.points[b, k] == wall.place_tile(
+                    r, Tile(Wall.WALL_PATTERN[r][c], 99)
+                )
+                assert scores.bonus[b, k] == wall.end_game_bonus()
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import pytest
+from azul.game.actions import is_game_over
+from azul.selfplay import (
+    Job,
+    JobQueue,
+    SelfPlayCoordinator,
+    evaluation_jobs,
+    iter_shards,
+    make_jobs,
+    run_job,
+    run_worker,
+    spawn_local_workers,
+    write_shard,
+)
+from azul.selfplay.shards import load_shard
+from azul.server.protocol import ProtocolError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestJobs:
+    @pytest.mark.unit
+    def test_make_jobs_cover_seed_range(self):
+        jobs = make_jobs(10, 4, ["random", "random"], seed=100)
+        assert [(j.seed, j.n_games) for j in jobs] == [(100, 4), (104, 4), (108, 2)]
+        assert [j.job_id for j in jobs] == [0, 1, 2]
+        assert Job.from_json(json.loads(json.dumps(jobs[1].to_json()))) == jobs[1]
+
+    @pytest.mark.unit
+    def test_evaluation_jobs_rotate_seats(self):
+        jobs = evaluation_jobs(["greedy", "random"], 4, 4)
+        assert [j.agents for j in jobs] == [["greedy", "random"], ["random", "greedy"]]
+        assert jobs[0].seed == jobs[1].seed
+        assert len({j.job_id for j in jobs}) == 2
+
+    @pytest.mark.unit
+    def test_lease_and_complete(self):
+        queue = JobQueue(make_jobs(4, 2, ["random"] * 2))
+        first, second = queue.lease("a"), queue.lease("b")
+        assert queue.lease("c") is None and not queue.finished
+        assert queue.complete(first.job_id)
+        assert not queue.complete(first.job_id)
+        assert queue.complete(second.job_id)
+        assert queue.finished and queue.done == {0, 1}
+
+    @pytest.mark.unit
+    def test_released_and_expired_leases_are_retried(self):
+        clock = FakeClock()
+        queue = JobQueue(make_jobs(4, 2, ["random"] * 2), lease_timeout=10, clock=clock)
+        job = queue.lease("a")
+        other = queue.lease("b")
+        assert queue.release("a") == [job.job_id]
+        # Retried jobs go first
+        assert queue.lease("c") == job
+        clock.now = 11
+        assert sorted(queue.expire()) == [job.job_id, other.job_id]
+        assert queue.attempts[job.job_id] == 2
+
+    @pytest.mark.unit
+    def test_gives_up_after_max_attempts(self):
+        queue = JobQueue(make_jobs(2, 2, ["random"] * 2), max_attempts=2)
+        for _ in range(2):
+            queue.lease("a")
+            queue.release("a")
+        assert queue.failed == {0: "worker disconnected"}
+        assert queue.finished and queue.lease("a") is None
+
+
+class TestShards:
+    @pytest.mark.unit
+    def test_round_trip_and_replay(self, tmp_path):
+        job = make_jobs(3, 3, ["greedy", "random"], seed=7)[0]
+        results = run_job(job)
+        path = write_shard(tmp_path, job, results)
+        shard = load_shard(path)
+        assert shard.job == job
+        assert list(shard.results()) == results
+        for i, result in enumerate(results):
+            game = shard.replay(i)
+            assert is_game_over(game)
+            assert [p.score for p in game.players] == result.scores
+        assert [s.job for s in iter_shards(tmp_path)] == [job]
+
+
+async def run_cluster(tmp_path, jobs, n_threads, **kwargs):
+    async with SelfPlayCoordinator(jobs, tmp_path, **kwargs) as coordinator:
+        host, port = coordinator.address
+
+        # A worker that leases a job and dies without a result
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b'{"op": "lease", "worker": "doomed"}\n')
+        await writer.drain()
+        leased = json.loads(await reader.readline())["result"]["job"]
+        writer.close()
+
+        done = await asyncio.gather(
+            *[asyncio.to_thread(run_worker, host, port) for _ in range(n_threads)]
+        )
+        await asyncio.wait_for(coordinator.wait_finished(), 10)
+    return coordinator, leased, done
+
+
+class TestSelfPlayCoordinator:
+    @pytest.mark.unit
+    def test_distributes_jobs_and_retries_lost_lease(self, tmp_path):
+        jobs = make_jobs(6, 2, ["random", "random"], seed=3)
+        coordinator, leased, done = asyncio.run(run_cluster(tmp_path, jobs, 2))
+        queue = coordinator.queue
+        assert queue.done == {0, 1, 2} and not queue.failed
+        assert sum(done) == 3
+        assert queue.attempts[leased["job_id"]] == 2
+        assert coordinator.n_games == 6
+        shards = list(iter_shards(tmp_path))
+        assert sorted(int(s) for shard in shards for s in shard.seeds) == list(
+            range(3, 9)
+        )
+
+    @pytest.mark.unit
+    def test_rejects_incomplete_results(self, tmp_path):
+        jobs = make_jobs(2, 2, ["random", "random"])
+        coordinator = SelfPlayCoordinator(jobs, tmp_path)
+        games = [r._asdict() for r in run_job(jobs[0])]
+
+        def submit(job_id, games):
+            request = {"op": "result", "job_id": job_id, "games": games}
+            asyncio.run(coordinator.dispatch(request))
+
+        with pytest.raises(ProtocolError, match="seeds"):
+            submit(0, games[:1])
+        with pytest.raises(ProtocolError, match="Unknown job"):
+            submit(5, games)
+        with pytest.raises(ProtocolError, match="Unknown job"):
+            submit(0.0, games)
+        for bad in [
+            {"scores": games[0]["scores"] + [0]},
+            {"scores": [1.5, 2]},
+            {"actions": None},
+            {"actions": ["1"]},
+            {"actions": [-1]},
+            {"rounds": "5"},
+        ]:
+            with pytest.raises(ProtocolError, match="Malformed"):
+                submit(0, [{**games[0], **bad}, games[1]])
+        with pytest.raises(ProtocolError, match="Malformed"):
+            submit(0, {"games": games})
+        assert not coordinator.queue.done and not list(iter_shards(tmp_path))
+        submit(0, games)
+        assert coordinator.queue.done == {0} and coordinator.n_games == 2
+
+    @pytest.mark.unit
+    def test_local_worker_processes(self, tmp_path):
+        async def run():
+            jobs = make_jobs(8, 2, ["random", "random"])
+            async with SelfPlayCoordinator(jobs, tmp_path) as coordinator:
+                host, port = coordinator.address
+                workers = spawn_local_workers(host, port, 2)
+                await asyncio.wait_for(coordinator.wait_finished(), 30)
+                for worker in workers:
+                    await asyncio.to_thread(worker.join, 10)
+            return coordinator, workers
+
+        coordinator, workers = asyncio.run(run())
+        assert coordinator.queue.done == {0, 1, 2, 3}
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert len(list(iter_shards(tmp_path))) == 4
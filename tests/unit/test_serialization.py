@@ -0,0 +1,71 @@
+import copy
+import pickle
+import random
+import pytest
+from azul.fuzz import snapshot_game
+from azul.game.actions import advance, is_game_over
+from azul.game.serialization import encoded_size
+from azul.game.state_machine import AzulGame
+from azul.game.symmetry import factory_key
+from tests.shared import random_game, random_moves
+
+
+class TestSerialization:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    @pytest.mark.parametrize("n_moves", [0, 7, 40, 500])
+    def test_roundtrip(self, num_players: int, n_moves: int):
+        game = random_game(num_players, seed=n_moves, n_moves=n_moves)
+        data = game.to_bytes()
+        assert len(data) == encoded_size(num_players)
+        restored = AzulGame.from_bytes(data)
+        assert snapshot_game(restored) == snapshot_game(game)
+        assert restored.to_bytes() == data
+
+    @pytest.mark.unit
+    def test_pickle_is_compact(self):
+        game = random_game(4, seed=0, n_moves=10)
+        payload = pickle.dumps(game)
+        assert len(payload) < 256
+        assert snapshot_game(pickle.loads(payload)) == snapshot_game(game)
+
+    @pytest.mark.unit
+    def test_restored_game_plays_on(self):
+        game = AzulGame.from_bytes(
+            random_game(2, seed=1, n_moves=15).to_bytes(), seed=0
+        )
+        for _ in random_moves(game):
+            pass
+        assert is_game_over(game)
+
+    @pytest.mark.unit
+    def test_rejects_inconsistent_counts(self):
+        data = bytearray(random_game(2, seed=0, n_moves=0).to_bytes())
+        bag_red = 6 + 2 * 9 + 5  # first bag count in the header
+        data[bag_red] += 1
+        with pytest.raises(ValueError):
+            AzulGame.from_bytes(bytes(data))
+
+    @pytest.mark.unit
+    def test_copies_share_refills_and_settings(self):
+        game = AzulGame(num_players=2, seed=3, verbose=False, check_rate=1.0)
+        advance(game)
+        ids = game.tile_generator.get_current_id_count()
+        copies = [copy.deepcopy(game) for _ in range(2)]
+        assert game.tile_generator.get_current_id_count() == ids
+        for clone in copies:
+            assert clone.invariants.rate == 1.0
+            assert clone.recorder.capacity == game.recorder.capacity
+            clone.fill_factories()
+        assert [factory_key(f) for f in copies[0].factories] == [
+            factory_key(f) for f in copies[1].factories
+        ]
+
+    @pytest.mark.unit
+    def test_copies_leave_global_random_alone(self):
+        game = random_game(2, seed=1, n_moves=5)
+        random.random()
+        state = random.getstate()
+        copy.deepcopy(game)
+        pickle.loads(pickle.dumps(game))
+        assert random.getstate() == state
@@ -0,0 +1,169 @@
+import asyncio
+import random
+import pytest
+from azul.game.actions import Action, CENTER, FLOOR, legal_actions
+from azul.server import GameClient, GameServer, ServerError
+from azul.server.protocol import action_from_json, action_to_json, decode
+from azul.server.server import Connection
+from azul.stream import replay
+from azul.tile import TileType
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=30))
+
+
+async def connect(server: GameServer) -> GameClient:
+    host, port = server._server.sockets[0].getsockname()[:2]
+    return await GameClient.connect(host, port)
+
+
+class TestGameServer:
+    @pytest.mark.unit
+    def test_play_a_full_game(self):
+        async def main():
+            async with GameServer() as server:
+                async with await connect(server) as client:
+                    game_id = await client.create(players=2, seed=3)
+                    rng = random.Random(0)
+                    state = await client.state(game_id)
+                    while state["state"] != "game_ended":
+                        moves = await client.legal(game_id)
+                        action = action_from_json(rng.choice(moves))
+                        state = await client.move(game_id, action)
+                    return state
+
+        state = run(main())
+        assert state["state"] == "game_ended"
+        assert any(all(row) for p in state["players"] for row in p["wall"])
+
+    @pytest.mark.unit
+    def test_subscribers_receive_updates(self):
+        async def main():
+            async with GameServer() as server:
+                async with await connect(server) as player, await connect(
+                    server
+                ) as spectator:
+                    game_id = await player.create(seed=0)
+                    rng = random.Random(1)
+                    for _ in range(5):
+                        action = action_from_json(
+                            rng.choice(await player.legal(game_id))
+                        )
+                        await player.move(game_id, action)
+                    # Joins mid-game from the keyframe
+                    messages = await spectator.subscribe(game_id)
+                    for _ in range(40):
+                        action = action_from_json(
+                            rng.choice(await player.legal(game_id))
+                        )
+                        state = await player.move(game_id, action)
+                        event = await spectator.events.get()
+                        assert event["game_id"] == game_id
+                        messages.append(event["delta"])
+                        assert replay(messages) == state
+                    return messages
+
+        messages = run(main())
+        assert messages[0]["type"] == "keyframe"
+        assert [m["seq"] for m in messages[1:]] == list(range(1, 46))
+
+    @pytest.mark.unit
+    def test_errors_are_reported(self):
+        async def main():
+            async with GameServer(max_games=1) as server:
+                async with await connect(server) as client:
+                    errors = []
+                    game_id = await client.create(seed=0)
+                    for request in [
+                        client.state("nope"),
+                        client.move(game_id, Action(CENTER, TileType.RED, FLOOR)),
+                        client.request("jump", game_id=game_id),
+                        client.request("move", game_id=game_id, move={"x": 1}),
+                        client.create(seed=1),
+                        client.create(players=5),
+                        client.create(players=2.0),
+                        client.create(seed=True),
+                    ]:
+                        with pytest.raises(ServerError) as e:
+                            await request
+                        errors.append(str(e.value))
+                    # The connection survives bad requests
+                    await client.state(game_id)
+                    return errors
+
+        errors = run(main())
+        assert "Unknown game" in errors[0]
+        assert "Illegal move" in errors[1]
+        assert "Unknown op" in errors[2]
+        assert "full" in errors[4]
+        assert "players" in errors[5]
+        assert "players" in errors[6]
+        assert "seed" in errors[7]
+
+    @pytest.mark.unit
+    def test_unexpected_errors_keep_the_connection(self, monkeypatch):
+        async def main():
+            async with GameServer() as server:
+                async with await connect(server) as client:
+                    game_id = await client.create(seed=0)
+
+                    def fail(*args):
+                        raise RuntimeError("boom")
+
+                    monkeypatch.setattr(server, "move", fail)
+                    with pytest.raises(ServerError) as e:
+                        await client.move(game_id, Action(0, TileType.RED, 0))
+                    await client.state(game_id)
+                    return str(e.value)
+
+        assert "boom" in run(main())
+
+    @pytest.mark.unit
+    def test_slow_spectator_is_told_it_was_dropped(self):
+        class StalledWriter:
+            def __init__(self):
+                self.written = []
+
+            def write(self, data):
+                self.written.append(data)
+
+            async def drain(self):
+                await asyncio.Event().wait()
+
+        async def main():
+            server = GameServer(max_queue=2)
+            game_id = server.create(2, 0)["game_id"]
+            spectator = Connection(StalledWriter(), server.max_queue)
+            server.dispatch(spectator, {"op": "subscribe", "game_id": game_id})
+            rng = random.Random(0)
+            game = server.games[game_id]
+            while game_id in spectator.subscriptions:
+                server.move(game_id, action_to_json(rng.choice(legal_actions(game))))
+            messages = [decode(spectator.queue.get_nowait()) for _ in range(3)]
+            spectator.task.cancel()
+            return messages
+
+        messages = run(main())
+        assert [m["event"] for m in messages] == ["update", "update", "error"]
+        assert "too far behind" in messages[-1]["error"]
+
+    @pytest.mark.unit
+    def test_many_concurrent_games(self):
+        async def play(server, seed):
+            async with await connect(server) as client:
+                game_id = await client.create(seed=seed)
+                rng = random.Random(seed)
+                for _ in range(10):
+                    action = action_from_json(rng.choice(await client.legal(game_id)))
+                    await client.move(game_id, action)
+                return game_id
+
+        async def main():
+            async with GameServer() as server:
+                ids = await asyncio.gather(*(play(server, s) for s in range(50)))
+                return ids, server
+
+        ids, server = run(main())
+        assert len(set(ids)) == 50
+        assert len(server.games) == 50
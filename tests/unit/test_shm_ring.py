@@ -0,0 +1,61 @@
+import multiprocessing
+import numpy as np
+import pytest
+from azul.encoding import ObservationEncoder
+from azul.game.state_machine import AzulGame
+from azul.parallel import RingSpec, SharedMemoryTransport, TransitionRing
+from tests.shared import game
+
+
+def _produce(spec: RingSpec, n: int) -> None:
+    ring = TransitionRing.attach(spec)
+    obs = np.zeros(spec.obs_size, dtype=np.float32)
+    mask = np.zeros(spec.n_actions, dtype=np.bool_)
+    for i in range(n):
+        obs[0] = i
+        while not ring.push(obs, mask, i, 1.0, i == n - 1):
+            pass
+    ring.close()
+
+
+class TestTransitionRing:
+    @pytest.mark.unit
+    def test_push_and_pop(self, game: AzulGame):
+        encoder = ObservationEncoder(2)
+        ring = TransitionRing.create(4, encoder.size, encoder.n_actions)
+        try:
+            obs, mask = encoder.encode(game), encoder.action_mask(game)
+            for i in range(4):
+                assert ring.push(obs, mask, i, 0.5, False)
+            assert not ring.push(obs, mask, 4, 0.5, False)
+            assert len(ring.pop_batch(3)) == 3
+            assert ring.push(obs, mask, 5, 0.5, True)
+            batch = ring.pop_batch()
+            assert list(batch["action"]) == [3, 5]
+            assert list(batch["done"]) == [False, True]
+            np.testing.assert_array_equal(batch["obs"][0], obs)
+            np.testing.assert_array_equal(batch["mask"][1], mask)
+            assert len(ring) == 0
+        finally:
+            ring.close()
+            ring.unlink()
+
+    @pytest.mark.unit
+    def test_workers_to_consumer(self):
+        n_workers, n = 3, 50
+        transport = SharedMemoryTransport(n_workers, 8, 4, 6)
+        try:
+            procs = [
+                multiprocessing.Process(target=_produce, args=(spec, n))
+                for spec in transport.specs
+            ]
+            for p in procs:
+                p.start()
+            received = []
+            while len(received) < n_workers * n:
+                received.extend(transport.drain()["action"])
+            for p in procs:
+                p.join()
+            assert sorted(received) == sorted(list(range(n)) * n_workers)
+        finally:
+            transport.close()
@@ -0,0 +1,18 @@
+import pytest
+from azul.sim import simulate
+from azul.sim.cli import main
+
+
+class TestSimulate:
+    @pytest.mark.unit
+    def test_chunks_cover_all_seeds(self):
+        chunks = list(simulate(5, num_players=2, seed=10, chunk_size=2))
+        assert [chunk.n_games for chunk in chunks] == [2, 2, 1]
+
+    @pytest.mark.unit
+    def test_cli_prints_only_aggregates(self, capsys):
+        main(["--games", "4", "--players", "3", "--seed", "1"])
+        out = capsys.readouterr().out
+        assert out.startswith("4 games, 3 players")
+        assert "games/s" in out
+        assert "Wall-tiling" not in out
@@ -0,0 +1,33 @@
+import pytest
+from azul.game.state_machine import AzulGame
+from azul.tile import SpecialTileType, TileType
+from tests.shared import game
+
+
+class TestAzulGame:
+    @pytest.mark.unit
+    def test_seed_fixes_factories(self):
+        def opening(seed):
+            game = AzulGame(seed=seed, verbose=False)
+            game.start_game()
+            return [sorted(t.type.value for t in f._tiles) for f in game.factories]
+
+        assert opening(7) == opening(7)
+
+    @pytest.mark.unit
+    def test_refill_when_bag_runs_out_between_factories(self, game: AzulGame):
+        game.discard_pile.extend(game.bag._tiles[:16])
+        game.bag._tiles = game.bag._tiles[16:24]
+        game.fill_factories()
+        assert all(len(f) == 4 for f in game.factories)
+        assert len(game.bag) + len(game.discard_pile) == 4
+
+    @pytest.mark.unit
+    def test_first_take_from_center_takes_token(self, game: AzulGame):
+        game.player_take_from_factory(0, game.factories[0][0].type, 0)
+        tile_type = next(t.type for t in game.board_center._tiles if t.type in TileType)
+        game.player_take_from_center(tile_type, -1)
+        assert game.first_player_token_taken
+        assert game.starting_player == 1
+        assert not game.board_center.contains_onetile()
+        assert any(t.type == SpecialTileType.TILE_1 for t in game.players[1].floor_line)
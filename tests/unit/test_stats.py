@@ -0,0 +1,51 @@
+import random
+import numpy as np
+import pytest
+from azul.agents import BatchedCoordinator, RandomAgent
+from azul.board_components import Wall
+from azul.stats import RunningStats, StatsCollector
+from azul.tile import Tile
+
+
+class TestRunningStats:
+    @pytest.mark.unit
+    def test_merge_matches_single_pass(self):
+        rng = random.Random(0)
+        values = [rng.gauss(10, 3) for _ in range(100)]
+        a, b, both = RunningStats(), RunningStats(), RunningStats()
+        for i, x in enumerate(values):
+            (a if i < 30 else b).add(x)
+            both.add(x)
+        a.merge(b)
+        assert a.n == both.n
+        assert a.mean == pytest.approx(np.mean(values))
+        assert a.variance == pytest.approx(np.var(values))
+        assert (a.min, a.max) == (min(values), max(values))
+
+
+class TestStatsCollector:
+    @pytest.mark.unit
+    def test_collects_and_merges(self):
+        coordinator = BatchedCoordinator([RandomAgent(0)] * 2, n_concurrent=4)
+        first, second = StatsCollector(2), StatsCollector(2)
+        scores = []
+        for i, (game, result) in enumerate(coordinator.iter_games(6)):
+            (first if i % 2 else second).add_game(game, result.n_moves)
+            scores.append(result.scores[0])
+        merged = first.merge(second)
+        assert merged.n_games == 6
+        assert merged.rounds_histogram.sum() == 6
+        assert merged.score_histogram.sum() == 12
+        assert merged.scores[0].mean == pytest.approx(np.mean(scores))
+        assert all(p.max <= 0 for p in merged.floor_penalties)
+
+    @pytest.mark.unit
+    def test_wall_bonus_breakdown(self):
+        wall = Wall()
+        for row in range(5):
+            for col in range(5):
+                if row == 0 or col == 0 or row == col:
+                    wall.grid[row][col] = Tile(Wall.WALL_PATTERN[row][col], 0)
+        assert (wall.complete_rows(), wall.complete_columns()) == (1, 1)
+        assert wall.complete_colors() == 1  # BLUE runs along the diagonal
+        assert wall.end_game_bonus() == 2 + 7 + 10
@@ -0,0 +1,72 @@
+import json
+import pytest
+from azul.game.actions import advance
+from azul.game.state_machine import AzulGame
+from azul.stream import StatePublisher, apply_delta, game_state, replay
+from tests.shared import random_moves
+
+
+def size(message) -> int:
+    return len(json.dumps(message, separators=(",", ":")))
+
+
+def publish_game(num_players: int, seed: int, keyframe_interval: int = 32):
+    """Yield (publisher, delta) for every move of a random game"""
+    game = AzulGame(num_players=num_players, seed=seed, verbose=False)
+    advance(game)
+    publisher = StatePublisher(game, keyframe_interval)
+    for action in random_moves(game, seed, play=False):
+        yield publisher, publisher.play(action)
+
+
+class TestStatePublisher:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    @pytest.mark.parametrize("seed", range(4))
+    def test_deltas_rebuild_every_state(self, num_players: int, seed: int):
+        state = None
+        for publisher, delta in publish_game(num_players, seed):
+            if state is None:
+                # The first delta is already part of what a joiner receives
+                state = replay(publisher.join())
+            else:
+                apply_delta(state, delta)
+            assert state == game_state(publisher.game)
+        assert state["state"] == "game_ended"
+
+    @pytest.mark.unit
+    def test_join_mid_game(self):
+        for publisher, delta in publish_game(2, seed=1, keyframe_interval=8):
+            messages = publisher.join()
+            assert messages[0]["type"] == "keyframe"
+            assert len(messages) <= 8
+            assert replay(messages) == game_state(publisher.game)
+
+    @pytest.mark.unit
+    def test_round_end_lists_wall_placements(self):
+        for publisher, delta in publish_game(2, seed=2):
+            if "round_end" in delta:
+                break
+        placements = delta["round_end"]["placements"]
+        assert placements
+        for seat, row, col, color, points in placements:
+            assert publisher.game.players[seat].wall.grid[row][col].type.name == color
+            assert points >= 1
+
+    @pytest.mark.unit
+    def test_deltas_are_smaller_than_snapshots(self):
+        moves = [
+            (size(delta), size(game_state(publisher.game)))
+            for publisher, delta in publish_game(4, seed=0)
+            if "round_end" not in delta
+        ]
+        assert sum(d for d, _ in moves) * 4 < sum(s for _, s in moves)
+
+    @pytest.mark.unit
+    def test_replay_detects_gaps(self):
+        for publisher, delta in publish_game(2, seed=0):
+            if delta["seq"] == 3:
+                break
+        keyframe, *deltas = publisher.join()
+        with pytest.raises(ValueError):
+            replay([keyframe, deltas[0], deltas[2]])
@@ -0,0 +1,39 @@
+import copy
+import pytest
+from azul.game.actions import legal_actions
+from azul.game.state_machine import AzulGame
+from azul.game.symmetry import canonicalize
+from tests.shared import game
+
+
+class TestCanonicalForm:
+    @pytest.mark.unit
+    def test_factory_order_is_ignored(self, game: AzulGame):
+        swapped = copy.deepcopy(game)
+        swapped.factories.reverse()
+        assert canonicalize(game) == canonicalize(swapped)
+
+    @pytest.mark.unit
+    def test_actions_map_between_equivalent_positions(self, game: AzulGame):
+        swapped = copy.deepcopy(game)
+        swapped.factories.reverse()
+        form, swapped_form = canonicalize(game), canonicalize(swapped)
+        canonical = {form.to_canonical(a) for a in legal_actions(game)}
+        assert canonical == {
+            swapped_form.to_canonical(a) for a in legal_actions(swapped)
+        }
+        for action in legal_actions(game):
+            assert form.from_canonical(form.to_canonical(action)) == action
+
+    @pytest.mark.unit
+    def test_player_rotation(self, game: AzulGame):
+        game.players[0].score = 5
+        rotated = copy.deepcopy(game)
+        rotated.players.reverse()
+        rotated.current_player = 1
+        rotated.starting_player = 1
+        assert canonicalize(game) == canonicalize(rotated)
+        assert canonicalize(game, rotate_players=False) != canonicalize(
+            rotated, rotate_players=False
+        )
+        assert canonicalize(rotated).from_canonical_player(0) == 1
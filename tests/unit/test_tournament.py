@@ -0,0 +1,42 @@
+import pytest
+from azul.tournament import SPRT, Tournament, play_pairing_batch, seat_lineups
+from azul.tournament.cli import parse_args
+
+
+class TestTournament:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_lineups_are_balanced(self, num_players: int):
+        lineups = seat_lineups(num_players)
+        for seat in range(num_players):
+            sides = [lineup[seat] for lineup in lineups]
+            assert sides.count(0) == sides.count(1)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_players", [2, 3, 4])
+    def test_lineups_are_unique(self, num_players: int):
+        lineups = seat_lineups(num_players)
+        assert len({tuple(lineup) for lineup in lineups}) == len(lineups)
+
+    @pytest.mark.unit
+    def test_duplicate_agents_rejected(self):
+        with pytest.raises(ValueError):
+            Tournament(["random", "random"])
+        with pytest.raises(SystemExit):
+            parse_args(["--agents", "random", "oneply", "random"])
+
+    @pytest.mark.unit
+    def test_batch_plays_every_lineup(self):
+        outcomes = play_pairing_batch(("random", "oneply"), 3, seed=0, n_games=2)
+        assert len(outcomes) == 2 * len(seat_lineups(3))
+        assert set(outcomes) <= {0.0, 0.5, 1.0}
+
+    @pytest.mark.unit
+    def test_sprt_stops_lopsided_pairing(self):
+        tournament = Tournament(
+            ["random", "oneply"], max_games=200, batch_size=10, sprt=SPRT(0, 50)
+        )
+        results = tournament.run(workers=2)
+        stats = results[("random", "oneply")]
+        assert tournament.decisions[("random", "oneply")] == "H0"
+        assert stats.n < 200